@@ -1,14 +1,18 @@
 import pathlib
 from datetime import datetime
-from typing import Optional
+from typing import Dict, Iterable, Optional, Union
+from py_apple_books.changes import ChangeSet, changes_since
 from py_apple_books.content import BookContent, Chapter
+from py_apple_books.db import AppleBooksDBClient, SnapshotDBClient, get_default_client, set_default_client
 from py_apple_books.exceptions import (
     AppleBooksError,
     BookNotDownloadedError,
     DRMProtectedError,
 )
-from py_apple_books.models import Book, Collection, Annotation, AnnotationColor
-from py_apple_books.models.manager import ModelIterable
+from py_apple_books.models import Book, Collection, Annotation, AnnotationColor, Q
+from py_apple_books.models.manager import ModelIterable, ModelManager
+from py_apple_books.models.pagination import Page
+from py_apple_books.search import AnnotationSearchIndex
 from py_apple_books.utils import APPLE_EPOCH_OFFSET, snap_window
 
 
@@ -25,7 +29,61 @@ _ANNOTATION_TYPE_READING_BOOKMARK = 3
 
 
 class PyAppleBooks:
-    """Facade class for accessing Apple Books data."""
+    """Facade class for accessing Apple Books data.
+
+    All models share one process-wide database client, which connects
+    lazily on the first query. Passing ``client`` installs it as that
+    shared client. Use :meth:`close` (or a ``with`` block) to release
+    the connection; a later query simply reopens it.
+
+    With ``snapshot=True`` both databases are copied into memory up
+    front and every query is served from that copy — a consistent,
+    lock-free view for batch jobs. Call :meth:`refresh` to re-copy.
+
+    ``cache=True`` turns on the shared query result cache (see
+    :meth:`QueryCompiler.enable_cache
+    <py_apple_books.db.query.QueryCompiler.enable_cache>`): repeated
+    calls are answered from memory until either database changes.
+
+    ``search_index`` (``True`` for the default location, a path, or an
+    :class:`~py_apple_books.search.AnnotationSearchIndex`) answers the
+    annotation text searches from a sidecar FTS5 index instead of
+    ``LIKE`` scans: tokenized, case- and accent-insensitive, ranked by
+    relevance.
+    """
+
+    def __init__(self, client: Optional[AppleBooksDBClient] = None, snapshot: bool = False,
+                 cache: bool = False,
+                 search_index: Union[AnnotationSearchIndex, str, pathlib.Path, bool, None] = None):
+        if snapshot:
+            client = (client or get_default_client()).snapshot()
+        if client is not None:
+            set_default_client(client)
+        if cache and ModelManager.compiler.cache is None:
+            ModelManager.compiler.enable_cache()
+        if search_index is True:
+            search_index = AnnotationSearchIndex()
+        elif isinstance(search_index, (str, pathlib.Path)):
+            search_index = AnnotationSearchIndex(search_index)
+        self.search_index: Optional[AnnotationSearchIndex] = search_index or None
+
+    def refresh(self) -> None:
+        """Re-copy the in-memory snapshot; a no-op for live clients."""
+        client = get_default_client()
+        if isinstance(client, SnapshotDBClient):
+            client.refresh()
+
+    def close(self) -> None:
+        """Close the shared database connection (and the search index, if any)."""
+        get_default_client().close()
+        if self.search_index is not None:
+            self.search_index.close()
+
+    def __enter__(self) -> "PyAppleBooks":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
 
     # -- collection actions --
     def list_collections(self, limit: int = None, order_by: str = None) -> ModelIterable:
@@ -49,6 +107,10 @@ class PyAppleBooks:
         """Get a book and its annotations."""
         return Book.manager.filter(id=book_id)[0]
 
+    def get_books_by_ids(self, book_ids: Iterable[int]) -> Dict[int, Book]:
+        """Get many books at once, keyed by id; unknown ids are left out."""
+        return Book.manager.in_bulk(book_ids)
+
     def get_book_by_title(self, title: str) -> ModelIterable:
         """Get a book by title."""
         return Book.manager.filter(title__contains=title)
@@ -64,22 +126,37 @@ class PyAppleBooks:
     # empty text, not user-created highlights or notes — callers that want
     # them specifically should use :meth:`get_current_reading_location`.
 
-    def list_annotations(self, limit: int = None, order_by: str = None) -> ModelIterable:
+    def list_annotations(self, limit: int = None, order_by: str = None,
+                         page_size: int = None, after: str = None) -> Union[ModelIterable, Page]:
         """List all user-created annotations (highlights and notes).
 
         Excludes Apple Books' auto-tracked reading-position bookmarks.
+
+        With ``page_size`` (or ``after``), returns one keyset-paginated
+        :class:`Page` instead, ordered by ``order_by`` (default
+        ``modification_date``); pass its ``next_token`` back as
+        ``after`` for the next page.
         """
-        return Annotation.manager.filter(
+        annotations = Annotation.manager.filter(
             type__ne=_ANNOTATION_TYPE_READING_BOOKMARK,
             limit=limit,
             order_by=order_by,
         )
+        if page_size is not None or after is not None:
+            # ``annotations`` already carries ``order_by``; paginate() pages in it.
+            return self._paginate(annotations, limit, None, page_size, after)
+        return annotations
 
     def get_annotation_by_id(self, annotation_id: str) -> Annotation:
         """Get an annotation by id (returns bookmarks too — use when the
         caller has already obtained the id from a specific API)."""
         return Annotation.manager.filter(id=annotation_id)[0]
 
+    def get_annotations_by_ids(self, annotation_ids: Iterable[int]) -> Dict[int, Annotation]:
+        """Get many annotations at once, keyed by id (bookmarks included,
+        as with :meth:`get_annotation_by_id`); unknown ids are left out."""
+        return Annotation.manager.in_bulk(annotation_ids)
+
     def get_annotations_by_color(self, color: str, limit: int = None, order_by: str = None) -> ModelIterable:
         """Get user highlights by color."""
         style = AnnotationColor[color.upper()].value
@@ -96,6 +173,8 @@ class PyAppleBooks:
     def search_annotation_by_highlighted_text(self, text: str,
                                               limit: int = None, order_by: str = None) -> ModelIterable:
         """Search user annotations by highlighted text."""
+        if self.search_index is not None:
+            return self.search_index.search(text, fields=["selected_text"], limit=limit, order_by=order_by)
         return Annotation.manager.filter(
             selected_text__contains=text,
             type__ne=_ANNOTATION_TYPE_READING_BOOKMARK,
@@ -105,6 +184,8 @@ class PyAppleBooks:
 
     def search_annotation_by_note(self, note: str, limit: int = None, order_by: str = None) -> ModelIterable:
         """Search user annotations by note."""
+        if self.search_index is not None:
+            return self.search_index.search(note, fields=["note"], limit=limit, order_by=order_by)
         return Annotation.manager.filter(
             note__contains=note,
             type__ne=_ANNOTATION_TYPE_READING_BOOKMARK,
@@ -112,36 +193,27 @@ class PyAppleBooks:
             order_by=order_by,
         )
 
-    def search_annotation_by_text(self, text: str, limit: int = None, order_by: str = None):
+    def search_annotation_by_text(self, text: str, limit: int = None, order_by: str = None) -> ModelIterable:
         """Search user annotations by any text that contains the given text.
 
-        The OR across ``selected_text`` / ``representative_text`` / ``note``
-        can't cleanly combine with an AND on ``type`` in the current
-        manager (``use_or`` applies to every WHERE clause uniformly),
-        so we over-fetch from the manager and strip bookmarks in
-        Python. The over-fetch factor compensates for the filter loss
-        when the caller supplies a limit.
-
-        Returns a list (not a :class:`ModelIterable`) to reflect the
-        post-processing step.
+        Matches ``selected_text``, ``representative_text`` or ``note``;
+        the OR group and the bookmark exclusion compile into one WHERE
+        clause, so ``limit`` is applied in SQL and is exact. With a
+        search index, matches are by word and ranked best-first.
         """
-        fetch_limit = (limit * 2) if limit else None
-        raw = list(Annotation.manager.filter(
-            selected_text__contains=text,
-            representative_text__contains=text,
-            note__contains=text,
-            use_or=True,
-            limit=fetch_limit,
+        if self.search_index is not None:
+            return self.search_index.search(text, limit=limit, order_by=order_by)
+        return Annotation.manager.filter(
+            Q(selected_text__contains=text) | Q(representative_text__contains=text) | Q(note__contains=text),
+            type__ne=_ANNOTATION_TYPE_READING_BOOKMARK,
+            limit=limit,
             order_by=order_by,
-        ))
-        filtered = [
-            a for a in raw
-            if getattr(a, "type", None) != _ANNOTATION_TYPE_READING_BOOKMARK
-        ]
-        return filtered[:limit] if limit else filtered
+        )
 
     def get_annotations_by_date_range(self, after: datetime = None, before: datetime = None,
-                                       limit: int = None, order_by: str = None) -> ModelIterable:
+                                       limit: int = None, order_by: str = None,
+                                       page_size: int = None,
+                                       page_after: str = None) -> Union[ModelIterable, Page]:
         """Get user annotations within a date range.
 
         Args:
@@ -149,18 +221,44 @@ class PyAppleBooks:
             before: Only include annotations created before this datetime.
             limit: Maximum number of results.
             order_by: Field to sort by (prefix with - for descending).
+            page_size: Return one keyset-paginated :class:`Page` of this
+                size instead (ordered by ``creation_date`` by default).
+            page_after: ``next_token`` of the previous page.
         """
         kwargs = {"type__ne": _ANNOTATION_TYPE_READING_BOOKMARK}
         if after:
             kwargs["creation_date__gte"] = after.timestamp() - APPLE_EPOCH_OFFSET
         if before:
             kwargs["creation_date__lte"] = before.timestamp() - APPLE_EPOCH_OFFSET
+        if page_size is not None or page_after is not None:
+            return self._paginate(Annotation.manager.filter(**kwargs), limit,
+                                  order_by or "creation_date", page_size, page_after)
         if limit:
             kwargs["limit"] = limit
         if order_by:
             kwargs["order_by"] = order_by
         return Annotation.manager.filter(**kwargs)
 
+    @staticmethod
+    def _paginate(results: ModelIterable, limit: Optional[int], order_by: Optional[str],
+                  page_size: Optional[int], after: Optional[str]) -> Page:
+        if limit:
+            raise ValueError("limit can't be combined with page_size/after; use page_size")
+        return results.paginate(order_by=order_by, page_size=page_size or 100, after=after)
+
+    # -- sync actions --
+    def changes_since(self, watermark: Union[str, datetime, None] = None,
+                      limit: int = None) -> ChangeSet:
+        """Annotations and books inserted, updated or soft-deleted after ``watermark``.
+
+        Returns a :class:`~py_apple_books.changes.ChangeSet` ordered by
+        modification time; store its ``watermark`` and pass it to the
+        next call. ``None`` returns everything (a full sync). Unlike the
+        other annotation queries, reading-position bookmarks and deleted
+        annotations are included — a mirror needs to see them change.
+        """
+        return changes_since(watermark, limit=limit)
+
     # -- reading progress actions --
     def get_books_in_progress(self, limit: int = None, order_by: str = None) -> ModelIterable:
         """Get books that are currently being read (progress > 0% and < 100%)."""
@@ -273,11 +371,7 @@ class PyAppleBooks:
         if bookmark is None or not bookmark.location or not bookmark.location.chapter_id:
             return None
         content = self.get_book_content(book_id)
-        target_id = bookmark.location.chapter_id
-        for ch in content.list_chapters():
-            if ch.id == target_id:
-                return ch
-        return None
+        return content.chapter_index().by_id.get(bookmark.location.chapter_id)
 
     def get_annotation_surrounding_text(
         self,
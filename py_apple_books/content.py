@@ -10,26 +10,35 @@ The placeholder check and DRM gates deliberately use only metadata
 operations (``stat``, ``du``, filesystem existence) so a "can I read this
 book?" check never causes an unexpected download.
 
-For the actual EPUB parsing and HTML-to-text extraction, this module uses
-:mod:`ebooklib` and :mod:`bs4` — well-tested third-party libraries that
-handle real-world EPUB quirks. A small stdlib fallback kicks in when an
+EPUB packages are read natively: Apple stores EPUBs unzipped, so we
+parse only ``META-INF/container.xml``, the OPF manifest and spine, and
+the NCX or nav document, and read individual chapter files from disk on
+demand. Packages the native reader can't make sense of fall back to
+:mod:`ebooklib`, which reads every manifest item into memory. When an
 EPUB's OPF omits the ``<spine toc=…>`` attribute (e.g. *The 4-Hour
-Workweek*); in that case ebooklib returns an empty ToC, so we detect the
-NCX by media-type and parse it ourselves.
+Workweek*) and has no nav document either, the ToC is empty, so we
+detect the NCX by media-type and parse it ourselves. HTML-to-text
+extraction is a single streaming pass over :mod:`html.parser` events,
+and its results are kept in a process-wide :class:`ChapterTextCache`.
 """
 
+import json
 import pathlib
+import posixpath
 import subprocess
+import threading
+import types
 import urllib.parse
 import xml.etree.ElementTree as ET
-from collections import Counter
+import zlib
+from collections import Counter, OrderedDict
 from dataclasses import dataclass
-from typing import Any, Iterable, List, Optional, Set, Tuple, Union
+from typing import Any, Dict, FrozenSet, Iterable, Iterator, List, Mapping, Optional, Set, Tuple, Union
 
 from ebooklib import epub
 
 from py_apple_books.exceptions import AppleBooksError
-from py_apple_books.utils import extract_chapter_text
+from py_apple_books.utils import extract_sections_text
 
 PathLike = Union[str, pathlib.Path]
 
@@ -145,6 +154,239 @@ class Chapter:
     depth: int
 
 
+@dataclass(frozen=True)
+class ChapterIndex:
+    """Immutable lookup tables over a book's chapters and package.
+
+    Built once per :class:`BookContent` (see
+    :meth:`BookContent.chapter_index`) so chapter lookups are
+    dictionary hits instead of a re-walk of the ToC and manifest.
+
+    :param chapters: The ToC in reading order, as from
+        :meth:`BookContent.list_chapters`.
+    :param by_id: :attr:`Chapter.id` → chapter.
+    :param by_order: :attr:`Chapter.order` → chapter.
+    :param by_href: Bundle-relative href → the chapters in that file, in
+        reading order. Several entries share a file in Project
+        Gutenberg-style books.
+    :param fragments: Bundle-relative href → the non-empty fragments of
+        the chapters in that file.
+    :param spine: Manifest item ids of the spine, in reading order.
+    :param spine_positions: Spine item id → 0-based spine position.
+    :param manifest: Manifest item id → bundle-relative href.
+    :param href_to_item_id: Bundle-relative href → manifest item id.
+    """
+
+    chapters: Tuple[Chapter, ...]
+    by_id: Mapping[str, Chapter]
+    by_order: Mapping[int, Chapter]
+    by_href: Mapping[str, Tuple[Chapter, ...]]
+    fragments: Mapping[str, FrozenSet[str]]
+    spine: Tuple[str, ...]
+    spine_positions: Mapping[str, int]
+    manifest: Mapping[str, str]
+    href_to_item_id: Mapping[str, str]
+
+    @classmethod
+    def build(
+        cls,
+        chapters: Iterable[Chapter],
+        spine: Iterable[str],
+        manifest: Mapping[str, str],
+    ) -> "ChapterIndex":
+        chapters = tuple(chapters)
+        spine = tuple(spine)
+        by_href: Dict[str, List[Chapter]] = {}
+        for ch in chapters:
+            by_href.setdefault(ch.href, []).append(ch)
+        by_id: Dict[str, Chapter] = {}
+        for ch in chapters:
+            by_id.setdefault(ch.id, ch)
+        return cls(
+            chapters=chapters,
+            by_id=types.MappingProxyType(by_id),
+            by_order=types.MappingProxyType({ch.order: ch for ch in chapters}),
+            by_href=types.MappingProxyType(
+                {href: tuple(group) for href, group in by_href.items()}
+            ),
+            fragments=types.MappingProxyType({
+                href: frozenset(ch.fragment for ch in group if ch.fragment)
+                for href, group in by_href.items()
+            }),
+            spine=spine,
+            spine_positions=types.MappingProxyType(
+                {item_id: pos for pos, item_id in reversed(list(enumerate(spine)))}
+            ),
+            manifest=types.MappingProxyType(dict(manifest)),
+            href_to_item_id=types.MappingProxyType(
+                {href: item_id for item_id, href in manifest.items()}
+            ),
+        )
+
+    def find(self, chapter_id: str) -> Optional[Chapter]:
+        """The ToC chapter with id ``chapter_id``, or whose 1-based
+        order is ``chapter_id``; the earlier one in reading order if
+        both match. None if neither does."""
+        by_id = self.by_id.get(chapter_id)
+        try:
+            order = int(chapter_id)
+        except ValueError:
+            order = None
+        # Only the canonical spelling of an order matches ("1", not "01").
+        by_order = (
+            self.by_order.get(order) if order is not None and str(order) == chapter_id else None
+        )
+        if by_id is None or by_order is None:
+            return by_id or by_order
+        return by_id if by_id.order <= by_order.order else by_order
+
+    def stop_anchors(self, chapter: Chapter) -> FrozenSet[str]:
+        """Fragments of the other chapters sharing ``chapter``'s file —
+        where its text ends."""
+        return self.fragments.get(chapter.href, frozenset()) - {chapter.fragment}
+
+    def spine_position(self, item_id: str) -> Optional[int]:
+        """0-based position of ``item_id`` in the spine, or None."""
+        return self.spine_positions.get(item_id)
+
+
+# ---------------------------------------------------------------------------
+# Chapter text cache
+# ---------------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class ChapterCacheStats:
+    """Point-in-time counters for a :class:`ChapterTextCache`."""
+
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    compressed_entries: int
+    size: int
+    max_size: int
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+def _text_size(sections: Mapping[str, str]) -> int:
+    return sum(len(fragment) + len(text) for fragment, text in sections.items())
+
+
+class ChapterTextCache:
+    """LRU cache of extracted chapter text, bounded by total characters.
+
+    Entries hold the split sections of one chapter file (fragment →
+    text, as from :meth:`BookContent.get_sections`) and are keyed by
+    ``(book path, href, mtime_ns, fragments)``: the fragments are the
+    ones the file was split at, and a file changed on disk is simply
+    never looked up under its old key again; the stale entry ages out.
+
+    With ``compress`` set, entries that drop out of the
+    ``hot_entries`` most recently used are stored zlib-compressed and
+    count their compressed size against ``max_size`` instead of their
+    length in characters. A hit on a compressed entry decompresses it
+    and makes it hot again.
+    """
+
+    def __init__(self, max_size: int = 16 * 1024 * 1024, compress: bool = False,
+                 hot_entries: int = 8) -> None:
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        if hot_entries < 1:
+            raise ValueError("hot_entries must be at least 1")
+        self.max_size = max_size
+        self.compress = compress
+        self.hot_entries = hot_entries
+        # Least recently used first; every cold entry is older than
+        # every hot one.
+        self._hot: "OrderedDict[Tuple, Tuple[Dict[str, str], int]]" = OrderedDict()
+        self._cold: "OrderedDict[Tuple, Tuple[Any, int]]" = OrderedDict()
+        self._size = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: Tuple) -> Optional[Dict[str, str]]:
+        """Cached sections for ``key``, or ``None`` on a miss."""
+        with self._lock:
+            if key in self._hot:
+                self._hot.move_to_end(key)
+                self._hits += 1
+                return self._hot[key][0]
+            entry = self._cold.pop(key, None)
+            if entry is None:
+                self._misses += 1
+                return None
+            self._hits += 1
+            value, size = entry
+            self._size -= size
+            if isinstance(value, bytes):
+                value = json.loads(zlib.decompress(value).decode("utf-8"))
+            self._insert(key, value)
+            return value
+
+    def put(self, key: Tuple, sections: Dict[str, str]) -> None:
+        size = _text_size(sections)
+        if size > self.max_size:
+            return
+        with self._lock:
+            for entries in (self._hot, self._cold):
+                previous = entries.pop(key, None)
+                if previous is not None:
+                    self._size -= previous[1]
+            self._insert(key, sections, size)
+
+    def _insert(self, key: Tuple, sections: Dict[str, str], size: Optional[int] = None) -> None:
+        if size is None:
+            size = _text_size(sections)
+        self._hot[key] = (sections, size)
+        self._size += size
+        while len(self._hot) > self.hot_entries:
+            cold_key, (value, cold_size) = self._hot.popitem(last=False)
+            if self.compress:
+                value = zlib.compress(json.dumps(value).encode("utf-8"))
+                self._size += len(value) - cold_size
+                cold_size = len(value)
+            self._cold[cold_key] = (value, cold_size)
+        while self._size > self.max_size:
+            entries = self._cold or self._hot
+            _, (_, evicted) = entries.popitem(last=False)
+            self._size -= evicted
+            self._evictions += 1
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        with self._lock:
+            self._hot.clear()
+            self._cold.clear()
+            self._size = 0
+
+    def stats(self) -> ChapterCacheStats:
+        with self._lock:
+            return ChapterCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                entries=len(self._hot) + len(self._cold),
+                compressed_entries=sum(
+                    isinstance(value, bytes) for value, _ in self._cold.values()
+                ),
+                size=self._size,
+                max_size=self.max_size,
+            )
+
+
+# The cache every BookContent uses unless given its own, so instances
+# created for the same book share extracted text.
+shared_text_cache = ChapterTextCache()
+
+
 # ---------------------------------------------------------------------------
 # BookContent
 # ---------------------------------------------------------------------------
@@ -163,12 +405,18 @@ class BookContent:
     also supported for testing.
 
     :param path: Absolute path to the book file or bundle directory.
+    :param text_cache: Where extracted chapter text is cached;
+        defaults to the process-wide :data:`shared_text_cache`.
     """
 
-    def __init__(self, path: PathLike) -> None:
+    def __init__(self, path: PathLike, text_cache: Optional[ChapterTextCache] = None) -> None:
         self.path = pathlib.Path(path)
         self._book: Optional[epub.EpubBook] = None
+        self._package: Optional[_Package] = None
         self._opf_dir_cache: Optional[pathlib.PurePosixPath] = None
+        self._index: Optional[ChapterIndex] = None
+        self._index_lock = threading.Lock()
+        self.text_cache = text_cache if text_cache is not None else shared_text_cache
 
     def __repr__(self) -> str:
         return f"BookContent(path={str(self.path)!r})"
@@ -210,34 +458,58 @@ class BookContent:
     def list_chapters(self) -> List[Chapter]:
         """Return the book's chapter list in reading order.
 
-        Uses :mod:`ebooklib` as the primary parser. For EPUBs where
-        ebooklib returns an empty ToC because the OPF omits the
-        ``<spine toc=…>`` attribute (a real-world quirk found in e.g.
-        *The 4-Hour Workweek*), falls back to locating the NCX via its
-        manifest ``media-type`` and parsing it directly. As a last
-        resort, emits one entry per spine item with a synthetic
+        The ToC comes from the EPUB3 nav document, else the NCX the
+        spine declares. For EPUBs where both are missing because the OPF
+        omits the ``<spine toc=…>`` attribute (a real-world quirk found
+        in e.g. *The 4-Hour Workweek*), falls back to locating the NCX
+        via its manifest ``media-type`` and parsing it directly. As a
+        last resort, emits one entry per spine item with a synthetic
         ``Section N`` title.
 
-        :raises AppleBooksError: if the book is not an EPUB or ebooklib
-            cannot read the package.
+        :raises AppleBooksError: if the book is not an EPUB or its
+            package cannot be read.
         """
-        if not self.is_epub:
-            raise AppleBooksError(
-                "list_chapters() is only supported for EPUB bundles; "
-                f"path {self.path!s} is not a .epub directory."
-            )
+        return list(self.chapter_index().chapters)
 
-        book = self._load_book()
+    def chapter_index(self) -> ChapterIndex:
+        """Return the book's :class:`ChapterIndex`, building it on first use.
 
-        chapters = self._chapters_from_ebooklib_toc(book)
-        if chapters:
-            return chapters
+        The index is computed once per instance; create a new
+        :class:`BookContent` to pick up changes to the bundle on disk.
+
+        :raises AppleBooksError: if the book is not an EPUB or its
+            package cannot be read.
+        """
+        if self._index is None:
+            if not self.is_epub:
+                raise AppleBooksError(
+                    "list_chapters() is only supported for EPUB bundles; "
+                    f"path {self.path!s} is not a .epub directory."
+                )
+            with self._index_lock:
+                if self._index is None:
+                    self._index = self._build_index()
+        return self._index
 
-        chapters = self._chapters_from_media_type_ncx()
-        if chapters:
-            return chapters
+    def _build_index(self) -> ChapterIndex:
+        package = self._load_package()
 
-        return self._chapters_from_spine(book)
+        # Manifest item id → bundle-relative href. Package hrefs are
+        # OPF-relative; we normalize to bundle-relative up front so
+        # matching works against whichever convention a ToC entry uses.
+        manifest: Dict[str, str] = {
+            item.id: self._to_bundle_relative(item.href)
+            for item in package.items
+            if item.href
+        }
+        spine = list(package.spine)
+
+        chapters = (
+            self._chapters_from_toc(package.toc, manifest)
+            or self._chapters_from_media_type_ncx(package)
+            or self._chapters_from_spine(spine, manifest)
+        )
+        return ChapterIndex.build(chapters, spine, manifest)
 
     # -- chapter reading ----------------------------------------------------
 
@@ -253,14 +525,18 @@ class BookContent:
            Gutenberg layout), so sibling sections don't leak into one
            another.
         2. **Any other spine entry** (sub-sections not in the ToC) —
-           falls through to ebooklib's manifest lookup directly and
-           returns the whole file's text. This handles EPUBs whose
+           falls through to the manifest lookup directly and returns
+           the whole file's text. This handles EPUBs whose
            spine is finer-grained than the ToC (e.g. Isaacson's *Elon
            Musk*, where each chapter has a ``chXX_sub01`` fine-section
            file that the ToC doesn't list).
 
-        HTML → plain text extraction is done with :mod:`bs4` using the
-        stdlib ``html.parser`` backend.
+        HTML → plain text extraction is a single streaming pass over the
+        stdlib :mod:`html.parser` that splits the whole file into its
+        ToC sections at once (see :meth:`get_sections`). The sections
+        go into :attr:`text_cache`, so reading a sibling section — or
+        the same chapter again, from any :class:`BookContent` for this
+        book — costs no further read or parse until the file changes.
 
         :param chapter_id: Manifest item id from :meth:`list_chapters`
             or from a :class:`~py_apple_books.models.location.Location`.
@@ -276,55 +552,102 @@ class BookContent:
             )
 
         wanted_id = str(chapter_id)
+        index = self.chapter_index()
 
-        # Path 1: match a ToC chapter (enables fragment scoping).
-        chapters = self.list_chapters()
-        match: Optional[Chapter] = None
-        for ch in chapters:
-            if ch.id == wanted_id or str(ch.order) == wanted_id:
-                match = ch
-                break
-
+        # Path 1: match a ToC chapter (enables fragment scoping). The
+        # whole file is split in one parse and its sibling sections are
+        # kept for later calls.
+        match = index.find(wanted_id)
         if match is not None:
-            html_bytes = self._read_chapter_bytes(match.href)
-            # Other navPoint fragments in the same file become stop
-            # anchors so sibling sections don't bleed into one another.
-            stop_anchors: Set[str] = {
-                ch.fragment
-                for ch in chapters
-                if ch.href == match.href
-                and ch.fragment
-                and ch.fragment != match.fragment
-            }
-            return extract_chapter_text(
-                html_bytes,
-                start_anchor=match.fragment or None,
-                stop_anchors=stop_anchors,
-            )
+            return self._file_sections(match.href)[match.fragment]
 
         # Path 2: fall back to raw spine — works for sub-sections that
-        # aren't in the ToC. ebooklib's manifest knows every spine item.
-        book = self._load_book()
-        item = book.get_item_with_id(wanted_id)
-        if item is None:
+        # aren't in the ToC. The manifest knows every spine item.
+        href = index.manifest.get(wanted_id)
+        if href is None:
             raise AppleBooksError(
                 f"No chapter or spine entry with id {chapter_id!r}. "
                 f"Use list_chapters() to see available ids."
             )
-        try:
-            html_bytes = item.get_content()
-        except Exception as e:
+        return self._file_sections(href, whole=True)[""]
+
+    def get_sections(self, href: str) -> Dict[str, str]:
+        """Return the text of every section of one XHTML file, from a
+        single parse.
+
+        The sections are the fragments the ToC points into in that
+        file, each running up to the next one — the same text
+        :meth:`get_chapter` returns for those chapters. The key ``""``
+        holds the whole file's text; it is present when a ToC entry
+        points at the file itself or the ToC doesn't point into the
+        file at all.
+
+        :param href: Bundle-relative path of the file, as in
+            :attr:`Chapter.href`. A ``#fragment`` suffix is ignored.
+        :return: Fragment → plain text, in no particular order.
+        :raises AppleBooksError: if the book is not an EPUB or ``href``
+            is not a file of its manifest.
+        """
+        href = href.partition("#")[0]
+        index = self.chapter_index()
+        if href not in index.href_to_item_id and href not in index.by_href:
             raise AppleBooksError(
-                f"Could not read spine entry {chapter_id!r}: {e}"
-            ) from e
-        return extract_chapter_text(
-            html_bytes,
-            start_anchor=None,
-            stop_anchors=set(),
-        )
+                f"No file {href!r} in the EPUB manifest. "
+                f"Use list_chapters() to see available hrefs."
+            )
+        return dict(self._file_sections(href))
+
+    def iter_chapters(self) -> Iterator[Tuple[Chapter, str]]:
+        """Yield each ToC chapter with its text, in reading order.
+
+        Each file is parsed once however many chapters it holds.
+
+        :raises AppleBooksError: if the book is not an EPUB or a
+            chapter file is missing.
+        """
+        for chapter in self.chapter_index().chapters:
+            yield chapter, self._file_sections(chapter.href)[chapter.fragment]
 
     # -- internal helpers ---------------------------------------------------
 
+    def _file_sections(self, href: str, whole: bool = False) -> Dict[str, str]:
+        """Fragment → text for every ToC section of ``href``, split in
+        one parse and cached. ``whole`` also asks for the ``""`` (whole
+        file) entry, which the ToC alone may not call for."""
+        index = self.chapter_index()
+        fragments = set(index.fragments.get(href, ()))
+        if whole or not fragments or any(not ch.fragment for ch in index.by_href.get(href, ())):
+            fragments.add("")
+        try:
+            mtime = (self.path / href).stat().st_mtime_ns
+        except OSError:
+            # Let the read below report the missing file.
+            mtime = None
+        # The split depends on which fragments the ToC names, so they
+        # are part of the key: another instance may see another ToC.
+        key = (str(self.path), href, mtime, frozenset(fragments))
+        sections = self.text_cache.get(key) if mtime is not None else None
+        if sections is None:
+            sections = extract_sections_text(self._read_chapter_bytes(href), fragments)
+            self.text_cache.put(key, sections)
+        return sections
+
+    def _load_package(self) -> "_Package":
+        """Lazily read and cache the package metadata.
+
+        Tries the native reader first; packages it can't parse are
+        handed to ebooklib.
+        """
+        if self._package is None:
+            try:
+                self._package = _Package.read(self.path)
+            except (OSError, ET.ParseError, KeyError, ValueError):
+                self._package = _Package.from_ebooklib(
+                    self._load_book(), _opf_dir_from_container(self.path)
+                )
+            self._opf_dir_cache = self._package.opf_dir
+        return self._package
+
     def _load_book(self) -> epub.EpubBook:
         """Lazily read and cache the EPUB via ebooklib."""
         if self._book is None:
@@ -339,7 +662,7 @@ class BookContent:
     def _opf_dir(self) -> pathlib.PurePosixPath:
         """Cached OPF directory relative to the EPUB bundle root.
 
-        ebooklib's :attr:`EpubItem.file_name` is OPF-relative, while we
+        Manifest hrefs are OPF-relative, while we
         want :attr:`Chapter.href` to be bundle-relative so callers can
         resolve it with ``content.path / chapter.href``. This helper
         gives us the prefix to prepend.
@@ -349,7 +672,7 @@ class BookContent:
         return self._opf_dir_cache
 
     def _to_bundle_relative(self, opf_relative: str) -> str:
-        """Convert an OPF-relative href (ebooklib convention) to a
+        """Convert an OPF-relative href (manifest convention) to a
         bundle-relative path rooted at :attr:`path`."""
         if not opf_relative:
             return opf_relative
@@ -359,48 +682,28 @@ class BookContent:
             return opf_relative
         return f"{opf_dir_str}/{opf_relative}"
 
-    def _to_opf_relative(self, bundle_relative: str) -> str:
-        """Inverse of :meth:`_to_bundle_relative` — strip the OPF-dir
-        prefix from a bundle-relative href so ebooklib's internal
-        lookups find it."""
-        if not bundle_relative:
-            return bundle_relative
-        opf_dir = self._opf_dir()
-        opf_dir_str = str(opf_dir)
-        if opf_dir_str in ("", "."):
-            return bundle_relative
-        prefix = f"{opf_dir_str}/"
-        if bundle_relative.startswith(prefix):
-            return bundle_relative[len(prefix):]
-        return bundle_relative
-
-    def _chapters_from_ebooklib_toc(self, book: epub.EpubBook) -> List[Chapter]:
-        """Flatten ebooklib's nested ToC into a list of :class:`Chapter`.
-
-        Handles EPUB3 nav documents and EPUB2 NCX transparently (that's
-        what we get ebooklib for). Returns an empty list if ebooklib
-        couldn't locate a ToC — the caller then tries the stdlib
-        fallback.
+    def _chapters_from_toc(
+        self, toc: List[Any], manifest: Mapping[str, str]
+    ) -> List[Chapter]:
+        """Flatten a nested ToC into a list of :class:`Chapter`.
+
+        ``toc`` uses ebooklib's shape — ``(Section, children)`` tuples
+        and :class:`epub.Link` leaves — whichever reader produced it,
+        so EPUB3 nav documents and EPUB2 NCX are handled alike. Returns
+        an empty list if the package has no ToC — the caller then tries
+        the media-type NCX fallback.
         """
-        toc = book.toc
         if not toc:
             return []
 
-        # Build a lookup from bundle-relative href to manifest item id
-        # for stable chapter ids. ebooklib stores file_name as
-        # OPF-relative; we normalize to bundle-relative up front so
-        # matching works against whichever convention a ToC entry uses.
-        href_to_item_id = {}
-        for item in book.get_items():
-            name = getattr(item, "file_name", None) or getattr(item, "get_name", lambda: "")()
-            if name:
-                href_to_item_id[self._to_bundle_relative(name)] = item.get_id()
+        # Bundle-relative href → manifest item id, for stable chapter ids.
+        href_to_item_id = {href: item_id for item_id, href in manifest.items()}
 
         chapters: List[Chapter] = []
         order = 0
 
-        # ebooklib sometimes emits duplicate links in the ToC (same href +
-        # fragment). Track what we've seen to keep the output tidy.
+        # ToCs sometimes repeat links (same href + fragment). Track what
+        # we've seen to keep the output tidy.
         seen: Set[Tuple[str, str]] = set()
 
         def walk(nodes: Iterable[Any], depth: int) -> None:
@@ -430,8 +733,8 @@ class BookContent:
             bare = urllib.parse.unquote(bare)
             fragment = urllib.parse.unquote(fragment)
 
-            # ToC hrefs are OPF-relative in ebooklib; normalize to
-            # bundle-relative so Chapter.href resolves against self.path.
+            # ToC hrefs are OPF-relative; normalize to bundle-relative so
+            # Chapter.href resolves against self.path.
             bundle_href = self._to_bundle_relative(bare)
 
             key = (bundle_href, fragment)
@@ -474,84 +777,60 @@ class BookContent:
             ]
         return chapters
 
-    def _chapters_from_media_type_ncx(self) -> List[Chapter]:
+    def _chapters_from_media_type_ncx(self, package: "_Package") -> List[Chapter]:
         """Override for EPUBs whose OPF doesn't declare ``<spine toc=…>``
-        (real example: *The 4-Hour Workweek*). ebooklib returns an empty
-        ToC for these, so we pick the NCX out of the manifest by
-        ``media-type`` — ebooklib already parsed the manifest, we just
-        ask for the items — and parse the NCX ourselves.
+        (real example: *The 4-Hour Workweek*) and have no nav document,
+        so the package ToC is empty. We pick the NCX out of the manifest
+        by ``media-type`` and parse it ourselves.
 
         Returns an empty list if no NCX is found, signaling the caller
         to try the spine-fallback path.
         """
-        book = self._load_book()
-        ncx_item = None
-        for item in book.get_items():
-            if getattr(item, "media_type", "") == "application/x-dtbncx+xml":
-                ncx_item = item
-                break
+        ncx_item = next(
+            (item for item in package.items if item.media_type == _MEDIA_TYPE_NCX),
+            None,
+        )
         if ncx_item is None:
             return []
 
-        try:
-            ncx_bytes = ncx_item.get_content()
-        except Exception:
-            return []
-
         # NCX content srcs resolve relative to the NCX file's location.
-        # file_name is OPF-relative, so prepend the OPF dir to get the
-        # bundle-relative directory of the NCX file.
+        # The manifest href is OPF-relative, so prepend the OPF dir to
+        # get the bundle-relative directory of the NCX file.
         ncx_bundle_path = pathlib.PurePosixPath(
-            self._to_bundle_relative(ncx_item.file_name)
+            self._to_bundle_relative(ncx_item.href)
         )
+        try:
+            ncx_bytes = (self.path / ncx_bundle_path).read_bytes()
+        except OSError:
+            return []
         return _parse_ncx_bytes(ncx_bytes, ncx_bundle_path.parent)
 
-    def _chapters_from_spine(self, book: epub.EpubBook) -> List[Chapter]:
+    def _chapters_from_spine(
+        self, spine: List[str], manifest: Mapping[str, str]
+    ) -> List[Chapter]:
         """Last-resort chapter list from the EPUB spine alone.
 
         Produces synthetic titles (``Section N``) since there's no
         navigation document to pull real titles from.
         """
-        chapters: List[Chapter] = []
-        for order, entry in enumerate(book.spine, start=1):
-            spine_id = entry[0] if isinstance(entry, tuple) else entry
-            item = book.get_item_with_id(spine_id)
-            href = self._to_bundle_relative(item.file_name) if item else ""
-            chapters.append(
-                Chapter(
-                    id=spine_id or str(order),
-                    title=f"Section {order}",
-                    href=href,
-                    fragment="",
-                    order=order,
-                    depth=0,
-                )
+        return [
+            Chapter(
+                id=spine_id or str(order),
+                title=f"Section {order}",
+                href=manifest.get(spine_id, ""),
+                fragment="",
+                order=order,
+                depth=0,
             )
-        return chapters
+            for order, spine_id in enumerate(spine, start=1)
+        ]
 
     def _read_chapter_bytes(self, href: str) -> bytes:
         """Return raw bytes for a chapter file, given a bundle-relative href.
 
-        ebooklib's ``get_item_with_href`` and ``EpubItem.file_name`` use
-        the OPF-relative convention, so we strip the OPF-dir prefix
-        before asking ebooklib. The disk fallback keeps the
-        bundle-relative form so ``self.path / href`` resolves correctly.
+        Reads just that file from the unzipped bundle; nothing else in
+        the package is loaded.
         """
-        book = self._load_book()
-        opf_relative = self._to_opf_relative(href)
-        item = book.get_item_with_href(opf_relative)
-        if item is None:
-            # ebooklib's lookup is exact-match; try a scan.
-            for candidate in book.get_items():
-                if candidate.file_name == opf_relative:
-                    item = candidate
-                    break
-        if item is not None:
-            try:
-                return item.get_content()
-            except Exception:
-                pass  # fall through to disk read
-
         abs_path = self.path / href
         if not abs_path.exists():
             raise AppleBooksError(
@@ -567,39 +846,60 @@ class BookContent:
 
 
 # ---------------------------------------------------------------------------
-# NCX override (ebooklib blind spot: OPF without <spine toc=…>)
+# Container and NCX parsing (stdlib)
 # ---------------------------------------------------------------------------
 
 
 _NS_CONTAINER = "urn:oasis:names:tc:opendocument:xmlns:container"
 _NS_NCX = "http://www.daisy.org/z3986/2005/ncx/"
+_NS_OPF = "http://www.idpf.org/2007/opf"
+_NS_OPS = "http://www.idpf.org/2007/ops"
+_MEDIA_TYPE_OPF = "application/oebps-package+xml"
+_MEDIA_TYPE_NCX = "application/x-dtbncx+xml"
+_MEDIA_TYPE_XHTML = "application/xhtml+xml"
 
 
-def _opf_dir_from_container(epub_root: pathlib.Path) -> pathlib.PurePosixPath:
-    """Return the OPF file's directory relative to the EPUB bundle root.
+def _opf_path_from_container(
+    epub_root: pathlib.Path,
+) -> Optional[pathlib.PurePosixPath]:
+    """Return the OPF file's path relative to the EPUB bundle root.
 
     Parses ``META-INF/container.xml`` and reads the ``<rootfile
-    full-path="…">`` attribute to locate the OPF, then returns its
-    parent directory as a :class:`pathlib.PurePosixPath`.
-
-    Used to normalize ebooklib's manifest item hrefs (which are
-    OPF-relative) to bundle-relative paths so :attr:`Chapter.href` and
-    the NCX fallback both speak the same convention — callers can
-    always do ``bundle_root / chapter.href``. Returns the empty
-    PurePosixPath (``PurePosixPath('.')``) when the OPF sits at the
-    bundle root, and falls back to empty on any parse error.
+    full-path="…">`` attribute, preferring the rootfile whose
+    media-type is the OPF package type. Returns None when the container
+    is missing, malformed or names no rootfile.
     """
     container = epub_root / "META-INF" / "container.xml"
     if not container.exists():
-        return pathlib.PurePosixPath()
+        return None
     try:
         root = ET.parse(container).getroot()
     except ET.ParseError:
-        return pathlib.PurePosixPath()
-    rootfile = root.find(f".//{{{_NS_CONTAINER}}}rootfile")
-    if rootfile is None or not rootfile.get("full-path"):
-        return pathlib.PurePosixPath()
-    return pathlib.PurePosixPath(rootfile.get("full-path")).parent
+        return None
+    rootfiles = [
+        el for el in root.iter(f"{{{_NS_CONTAINER}}}rootfile") if el.get("full-path")
+    ]
+    if not rootfiles:
+        return None
+    rootfile = next(
+        (el for el in rootfiles if el.get("media-type") == _MEDIA_TYPE_OPF),
+        rootfiles[0],
+    )
+    return pathlib.PurePosixPath(rootfile.get("full-path"))
+
+
+def _opf_dir_from_container(epub_root: pathlib.Path) -> pathlib.PurePosixPath:
+    """Return the OPF file's directory relative to the EPUB bundle root.
+
+    Used to normalize manifest item hrefs (which are OPF-relative) to
+    bundle-relative paths so :attr:`Chapter.href` and the NCX fallback
+    both speak the same convention — callers can always do
+    ``bundle_root / chapter.href``. Returns the empty PurePosixPath
+    (``PurePosixPath('.')``) when the OPF sits at the bundle root, and
+    falls back to empty on any parse error.
+    """
+    opf_path = _opf_path_from_container(epub_root)
+    return opf_path.parent if opf_path is not None else pathlib.PurePosixPath()
 
 
 def _parse_ncx_bytes(
@@ -607,13 +907,11 @@ def _parse_ncx_bytes(
 ) -> List[Chapter]:
     """Parse an NCX ``navMap`` into flattened :class:`Chapter` entries.
 
-    Called only when ebooklib's ToC parse returned empty. ebooklib has
-    already pulled the NCX bytes out of the manifest for us; we just
-    need to walk the navMap because ebooklib skips this step when the
-    spine doesn't declare a ``toc`` idref.
+    Called only when the package ToC came back empty — the spine
+    doesn't declare a ``toc`` idref and there's no nav document — for
+    the NCX found by media-type.
 
-    :param ncx_bytes: Raw NCX XML bytes from
-        ``ebooklib`` item ``get_content()``.
+    :param ncx_bytes: Raw NCX XML bytes.
     :param ncx_dir_in_epub: Directory of the NCX file relative to the
         EPUB root (as a PurePosixPath). NCX ``content src`` values are
         URIs relative to this directory; we resolve them to EPUB-root-
@@ -687,5 +985,179 @@ def _parse_ncx_bytes(
     return chapters
 
 
+# ---------------------------------------------------------------------------
+# Native package reader (stdlib; reads metadata only)
+# ---------------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class _ManifestItem:
+    id: str
+    href: str  # OPF-relative, URL-decoded
+    media_type: str
+    properties: FrozenSet[str]
+
+
+@dataclass(frozen=True)
+class _Package:
+    """What :class:`BookContent` needs from an EPUB package: the
+    manifest, the spine's item ids and the ToC in ebooklib's shape.
+    Chapter bytes are read from disk separately, on demand."""
+
+    opf_dir: pathlib.PurePosixPath
+    items: Tuple[_ManifestItem, ...]
+    spine: Tuple[str, ...]
+    toc: List[Any]
+
+    @classmethod
+    def read(cls, epub_root: pathlib.Path) -> "_Package":
+        """Parse the package of an unzipped EPUB without touching any
+        content document.
+
+        Mirrors ebooklib's reading of the same package: the ToC comes
+        from the nav document when there is one, else from the NCX
+        named by ``<spine toc=…>``.
+
+        :raises OSError, ET.ParseError, KeyError, ValueError: if the
+            package is missing or malformed; the caller falls back to
+            ebooklib.
+        """
+        opf_path = _opf_path_from_container(epub_root)
+        if opf_path is None:
+            raise ValueError(f"No OPF rootfile in {epub_root}")
+        opf_root = ET.parse(epub_root / opf_path).getroot()
+        manifest_el = opf_root.find(f"{{{_NS_OPF}}}manifest")
+        spine_el = opf_root.find(f"{{{_NS_OPF}}}spine")
+        if manifest_el is None or spine_el is None:
+            raise ValueError(f"OPF {opf_path} has no manifest or spine")
+
+        items = tuple(
+            _ManifestItem(
+                id=el.get("id", ""),
+                href=urllib.parse.unquote(el.get("href", "")),
+                media_type=el.get("media-type", ""),
+                properties=frozenset(el.get("properties", "").split()),
+            )
+            for el in manifest_el.findall(f"{{{_NS_OPF}}}item")
+        )
+        spine = tuple(
+            el.get("idref") for el in spine_el.findall(f"{{{_NS_OPF}}}itemref")
+        )
+
+        opf_dir = opf_path.parent
+        by_id = {item.id: item for item in items}
+
+        def read_item(item: _ManifestItem) -> bytes:
+            return (epub_root / opf_dir / item.href).read_bytes()
+
+        toc: List[Any] = []
+        nav_item = next(
+            (item for item in items
+             if item.media_type == _MEDIA_TYPE_XHTML and "nav" in item.properties),
+            None,
+        )
+        ncx_id = spine_el.get("toc")
+        if nav_item is not None:
+            toc = _toc_from_nav(read_item(nav_item), posixpath.dirname(nav_item.href))
+        elif ncx_id:
+            ncx_item = by_id[ncx_id]
+            toc = _toc_from_ncx(read_item(ncx_item), posixpath.dirname(ncx_item.href))
+
+        return cls(opf_dir=opf_dir, items=items, spine=spine, toc=toc)
+
+    @classmethod
+    def from_ebooklib(
+        cls, book: epub.EpubBook, opf_dir: pathlib.PurePosixPath
+    ) -> "_Package":
+        """The same view of a package ebooklib has already loaded."""
+        items = tuple(
+            _ManifestItem(
+                id=item.get_id(),
+                href=getattr(item, "file_name", None) or getattr(item, "get_name", lambda: "")(),
+                media_type=getattr(item, "media_type", "") or "",
+                properties=frozenset(getattr(item, "properties", None) or ()),
+            )
+            for item in book.get_items()
+        )
+        spine = tuple(
+            entry[0] if isinstance(entry, tuple) else entry for entry in book.spine
+        )
+        return cls(opf_dir=opf_dir, items=items, spine=spine, toc=list(book.toc or []))
 
 
+def _local_name(tag: Any) -> str:
+    """Tag name without its ``{namespace}`` prefix."""
+    return tag.rpartition("}")[2] if isinstance(tag, str) else ""
+
+
+def _toc_from_ncx(ncx_bytes: bytes, ncx_dir: str) -> List[Any]:
+    """ToC tree from an NCX, shaped like ebooklib's ``book.toc``.
+
+    ``content src`` values are resolved against the NCX's OPF-relative
+    directory, which is empty for the usual NCX next to the OPF.
+    """
+    nav_map = ET.fromstring(ncx_bytes).find(f"{{{_NS_NCX}}}navMap")
+    if nav_map is None:
+        return []
+
+    def nodes(parent) -> List[Any]:
+        out: List[Any] = []
+        for np in parent.findall(f"{{{_NS_NCX}}}navPoint"):
+            label_el = np.find(f"{{{_NS_NCX}}}navLabel")
+            title = label_el[0].text if label_el is not None and len(label_el) else ""
+            content_el = np.find(f"{{{_NS_NCX}}}content")
+            src = content_el.get("src", "") if content_el is not None else ""
+            if src and ncx_dir:
+                src = posixpath.normpath(posixpath.join(ncx_dir, src))
+            children = nodes(np)
+            if children:
+                out.append((epub.Section(title, href=src), children))
+            else:
+                out.append(epub.Link(src, title, np.get("id", "")))
+        return out
+
+    return nodes(nav_map)
+
+
+def _toc_from_nav(nav_bytes: bytes, nav_dir: str) -> List[Any]:
+    """ToC tree from an EPUB3 nav document's ``<nav epub:type="toc">``,
+    shaped like ebooklib's ``book.toc``. Hrefs are resolved against the
+    nav document's OPF-relative directory."""
+    root = ET.fromstring(nav_bytes)
+    nav = next(
+        (
+            el for el in root.iter()
+            if _local_name(el.tag) == "nav"
+            and "toc" in el.get(f"{{{_NS_OPS}}}type", "").split()
+        ),
+        None,
+    )
+    if nav is None:
+        return []
+
+    def child(el, name: str):
+        return next((c for c in el if _local_name(c.tag) == name), None)
+
+    def resolve(href: str) -> str:
+        return posixpath.normpath(posixpath.join(nav_dir, href))
+
+    def nodes(list_el) -> List[Any]:
+        out: List[Any] = []
+        for li in list_el:
+            if _local_name(li.tag) != "li":
+                continue
+            sublist, link = child(li, "ol"), child(li, "a")
+            if sublist is not None:
+                title = "".join(li[0].itertext())
+                section = (
+                    epub.Section(title, href=resolve(link.get("href")))
+                    if link is not None and link.get("href")
+                    else epub.Section(title)
+                )
+                out.append((section, nodes(sublist)))
+            elif link is not None and link.get("href"):
+                out.append(epub.Link(resolve(link.get("href")), "".join(link.itertext())))
+        return out
+
+    top = child(nav, "ol")
+    return nodes(top) if top is not None else []
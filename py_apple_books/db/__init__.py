@@ -1,4 +1,12 @@
-from py_apple_books.db.client import AppleBooksDBClient
+from py_apple_books.db.cache import CacheStats, QueryCache
+from py_apple_books.db.client import (
+    AppleBooksDBClient,
+    SnapshotDBClient,
+    get_default_client,
+    set_default_client,
+)
+from py_apple_books.db.pool import ConnectionPool, PoolStats
 from py_apple_books.db.query import Query, QueryCompiler
 
-__all__ = ['AppleBooksDBClient', 'Query', 'QueryCompiler']
+__all__ = ['AppleBooksDBClient', 'CacheStats', 'ConnectionPool', 'PoolStats', 'Query', 'QueryCache',
+           'QueryCompiler', 'SnapshotDBClient', 'get_default_client', 'set_default_client']
@@ -0,0 +1,119 @@
+import sys
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Hashable, Optional
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """Point-in-time counters for a :class:`QueryCache`."""
+    hits: int
+    misses: int
+    evictions: int
+    invalidations: int
+    entries: int
+    bytes: int
+    max_entries: int
+    max_bytes: int
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+def _estimate_size(rows: list) -> int:
+    """Rough in-memory footprint of a result set, in bytes."""
+    size = sys.getsizeof(rows)
+    for row in rows:
+        size += sys.getsizeof(row)
+        for value in row:
+            size += sys.getsizeof(value)
+    return size
+
+
+class QueryCache:
+    """
+    LRU cache of query results, bounded by entry count and total bytes.
+
+    Entries are tagged with a change token describing the state of the
+    database they were read from. A lookup with a different token means
+    the data has moved on: the whole cache is dropped (one
+    ``invalidation``) before the lookup proceeds. Storing works the same
+    way, so a result can only ever be served under the token it was
+    read with.
+    """
+
+    def __init__(self, max_entries: int = 256, max_bytes: int = 32 * 1024 * 1024):
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        if max_bytes < 1:
+            raise ValueError("max_bytes must be at least 1")
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[Hashable, tuple[list, int]]" = OrderedDict()
+        self._bytes = 0
+        self._token: Any = None
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+        self._lock = threading.Lock()
+
+    def _check_token(self, token: Any) -> None:
+        if token != self._token:
+            if self._entries:
+                self._invalidations += 1
+            self._entries.clear()
+            self._bytes = 0
+            self._token = token
+
+    def get(self, key: Hashable, token: Any) -> Optional[list]:
+        """Cached rows for ``key``, or ``None`` on a miss."""
+        with self._lock:
+            self._check_token(token)
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return list(entry[0])
+
+    def put(self, key: Hashable, rows: list, token: Any) -> None:
+        size = _estimate_size(rows)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            self._check_token(token)
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous[1]
+            self._entries[key] = (list(rows), size)
+            self._bytes += size
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self._bytes -= evicted
+                self._evictions += 1
+
+    def clear(self) -> None:
+        """Drop every entry; counts as an invalidation if anything was cached."""
+        with self._lock:
+            if self._entries:
+                self._invalidations += 1
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                invalidations=self._invalidations,
+                entries=len(self._entries),
+                bytes=self._bytes,
+                max_entries=self.max_entries,
+                max_bytes=self.max_bytes,
+            )
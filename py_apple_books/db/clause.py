@@ -1,16 +1,19 @@
+from typing import Optional
+
+
 class Clause:
     def __str__(self):
         pass
 
+    @property
+    def params(self) -> tuple:
+        """Values bound to the ``?`` placeholders in :meth:`__str__`, in order."""
+        return ()
+
     def _escape_like(self, value: str) -> str:
         escaped_value = value.replace('%', r'\%').replace('_', r'\_')
         return f"'{escaped_value}'"
 
-    def _escape_value(self, value) -> str:
-        if isinstance(value, str):
-            return f"'{value}'"
-        return str(value)
-
 
 class Join(Clause):
     def __init__(self, table: str, on: str, type: str = ''):
@@ -23,31 +26,126 @@ class Join(Clause):
 
 
 class Where(Clause):
-    def __init__(self, field: str, value, operator: str = '='):
+    """A single ``field <operator> value`` predicate.
+
+    Renders with ``?`` placeholders instead of inlined literals so that
+    filters differing only by value share one statement string — and
+    therefore one entry in sqlite3's prepared-statement cache. The
+    values themselves are exposed through :attr:`params`.
+    """
+
+    def __init__(self, field: str, value, operator: str = '=', escape: Optional[str] = None):
         self.field = field
         self.value = value
         self.operator = operator
+        # ESCAPE character for LIKE patterns
+        self.escape = escape
         self.is_list = isinstance(value, (list, tuple))
 
+    def _is_null_check(self) -> bool:
+        # SQL keyword NULL — must not be bound as a parameter. Without
+        # this special case, ``__isnull`` filters compare against the
+        # literal string ``'NULL'``, which matches nothing on numeric
+        # columns and every row holding the string ``'NULL'`` on text
+        # columns — silently broken.
+        return self.operator in ('IS', 'IS NOT') and (
+            self.value is None or self.value == 'NULL'
+        )
+
     def __str__(self):
         if self.operator == 'IN':
-            # Handle lists for IN operator
             if isinstance(self.value, str):
-                # If it's already a comma-separated string, use it directly
-                formatted_value = f"({self.value})"
-            else:
-                # Format each item separately and join them
-                formatted_items = [self._escape_value(item) for item in self.value]
-                formatted_value = f"({', '.join(formatted_items)})"
-            return f"{self.field} {self.operator} {formatted_value}"
-        if self.operator in ('IS', 'IS NOT') and (
-            self.value is None or self.value == 'NULL'
-        ):
-            # SQL keyword NULL — must not be quoted. Without this
-            # special case, ``__isnull`` filters render as
-            # ``col IS 'NULL'`` (literal string), which matches nothing
-            # on numeric columns and every row with the literal string
-            # ``'NULL'`` on text columns — silently broken.
+                # Already a comma-separated SQL fragment, use it directly
+                return f"{self.field} {self.operator} ({self.value})"
+            placeholders = ', '.join('?' for _ in self.value)
+            return f"{self.field} {self.operator} ({placeholders})"
+        if self._is_null_check():
             return f"{self.field} {self.operator} NULL"
-        # Handle regular operators
-        return f"{self.field} {self.operator} {self._escape_value(self.value)}"
+        if self.escape is not None:
+            return f"{self.field} {self.operator} ? ESCAPE '{self.escape}'"
+        return f"{self.field} {self.operator} ?"
+
+    @property
+    def params(self) -> tuple:
+        if self.operator == 'IN':
+            return () if isinstance(self.value, str) else tuple(self.value)
+        if self._is_null_check():
+            return ()
+        return (self.value,)
+
+
+class And(Clause):
+    """Parenthesized conjunction of clauses; matches everything when empty."""
+    connector = 'AND'
+    empty = '1'
+
+    def __init__(self, clauses: list):
+        self.clauses = list(clauses)
+
+    def __str__(self):
+        if not self.clauses:
+            return self.empty
+        if len(self.clauses) == 1:
+            return str(self.clauses[0])
+        return '(' + f' {self.connector} '.join(str(clause) for clause in self.clauses) + ')'
+
+    @property
+    def params(self) -> tuple:
+        return tuple(param for clause in self.clauses for param in clause.params)
+
+
+class Or(And):
+    """Parenthesized disjunction of clauses; matches nothing when empty."""
+    connector = 'OR'
+    empty = '0'
+
+
+class Not(Clause):
+    def __init__(self, clause: Clause):
+        self.clause = clause
+
+    def __str__(self):
+        return f"NOT {self.clause}"
+
+    @property
+    def params(self) -> tuple:
+        return self.clause.params
+
+
+class Seek(Clause):
+    """Keyset predicate: rows strictly after ``(key_value, pk_value)``.
+
+    Matches the order of ``ORDER BY key, pk`` (or ``key DESC, pk DESC``),
+    in which SQLite sorts NULL keys first (last when descending). A
+    non-NULL position compiles to a row-value comparison
+    ``(key, pk) > (?, ?)`` that SQLite can answer from an index; the
+    NULL group needs its own ``IS NULL`` branch since NULL compares as
+    unknown.
+    """
+
+    def __init__(self, key: str, pk: str, key_value, pk_value, descending: bool = False):
+        self.key = key
+        self.pk = pk
+        self.key_value = key_value
+        self.pk_value = pk_value
+        self.descending = descending
+
+    def __str__(self):
+        op = '<' if self.descending else '>'
+        if self.key == self.pk:
+            return f"{self.pk} {op} ?"
+        if self.key_value is None:
+            within_nulls = f"{self.key} IS NULL AND {self.pk} {op} ?"
+            if self.descending:
+                return f"({within_nulls})"
+            return f"(({within_nulls}) OR {self.key} IS NOT NULL)"
+        after = f"({self.key}, {self.pk}) {op} (?, ?)"
+        if self.descending:
+            return f"({after} OR {self.key} IS NULL)"
+        return after
+
+    @property
+    def params(self) -> tuple:
+        if self.key == self.pk or self.key_value is None:
+            return (self.pk_value,)
+        return (self.key_value, self.pk_value)
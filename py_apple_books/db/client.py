@@ -1,49 +1,384 @@
+import itertools
+import os
 import sqlite3
+import threading
 from pathlib import Path
+from typing import Any, Callable, Iterator, Optional, Union
 from py_apple_books.db.exceptions import DBError, DBConnectionError, DBQueryError
+from py_apple_books.db.functions import register_functions
+from py_apple_books.db.pool import ConnectionPool, PoolStats
+
+
+# PRAGMAs that are set per attached schema rather than per connection.
+_SCHEMA_PRAGMAS = ('mmap_size', 'cache_size')
+
+_TEMP_STORE_VALUES = {'DEFAULT': 0, 'FILE': 1, 'MEMORY': 2}
+
+# sqlite3 row factory: called as ``row_factory(cursor, row)`` per row.
+RowFactory = Callable[[Any, tuple], Any]
 
 
 class DBClient:
     def _get_sqlite_file(self, path: Path) -> Path:
         return list(path.glob("*.sqlite"))[0]
 
-    def _get_cursor(self, paths: list[tuple[str, Path]]):
-        _, first_path = paths[0]
+    def _sqlite_uri(self, path: Path, read_only: bool = False, immutable: bool = False) -> str:
+        """
+        ``file:`` URI for ``path``. ``mode=ro`` opens without taking write
+        locks; ``immutable=1`` additionally tells SQLite the file can't
+        change underneath it, skipping locking and change detection
+        entirely — only safe for snapshots nobody is writing to.
+        """
+        options = []
+        if read_only or immutable:
+            options.append('mode=ro')
+        if immutable:
+            options.append('immutable=1')
+        uri = path.absolute().as_uri()
+        return f"{uri}?{'&'.join(options)}" if options else uri
+
+    def _get_connection(self, paths: list[tuple[str, Path]],
+                        cached_statements: int = 128,
+                        read_only: bool = False,
+                        immutable: bool = False,
+                        pragmas: Optional[dict] = None) -> sqlite3.Connection:
         try:
-            conn = sqlite3.connect(self._get_sqlite_file(first_path))
-            cursor = conn.cursor()
-            for db_name, path in paths[1:]:
-                cursor.execute(f"ATTACH DATABASE '{self._get_sqlite_file(path)}' AS {db_name}")
-            return cursor
-        except sqlite3.Error as e:
-            raise DBConnectionError(f"Error connecting to database: {e}")
+            uris = [(db_name, self._sqlite_uri(self._get_sqlite_file(path), read_only, immutable))
+                    for db_name, path in paths]
         except IndexError:
             raise DBConnectionError("No sqlite files found. Please open iBooks at least once.")
+        return self._open_uris(uris, cached_statements=cached_statements, pragmas=pragmas)
+
+    def _open_uris(self, uris: list[tuple[str, str]],
+                   cached_statements: int = 128,
+                   pragmas: Optional[dict] = None) -> sqlite3.Connection:
+        """
+        Open the first URI as ``main``, ATTACH the rest under their
+        schema names, register the ``REGEXP``/``FOLD`` SQL functions, and
+        apply ``pragmas`` — per schema for :data:`_SCHEMA_PRAGMAS`, once
+        per connection otherwise.
+        """
+        _, main_uri = uris[0]
+        try:
+            # Pooled connections move between threads (one at a time), so
+            # sqlite3's same-thread check has to be off.
+            conn = sqlite3.connect(main_uri, uri=True,
+                                   cached_statements=cached_statements,
+                                   check_same_thread=False)
+            register_functions(conn)
+            for db_name, uri in uris[1:]:
+                conn.execute(f"ATTACH DATABASE ? AS {db_name}", (uri,))
+            schemas = ['main'] + [db_name for db_name, _ in uris[1:]]
+            for name, value in (pragmas or {}).items():
+                if name in _SCHEMA_PRAGMAS:
+                    for schema in schemas:
+                        conn.execute(f"PRAGMA {schema}.{name} = {int(value)}")
+                else:
+                    conn.execute(f"PRAGMA {name} = {int(value)}")
+            return conn
+        except sqlite3.Error as e:
+            raise DBConnectionError(f"Error connecting to database: {e}")
         except Exception as e:
             raise DBError(f"Unexpected error while connecting to database: {e}")
 
     def execute(self, *args, **kwargs):
         raise NotImplementedError
 
+    def iterate(self, *args, **kwargs):
+        raise NotImplementedError
+
+    def change_token(self):
+        raise NotImplementedError
+
     def close(self):
-        self.cursor.close()
+        raise NotImplementedError
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
 
 
 class AppleBooksDBClient(DBClient):
     """
     Wrapper for the Apple Books SQLite database
+
+    Queries run on connections checked out of a thread-safe
+    :class:`~py_apple_books.db.pool.ConnectionPool`, each with the
+    annotation database attached, so reads from several threads proceed
+    in parallel. Nothing is opened at construction time: connections
+    are made on demand, and :meth:`close` releases them. A closed client
+    reopens on its next query, so it can also be used as a context
+    manager around a batch of work.
+
+    For read-heavy workloads, ``read_only=True`` opens both databases
+    via ``file:...?mode=ro`` URIs with ``PRAGMA query_only`` set, so the
+    client never takes write locks against Apple Books. ``mmap_size``,
+    ``cache_size`` and ``temp_store`` tune the page I/O of every pooled
+    connection, on the library and the attached annotation database
+    alike.
     """
     book_lib_db = ("lib_db", Path.home() / "Library/Containers/com.apple.iBooksX/Data/Documents/BKLibrary")
     anno_db = ("anno_db", Path.home() / "Library/Containers/com.apple.iBooksX/Data/Documents/AEAnnotation")
 
-    def __init__(self):
-        self.cursor = self._get_cursor(paths=[self.book_lib_db, self.anno_db])
+    def __init__(self, cached_statements: int = 128, pool_size: int = 5, pool_timeout: float = 30.0,
+                 read_only: bool = False, immutable: bool = False, mmap_size: Optional[int] = None,
+                 cache_size: Optional[int] = None, temp_store: Union[str, int, None] = None):
+        """
+        Args:
+            cached_statements: Size of sqlite3's per-connection prepared
+                statement cache. Queries are parameterized, so one entry
+                serves every call of the same shape.
+            pool_size: Maximum number of open connections, i.e. of
+                threads querying at the same time.
+            pool_timeout: Seconds a thread waits for a free connection
+                before :class:`DBConnectionError` is raised.
+            read_only: Open with ``mode=ro`` and ``PRAGMA query_only``.
+            immutable: Also pass ``immutable=1``: no locking or change
+                detection at all. Only for offline copies of the library
+                that nothing writes to. Implies ``read_only``.
+            mmap_size: ``PRAGMA mmap_size`` in bytes, per database.
+            cache_size: ``PRAGMA cache_size`` per database (pages, or
+                KiB when negative).
+            temp_store: ``PRAGMA temp_store``: ``'default'``, ``'file'``
+                or ``'memory'`` (or 0/1/2).
+        """
+        self.cached_statements = cached_statements
+        self.read_only = read_only or immutable
+        self.immutable = immutable
+        self.pragmas = {}
+        if self.read_only:
+            self.pragmas['query_only'] = 1
+        if mmap_size is not None:
+            self.pragmas['mmap_size'] = mmap_size
+        if cache_size is not None:
+            self.pragmas['cache_size'] = cache_size
+        if temp_store is not None:
+            if isinstance(temp_store, str):
+                if temp_store.upper() not in _TEMP_STORE_VALUES:
+                    raise ValueError(f"temp_store must be one of {sorted(_TEMP_STORE_VALUES)}, "
+                                     f"got {temp_store!r}")
+                temp_store = _TEMP_STORE_VALUES[temp_store.upper()]
+            elif temp_store not in _TEMP_STORE_VALUES.values():
+                raise ValueError(f"temp_store must be 0, 1 or 2, got {temp_store!r}")
+            self.pragmas['temp_store'] = temp_store
+        self.pool = ConnectionPool(self._connect, size=pool_size, timeout=pool_timeout)
+
+    def _connect(self) -> sqlite3.Connection:
+        return self._get_connection(paths=[self.book_lib_db, self.anno_db],
+                                    cached_statements=self.cached_statements,
+                                    read_only=self.read_only,
+                                    immutable=self.immutable,
+                                    pragmas=self.pragmas)
+
+    @property
+    def is_open(self) -> bool:
+        return self.pool.stats().open > 0
+
+    def stats(self) -> PoolStats:
+        """Connection pool metrics."""
+        return self.pool.stats()
+
+    def change_token(self) -> tuple:
+        """
+        Cheap fingerprint of both databases on disk: the mtime and size of
+        each ``.sqlite`` file and of its ``-wal``. Any committed write —
+        ours or Apple Books' — changes it, without opening a connection.
+        """
+        token = []
+        for _, path in (self.book_lib_db, self.anno_db):
+            try:
+                db_file = self._get_sqlite_file(path)
+            except IndexError:
+                token.append(None)
+                continue
+            for file in (db_file, db_file.with_name(db_file.name + '-wal')):
+                try:
+                    st = file.stat()
+                except OSError:
+                    token.append(None)
+                else:
+                    token.append((st.st_mtime_ns, st.st_size))
+        return tuple(token)
+
+    def snapshot(self) -> "SnapshotDBClient":
+        """
+        Copy both databases into memory now and return a client that
+        serves queries from the copy. See :class:`SnapshotDBClient`.
+        """
+        client = SnapshotDBClient(self)
+        client.refresh()
+        return client
+
+    def close(self):
+        self.pool.close()
+
+    def execute(self, query: str, params: tuple = (), row_factory: Optional[RowFactory] = None) -> list:
+        """
+        Run ``query`` and return all rows — tuples, or whatever
+        ``row_factory(cursor, row)`` builds from each as it comes off
+        the cursor.
+        """
+        with self.pool.connection() as conn:
+            try:
+                cursor = conn.cursor()
+                cursor.row_factory = row_factory
+                return cursor.execute(query, params).fetchall()
+            except sqlite3.Error as e:
+                raise DBQueryError(f"Error executing query: {e}")
+            except Exception as e:
+                raise DBError(f"Unexpected error while executing query: {e}")
+
+    def iterate(self, query: str, params: tuple = (), chunk_size: int = 2000,
+                row_factory: Optional[RowFactory] = None) -> Iterator[Any]:
+        """
+        Yield result rows lazily, pulling ``chunk_size`` rows at a time.
 
-    def execute(self, query: str) -> list:
+        Runs on a dedicated cursor so that other queries issued while the
+        caller is still consuming rows (relation lookups, for instance)
+        don't reset the one being streamed. The connection stays checked
+        out until the generator is exhausted or closed.
+        """
+        with self.pool.connection() as conn:
+            try:
+                cursor = conn.cursor()
+                cursor.row_factory = row_factory
+                cursor.execute(query, params)
+            except sqlite3.Error as e:
+                raise DBQueryError(f"Error executing query: {e}")
+            except Exception as e:
+                raise DBError(f"Unexpected error while executing query: {e}")
+            try:
+                while True:
+                    try:
+                        rows = cursor.fetchmany(chunk_size)
+                    except sqlite3.Error as e:
+                        raise DBQueryError(f"Error fetching rows: {e}")
+                    if not rows:
+                        break
+                    yield from rows
+            finally:
+                cursor.close()
+
+
+class SnapshotDBClient(AppleBooksDBClient):
+    """
+    Read-only, in-memory copy of the library and annotation databases.
+
+    Both files are copied with sqlite3's online backup API into named,
+    shared-cache memory databases, and pooled connections open those
+    instead of the files on disk. Queries never contend with Apple Books
+    for locks and always see the same data, however long the job runs.
+
+    :meth:`refresh` takes a new copy; connections still reading the old
+    one finish undisturbed and are replaced as they return to the pool.
+    :meth:`close` frees the copy, and the next query takes a fresh one.
+    """
+    _names = itertools.count()
+
+    def __init__(self, source: AppleBooksDBClient):
+        super().__init__(cached_statements=source.cached_statements,
+                         pool_size=source.pool.size,
+                         pool_timeout=source.pool.timeout)
+        self.source = source
+        self.read_only = True
+        self.pragmas = {'query_only': 1}
+        if 'temp_store' in source.pragmas:
+            self.pragmas['temp_store'] = source.pragmas['temp_store']
+        # Bumped on every new copy, so callers can tell snapshots apart.
+        self.generation = 0
+        self._uris: Optional[list] = None
+        # One open connection per memory database keeps it alive between
+        # pool checkouts; SQLite drops it once the last connection closes.
+        self._keepers: list = []
+        self._snapshot_lock = threading.Lock()
+
+    def _copy(self) -> tuple[list, list]:
+        tag = f"py_apple_books_snapshot_{os.getpid()}_{next(self._names)}"
+        uris, keepers = [], []
         try:
-            self.cursor.execute(query)
-            return self.cursor.fetchall()
-        except sqlite3.Error as e:
-            raise DBQueryError(f"Error executing query: {e}")
-        except Exception as e:
-            raise DBError(f"Unexpected error while executing query: {e}")
+            for db_name, path in (self.source.book_lib_db, self.source.anno_db):
+                uri = f"file:{tag}_{db_name}?mode=memory&cache=shared"
+                src = self._get_connection([(db_name, path)], read_only=True,
+                                           immutable=self.source.immutable)
+                try:
+                    dst = sqlite3.connect(uri, uri=True, check_same_thread=False)
+                    keepers.append(dst)
+                    src.backup(dst)
+                finally:
+                    src.close()
+                uris.append((db_name, uri))
+        except BaseException as e:
+            for conn in keepers:
+                conn.close()
+            if isinstance(e, sqlite3.Error):
+                raise DBConnectionError(f"Error copying database into memory: {e}")
+            raise
+        return uris, keepers
+
+    def _connect(self) -> sqlite3.Connection:
+        with self._snapshot_lock:
+            if self._uris is None:
+                self._uris, self._keepers = self._copy()
+                self.generation += 1
+            uris = self._uris
+        return self._open_uris(uris, cached_statements=self.cached_statements,
+                               pragmas=self.pragmas)
+
+    def snapshot(self) -> "SnapshotDBClient":
+        return self.source.snapshot()
+
+    def change_token(self) -> int:
+        """The copy only changes on :meth:`refresh`."""
+        return self.generation
+
+    def refresh(self) -> None:
+        """Re-copy both databases from disk and serve queries from the new copy."""
+        uris, keepers = self._copy()
+        with self._snapshot_lock:
+            old, self._keepers = self._keepers, keepers
+            self._uris = uris
+            self.generation += 1
+        self.pool.close()
+        for conn in old:
+            conn.close()
+
+    def close(self):
+        self.pool.close()
+        with self._snapshot_lock:
+            old, self._keepers = self._keepers, []
+            self._uris = None
+        for conn in old:
+            conn.close()
+
+
+_default_client: Optional[DBClient] = None
+_default_client_lock = threading.Lock()
+
+
+def get_default_client() -> DBClient:
+    """
+    The process-wide client shared by every model manager.
+
+    Created on first use; constructing it doesn't open the database.
+    """
+    global _default_client
+    if _default_client is None:
+        with _default_client_lock:
+            if _default_client is None:
+                _default_client = AppleBooksDBClient()
+    return _default_client
+
+
+def set_default_client(client: Optional[DBClient]) -> Optional[DBClient]:
+    """
+    Replace the process-wide client and return the previous one.
+
+    The previous client is not closed; that's up to the caller. Passing
+    ``None`` resets to a fresh default client on next use.
+    """
+    global _default_client
+    with _default_client_lock:
+        previous, _default_client = _default_client, client
+    return previous
@@ -0,0 +1,41 @@
+import functools
+import re
+import sqlite3
+import unicodedata
+from typing import Optional
+
+
+@functools.lru_cache(maxsize=256)
+def compile_pattern(pattern: str) -> 're.Pattern':
+    """Compiled regex for ``pattern``, cached across rows and queries."""
+    return re.compile(pattern)
+
+
+def regexp(pattern: Optional[str], value: Optional[str]) -> Optional[int]:
+    """SQLite ``REGEXP``: ``value REGEXP pattern`` calls ``regexp(pattern, value)``."""
+    if pattern is None or value is None:
+        return None
+    return 1 if compile_pattern(pattern).search(str(value)) else 0
+
+
+def fold(value: Optional[str]) -> Optional[str]:
+    """
+    Caseless, accentless form of ``value`` for comparisons: full Unicode
+    case folding (``ß`` -> ``ss``) followed by stripping combining marks
+    (``é`` -> ``e``).
+    """
+    if value is None:
+        return None
+    decomposed = unicodedata.normalize('NFKD', str(value).casefold())
+    return ''.join(ch for ch in decomposed if not unicodedata.combining(ch))
+
+
+def register_functions(conn: sqlite3.Connection) -> None:
+    """Register ``REGEXP`` and ``FOLD`` on ``conn``."""
+    for name, n_args, func in (('REGEXP', 2, regexp), ('FOLD', 1, fold)):
+        try:
+            # Deterministic functions can be used in indexes and let the
+            # planner factor constant calls out of the scan loop.
+            conn.create_function(name, n_args, func, deterministic=True)
+        except sqlite3.NotSupportedError:
+            conn.create_function(name, n_args, func)
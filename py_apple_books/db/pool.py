@@ -0,0 +1,166 @@
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterator, List
+from py_apple_books.db.exceptions import DBConnectionError
+
+
+@dataclass(frozen=True)
+class PoolStats:
+    """Point-in-time counters for a :class:`ConnectionPool`."""
+    size: int
+    open: int
+    idle: int
+    in_use: int
+    created: int
+    checkouts: int
+    waits: int
+    timeouts: int
+
+
+class ConnectionPool:
+    """
+    Bounded pool of sqlite3 connections shared across threads.
+
+    Connections are checked out per query and returned afterwards, so
+    up to ``size`` threads read concurrently and the rest wait (up to
+    ``timeout`` seconds) for one to come back. New connections are
+    opened on demand through ``connect``; nothing is opened up front.
+
+    Checkouts are reentrant per thread: a thread that already holds a
+    connection — say, while streaming rows — gets the same one back
+    for nested queries instead of waiting on a second, which would
+    deadlock a pool of size one.
+    """
+
+    def __init__(self, connect: Callable[[], sqlite3.Connection], size: int = 5,
+                 timeout: float = 30.0):
+        if size < 1:
+            raise ValueError("pool size must be at least 1")
+        self._connect = connect
+        self.size = size
+        self.timeout = timeout
+        self._idle: List[sqlite3.Connection] = []
+        self._generations: Dict[sqlite3.Connection, int] = {}
+        self._generation = 0
+        self._pending = 0
+        self._in_use = 0
+        self._created = 0
+        self._checkouts = 0
+        self._waits = 0
+        self._timeouts = 0
+        self._available = threading.Condition(threading.Lock())
+        # thread ident -> [connection, checkout depth], and the reverse
+        self._held: Dict[int, list] = {}
+        self._holder: Dict[sqlite3.Connection, int] = {}
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        conn = self.acquire()
+        try:
+            yield conn
+        finally:
+            self.release(conn)
+
+    def acquire(self) -> sqlite3.Connection:
+        me = threading.get_ident()
+        create = False
+        with self._available:
+            held = self._held.get(me)
+            if held is not None:
+                held[1] += 1
+                return held[0]
+
+            deadline = time.monotonic() + self.timeout
+            waited = False
+            while True:
+                if self._idle:
+                    conn = self._idle.pop()
+                    break
+                if len(self._generations) + self._pending < self.size:
+                    # Reserve the slot, then connect outside the lock.
+                    create = True
+                    self._pending += 1
+                    generation = self._generation
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self._timeouts += 1
+                    raise DBConnectionError(
+                        f"Timed out after {self.timeout}s waiting for one of "
+                        f"{self.size} pooled connections"
+                    )
+                if not waited:
+                    self._waits += 1
+                    waited = True
+                self._available.wait(remaining)
+
+        if create:
+            try:
+                conn = self._connect()
+            except BaseException:
+                with self._available:
+                    self._pending -= 1
+                    self._available.notify()
+                raise
+            with self._available:
+                self._pending -= 1
+                self._created += 1
+                self._generations[conn] = generation
+
+        with self._available:
+            self._in_use += 1
+            self._checkouts += 1
+            self._held[me] = [conn, 1]
+            self._holder[conn] = me
+        return conn
+
+    def release(self, conn: sqlite3.Connection) -> None:
+        """Return a connection; may be called from any thread."""
+        with self._available:
+            owner = self._holder.get(conn)
+            held = self._held.get(owner)
+            if held is not None and held[1] > 1:
+                held[1] -= 1
+                return
+            self._held.pop(owner, None)
+            self._holder.pop(conn, None)
+            self._in_use -= 1
+            stale = self._generations.get(conn) != self._generation
+            if stale:
+                self._generations.pop(conn, None)
+            else:
+                self._idle.append(conn)
+            self._available.notify()
+        if stale:
+            conn.close()
+
+    def close(self) -> None:
+        """
+        Close idle connections now and checked-out ones as they come back.
+
+        The pool stays usable: the next checkout opens a fresh connection.
+        """
+        with self._available:
+            self._generation += 1
+            idle, self._idle = self._idle, []
+            for conn in idle:
+                del self._generations[conn]
+            self._available.notify_all()
+        for conn in idle:
+            conn.close()
+
+    def stats(self) -> PoolStats:
+        with self._available:
+            return PoolStats(
+                size=self.size,
+                open=len(self._generations),
+                idle=len(self._idle),
+                in_use=self._in_use,
+                created=self._created,
+                checkouts=self._checkouts,
+                waits=self._waits,
+                timeouts=self._timeouts,
+            )
@@ -1,30 +1,93 @@
-from py_apple_books.db.clause import Where
-from typing import List, Optional, Any, Union, Dict
-from py_apple_books.db.client import DBClient
+from py_apple_books.db.cache import CacheStats, QueryCache
+from py_apple_books.db.clause import Clause, Where
+from typing import List, Optional, Any, Union, Dict, Tuple, Iterator
+from py_apple_books.db.client import DBClient, RowFactory, get_default_client
 
 
 class QueryCompiler:
-    """SQL query compiler"""
+    """SQL query compiler
 
-    def __init__(self, client: DBClient):
-        self.client = client
+    Without an explicit client, queries go to the process-wide default
+    client (see :func:`~py_apple_books.db.client.get_default_client`),
+    resolved at query time so it can be swapped or reopened freely.
 
-    def execute(self, query: str) -> list[Any]:
-        return self.client.execute(query)
+    :meth:`enable_cache` turns on an LRU cache of :meth:`execute`
+    results keyed by SQL and parameters. Before every lookup the
+    client's :meth:`~py_apple_books.db.client.DBClient.change_token` is
+    compared with the one the cache was filled under, so a write to
+    either database (or switching clients) empties it automatically.
+    Streaming through :meth:`iterate` always bypasses the cache.
+    """
+
+    def __init__(self, client: Optional[DBClient] = None):
+        self._client = client
+        self.cache: Optional[QueryCache] = None
+
+    @property
+    def client(self) -> DBClient:
+        return self._client if self._client is not None else get_default_client()
+
+    def enable_cache(self, max_entries: int = 256, max_bytes: int = 32 * 1024 * 1024) -> QueryCache:
+        """Start caching results; replaces (and empties) any existing cache."""
+        self.cache = QueryCache(max_entries=max_entries, max_bytes=max_bytes)
+        return self.cache
+
+    def disable_cache(self) -> None:
+        self.cache = None
+
+    def invalidate(self) -> None:
+        """Drop every cached result now."""
+        if self.cache is not None:
+            self.cache.clear()
+
+    def cache_stats(self) -> Optional[CacheStats]:
+        return self.cache.stats() if self.cache is not None else None
+
+    def execute(self, query: str, params: tuple = (), row_factory: Optional[RowFactory] = None) -> list[Any]:
+        """
+        Run ``query`` and return its rows, each passed through
+        ``row_factory(cursor, row)`` if given. The cache holds the plain
+        tuples, so on a cache hit the factory runs with ``cursor=None``.
+        """
+        cache = self.cache
+        client = self.client
+        if cache is None:
+            return client.execute(query, params, row_factory=row_factory)
+        token = (client, client.change_token())
+        key = (query, tuple(params))
+        rows = cache.get(key, token)
+        if rows is None:
+            rows = client.execute(query, params)
+            cache.put(key, rows, token)
+        if row_factory is not None:
+            rows = [row_factory(None, row) for row in rows]
+        return rows
+
+    def iterate(self, query: str, params: tuple = (), chunk_size: int = 2000,
+                row_factory: Optional[RowFactory] = None) -> Iterator[Any]:
+        return self.client.iterate(query, params, chunk_size=chunk_size, row_factory=row_factory)
 
 
 class Query:
-    """SQL query builder"""
+    """SQL query builder
+
+    Every builder returns a ``(sql, params)`` pair. Values never end up
+    in the SQL text; they are bound through ``?`` placeholders so that
+    statements of the same shape are prepared once and then served
+    from sqlite3's statement cache.
+    """
 
     # TODO: add join query support (single and multi-level)
 
     @staticmethod
     def select(table_name: str,
                fields: Union[List[str], str] = '*',
-               where: Optional[List[Where]] = None,
+               where: Optional[List[Clause]] = None,
                order_by: Optional[str] = None,
                limit: Optional[int] = None,
-               use_or: bool = False) -> str:
+               use_or: bool = False,
+               offset: Optional[int] = None,
+               group_by: Optional[List[str]] = None) -> Tuple[str, tuple]:
         """
         Build and execute a SELECT query
 
@@ -34,6 +97,8 @@ class Query:
             where: The WHERE clause
             order_by: The ORDER BY clause
             limit: The LIMIT clause
+            offset: The OFFSET clause
+            group_by: The GROUP BY columns
         """
         if isinstance(fields, list):
             fields_str = ', '.join(fields)
@@ -41,6 +106,7 @@ class Query:
             fields_str = fields
 
         query = f"SELECT {fields_str} FROM {table_name}"
+        params: list = []
 
         if where:
             where_clauses = [str(clause) for clause in where]
@@ -48,44 +114,103 @@ class Query:
                 query += f" WHERE {' OR '.join(where_clauses)}"
             else:
                 query += f" WHERE {' AND '.join(where_clauses)}"
+            for clause in where:
+                params.extend(clause.params)
+
+        if group_by:
+            query += f" GROUP BY {', '.join(group_by)}"
 
         if order_by:
             query += f" ORDER BY {order_by}"
 
-        if limit:
-            query += f" LIMIT {limit}"
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
+        elif offset:
+            # SQLite only accepts OFFSET after a LIMIT; -1 means "no limit".
+            query += " LIMIT -1"
 
-        return query
+        if offset:
+            query += " OFFSET ?"
+            params.append(offset)
+
+        return query, tuple(params)
+
+    @staticmethod
+    def count(table_name: str,
+              where: Optional[List[Clause]] = None,
+              limit: Optional[int] = None,
+              use_or: bool = False,
+              offset: Optional[int] = None,
+              group_by: Optional[List[str]] = None) -> Tuple[str, tuple]:
+        """
+        Build a SELECT COUNT(*) query
+
+        A LIMIT/OFFSET window has to be applied before counting, and a
+        grouped query counts groups rather than rows, so either wraps
+        the row selection in a subquery.
+        """
+        if limit is None and not offset and not group_by:
+            return Query.select(table_name, fields='COUNT(*)', where=where, use_or=use_or)
+        inner, params = Query.select(table_name, fields='1', where=where, use_or=use_or,
+                                     limit=limit, offset=offset, group_by=group_by)
+        return f"SELECT COUNT(*) FROM ({inner})", params
+
+    @staticmethod
+    def aggregate(table_name: str,
+                  expressions: List[str],
+                  where: Optional[List[Clause]] = None,
+                  limit: Optional[int] = None,
+                  use_or: bool = False,
+                  offset: Optional[int] = None,
+                  order_by: Optional[str] = None) -> Tuple[str, tuple]:
+        """
+        Build a SELECT of aggregate ``expressions`` over the matching rows
+
+        As with :meth:`count`, a LIMIT/OFFSET window is applied in a
+        subquery first so the aggregates only see the windowed rows;
+        ``order_by`` decides which rows fall in the window and is
+        ignored without one.
+        """
+        if limit is None and not offset:
+            return Query.select(table_name, fields=expressions, where=where, use_or=use_or)
+        inner, params = Query.select(table_name, where=where, use_or=use_or,
+                                     order_by=order_by, limit=limit, offset=offset)
+        return f"SELECT {', '.join(expressions)} FROM ({inner})", params
 
     @staticmethod
     def insert(table_name: str,
-               data: Dict[str, Any]) -> str:
+               data: Dict[str, Any]) -> Tuple[str, tuple]:
         """
         Build and execute an INSERT query
         """
         fields = ', '.join(data.keys())
-        values = ', '.join([f"'{value}'" for value in data.values()])
-        query = f"INSERT INTO {table_name} ({fields}) VALUES ({values})"
-        return query
+        placeholders = ', '.join('?' for _ in data)
+        query = f"INSERT INTO {table_name} ({fields}) VALUES ({placeholders})"
+        return query, tuple(data.values())
 
     @staticmethod
     def update(table_name: str,
                data: Dict[str, Any],
-               where: List[Where]) -> str:
+               where: List[Where]) -> Tuple[str, tuple]:
         """
         Build and execute an UPDATE query
         """
-        set_clause = ', '.join([f"{field} = '{value}'" for field, value in data.items()])
+        set_clause = ', '.join([f"{field} = ?" for field in data])
         where_clause = ' AND '.join([str(clause) for clause in where])
         query = f"UPDATE {table_name} SET {set_clause} WHERE {where_clause}"
-        return query
+        params = list(data.values())
+        for clause in where:
+            params.extend(clause.params)
+        return query, tuple(params)
 
     @staticmethod
     def delete(table_name: str,
-               where: List[Where]) -> str:
+               where: List[Where]) -> Tuple[str, tuple]:
         """
         Build and execute a DELETE query
         """
         where_clause = ' AND '.join([str(clause) for clause in where])
         query = f"DELETE FROM {table_name} WHERE {where_clause}"
-        return query
+        params = [param for clause in where for param in clause.params]
+        return query, tuple(params)
@@ -1,5 +1,8 @@
+from py_apple_books.models.aggregates import Count, Max, Min, Sum
 from py_apple_books.models.book import Book
 from py_apple_books.models.collection import Collection
 from py_apple_books.models.annotation import Annotation, AnnotationColor
+from py_apple_books.models.pagination import Page
+from py_apple_books.models.predicates import Q
 
-__all__ = ["Book", "Collection", "Annotation", "AnnotationColor"]
+__all__ = ["Book", "Collection", "Annotation", "AnnotationColor", "Count", "Max", "Min", "Page", "Q", "Sum"]
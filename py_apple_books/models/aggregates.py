@@ -0,0 +1,56 @@
+from typing import Optional
+
+
+class Aggregate:
+    """
+    An SQL aggregate over one model field, for
+    :meth:`ModelIterable.aggregate
+    <py_apple_books.models.manager.ModelIterable.aggregate>` and
+    :meth:`ValuesIterable.annotate
+    <py_apple_books.models.manager.ValuesIterable.annotate>`.
+
+    Without an explicit alias the result is keyed ``<field>__<name>``,
+    e.g. ``Sum('reading_progress')`` -> ``reading_progress__sum``.
+    """
+    function: str = None
+
+    def __init__(self, field: str, distinct: bool = False):
+        self.field = field
+        self.distinct = distinct
+
+    @property
+    def default_alias(self) -> str:
+        name = self.function.lower()
+        return name if self.field == '*' else f"{self.field}__{name}"
+
+    def resolve(self, manager) -> str:
+        """SQL expression for this aggregate on ``manager``'s table."""
+        column = '*' if self.field == '*' else manager._get_db_field(self.field)
+        distinct = 'DISTINCT ' if self.distinct else ''
+        return f"{self.function}({distinct}{column})"
+
+    def __repr__(self):
+        distinct = ', distinct=True' if self.distinct else ''
+        return f"{type(self).__name__}({self.field!r}{distinct})"
+
+
+class Count(Aggregate):
+    """Number of rows, or of non-NULL values of ``field``."""
+    function = 'COUNT'
+
+    def __init__(self, field: Optional[str] = '*', distinct: bool = False):
+        if distinct and field == '*':
+            raise ValueError("Count('*') can't be distinct")
+        super().__init__(field or '*', distinct)
+
+
+class Sum(Aggregate):
+    function = 'SUM'
+
+
+class Min(Aggregate):
+    function = 'MIN'
+
+
+class Max(Aggregate):
+    function = 'MAX'
@@ -1,13 +1,28 @@
-from typing import Any
-import pathlib
+from typing import Any, Callable, Optional, Sequence
 import configparser
+import dataclasses
+import functools
+import operator
+import pathlib
 from py_apple_books.models.manager import ModelManager
-from py_apple_books.models.relations import OneToMany, OneToOne, ManyToMany
+from py_apple_books.models.relations import OneToMany, OneToOne, ManyToMany, ReverseRelation
+
+
+_MAPPINGS_PATH = pathlib.Path(__file__).parent / "mappings.ini"
+
+
+@functools.lru_cache(maxsize=None)
+def _load_mappings() -> dict[str, dict[str, str]]:
+    """Parse ``mappings.ini`` once per process."""
+    config = configparser.ConfigParser()
+    config.read(_MAPPINGS_PATH)
+    return {section: dict(config.items(section)) for section in config.sections()}
 
 
 class ModelBase(type):
     def __new__(mcs, name, bases, attrs):
         cls = super().__new__(mcs, name, bases, attrs)
+        cls._row_decoders = {}
         setattr(cls, 'manager', ModelManager(cls))
 
         cls.relations = []
@@ -22,6 +37,7 @@ class ModelBase(type):
                     'extra_filters': dict(value.extra_filters),
                 }
                 cls.relations.append(forward_relation)
+                value.relation = forward_relation
 
                 related_model = value.related_model
                 if not hasattr(related_model, 'relations'):
@@ -36,6 +52,7 @@ class ModelBase(type):
                     'extra_filters': {},
                 }
                 related_model.relations.append(backward_relation)
+                setattr(related_model, value.related_name, ReverseRelation(backward_relation))
 
             elif isinstance(value, ManyToMany):
                 relation_type = value.__class__.__name__
@@ -49,6 +66,7 @@ class ModelBase(type):
                     'extra_filters': dict(value.extra_filters),
                 }
                 cls.relations.append(forward_relation)
+                value.relation = forward_relation
 
                 related_model = value.related_model
                 if not hasattr(related_model, 'relations'):
@@ -63,6 +81,7 @@ class ModelBase(type):
                     'extra_filters': {},
                 }
                 related_model.relations.append(backward_relation)
+                setattr(related_model, value.related_name, ReverseRelation(backward_relation))
 
         return cls
 
@@ -74,19 +93,65 @@ class Model(metaclass=ModelBase):
 
     @classmethod
     def _get_mappings(cls, section: str, keys: list[str] | None = None) -> dict:
-        mappings_path = pathlib.Path(__file__).parent / "mappings.ini"
-        config = configparser.ConfigParser()
-        config.read(mappings_path)
+        mappings = _load_mappings()[section]
         if keys is None:
-            return dict(config.items(section))
-        return {key: config.get(section, key) for key in keys}
+            return dict(mappings)
+        return {key: mappings[key] for key in keys}
+
+    @classmethod
+    def _row_decoder(cls, columns: Optional[Sequence[str]] = None) -> Callable[[Sequence[Any]], 'Model']:
+        """
+        Return a compiled ``row -> model`` constructor for rows whose
+        columns are ``columns`` (all mapped columns, in mapping order,
+        when omitted).
+
+        The decoder is built once per column layout: each dataclass init
+        field is resolved to its index in the row up front, so decoding
+        a row is one index lookup per field and a positional constructor
+        call. Fields whose column isn't selected decode as ``None``.
+        """
+        mappings = _load_mappings()[cls.__name__]
+        key = tuple(columns) if columns is not None else tuple(mappings.values())
+        decoder = cls._row_decoders.get(key)
+        if decoder is not None:
+            return decoder
+
+        position = {column: index for index, column in enumerate(key)}
+        init_fields = [field for field in dataclasses.fields(cls) if field.init]
+        # Trailing unmapped fields (e.g. Annotation.color) keep their
+        # defaults; anything unmapped before the last mapped field needs
+        # an explicit positional value.
+        while init_fields and init_fields[-1].name not in mappings:
+            init_fields.pop()
+        indices = tuple(position.get(mappings.get(field.name)) for field in init_fields)
+
+        if indices and None not in indices:
+            getter = operator.itemgetter(*indices)
+            if len(indices) == 1:
+                def decoder(row):
+                    return cls(getter(row))
+            else:
+                def decoder(row):
+                    return cls(*getter(row))
+        else:
+            defaults = tuple(
+                None if field.default is dataclasses.MISSING else field.default
+                for field in init_fields
+            )
+
+            def decoder(row):
+                return cls(*[
+                    default if index is None else row[index]
+                    for index, default in zip(indices, defaults)
+                ])
+
+        cls._row_decoders[key] = decoder
+        return decoder
 
     @classmethod
-    def from_db(cls, db_data: list[Any]) -> 'Model':
-        fields_len = len(cls._get_mappings(cls.__name__))
-        obj = cls(**dict(zip(cls._get_mappings(cls.__name__).keys(), db_data[:fields_len])))
-        cls.manager.handle_relations(obj)
-        return obj
+    def from_db(cls, db_data: Sequence[Any], columns: Optional[Sequence[str]] = None) -> 'Model':
+        # Relations are resolved lazily on attribute access; see LazyRelation.
+        return cls._row_decoder(columns)(db_data)
 
     @classmethod
     def to_db(cls) -> dict:
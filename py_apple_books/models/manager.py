@@ -1,48 +1,452 @@
+import copy
+import operator
+import re
 from py_apple_books.db import QueryCompiler
-from py_apple_books.db import AppleBooksDBClient
 from py_apple_books.db import Query
-from py_apple_books.db.clause import Where
-from typing import Callable, Any, List
-from functools import partial
+from py_apple_books.db.clause import Clause, Or, Seek, Where
+from py_apple_books.db.client import RowFactory
+from py_apple_books.db.functions import compile_pattern, fold
+from py_apple_books.models.aggregates import Aggregate
+from py_apple_books.models.pagination import Page, decode_token, encode_token
+from py_apple_books.models.predicates import Q
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+
+# Upper bound on ``?`` placeholders per IN query. SQLite builds before
+# 3.32 cap host parameters at 999; stay under that with room for the
+# relation's extra filters.
+MAX_IN_PARAMS = 900
+
+
+def _chunked(values: Sequence[Any], size: int = MAX_IN_PARAMS) -> Iterator[Sequence[Any]]:
+    for start in range(0, len(values), size):
+        yield values[start:start + size]
 
 
 class ModelIterable:
-    def __init__(self, callable: Callable[[], list[Any]], model_class):
-        self.run_query = callable
-        self.model_class = model_class
+    """
+    Lazy, QuerySet-style result set of a :class:`ModelManager` query.
+
+    Nothing runs until the results are needed. The first full evaluation
+    (iteration, ``bool()``, a negative index) caches the models, and every
+    later access is served from that cache. Until then, ``len()`` issues a
+    ``SELECT COUNT(*)`` and indexing or slicing is pushed down into SQL as
+    ``LIMIT``/``OFFSET``, so ``filter(id=...)[0]`` reads a single row.
+    """
+
+    def __init__(self, manager: 'ModelManager', fields: List[str], where: List[Clause] = None,
+                 use_or: bool = False, order_by: str = None, limit: int = None, offset: int = None,
+                 prefetch: Tuple[str, ...] = ()):
+        self.manager = manager
+        self.model_class = manager.model_class
+        self.fields = fields
+        self.where = where or []
+        self.use_or = use_or
+        self.order_by = order_by
+        self.limit = limit
+        self.offset = offset
+        self._prefetch = prefetch
+        self.group_by = None
+        self._result_cache = None
+
+    def _clone(self, **overrides) -> 'ModelIterable':
+        clone = copy.copy(self)
+        clone.__dict__.update(overrides)
+        clone._result_cache = None
+        return clone
+
+    def with_results(self, results: Iterable[Any]) -> 'ModelIterable':
+        """
+        A clone already evaluated to ``results``, for callers that fetched
+        or ordered the matching rows themselves (ranked search hits,
+        batched relation loads).
+        """
+        clone = self._clone()
+        clone._result_cache = list(results)
+        return clone
+
+    def prefetch(self, *names: str) -> 'ModelIterable':
+        """
+        Load the named relations for every result in batches.
+
+        Instead of one query per object on first access, each relation is fetched with one
+        ``IN`` query per chunk of keys when the results are evaluated,
+        and the related objects are stitched onto the models in memory::
+
+            Annotation.manager.filter(style=3).prefetch('book')
+            Collection.manager.all().prefetch('books')
+        """
+        known = {relation['name'] for relation in self.model_class.relations}
+        for name in names:
+            if name not in known:
+                raise ValueError(f"{self.model_class.__name__} has no relation named {name!r}")
+        return self._clone(_prefetch=self._prefetch + tuple(n for n in names if n not in self._prefetch))
+
+    def _row_factory(self) -> Optional[RowFactory]:
+        """
+        sqlite3 row factory turning each row into a result as it comes
+        off the cursor, or ``None`` to keep the plain tuples.
+        """
+        decode = self.model_class._row_decoder(self.fields)
+        return lambda cursor, row: decode(row)
+
+    def _compile(self) -> Tuple[str, tuple]:
+        return Query.select(self.manager.table_name, fields=self.fields, where=self.where,
+                            use_or=self.use_or, order_by=self.order_by, limit=self.limit,
+                            offset=self.offset, group_by=self.group_by)
+
+    def _fetch_all(self) -> list:
+        if self._result_cache is None:
+            query, params = self._compile()
+            results = self.manager.compiler.execute(query, params, row_factory=self._row_factory())
+            if self._prefetch:
+                self.manager.prefetch_related(results, self._prefetch)
+            self._result_cache = results
+        return self._result_cache
 
     def __iter__(self):
-        results = self.run_query()
-        for result in results:
-            yield self.model_class.from_db(result)
+        return iter(self._fetch_all())
+
+    def __bool__(self):
+        return bool(self._fetch_all())
 
     def __len__(self):
-        results = self.run_query()
-        return len(results)
+        return self.count()
+
+    def count(self) -> int:
+        """
+        Number of matching rows — from the cache if the results have been
+        evaluated, otherwise via ``SELECT COUNT(*)``.
+        """
+        if self._result_cache is not None:
+            return len(self._result_cache)
+        query, params = Query.count(self.manager.table_name, where=self.where, use_or=self.use_or,
+                                    limit=self.limit, offset=self.offset, group_by=self.group_by)
+        return self.manager.compiler.execute(query, params)[0][0]
+
+    def exists(self) -> bool:
+        """Whether anything matches, reading at most one row."""
+        if self._result_cache is not None:
+            return bool(self._result_cache)
+        window = self._window(0, 1)
+        query, params = Query.select(self.manager.table_name, fields='1', where=self.where,
+                                     use_or=self.use_or, limit=window.limit, offset=window.offset,
+                                     group_by=self.group_by)
+        return bool(self.manager.compiler.execute(query, params))
+
+    def aggregate(self, *args: Aggregate, **kwargs: Aggregate) -> Dict[str, Any]:
+        """
+        Compute aggregates over the matching rows in one query::
+
+            Book.manager.filter(is_finished=True).aggregate(Count('*'), Max('reading_progress'))
+            # {'count': 1, 'reading_progress__max': 1.0}
 
-    def __getitem__(self, index: int) -> Any:
-        results = self.run_query()
-        return self.model_class.from_db(results[index])
+        Positional aggregates are keyed by their default alias.
+        """
+        aggregates = self._named_aggregates(args, kwargs)
+        if not aggregates:
+            return {}
+        expressions = [aggregate.resolve(self.manager) for aggregate in aggregates.values()]
+        query, params = Query.aggregate(self.manager.table_name, expressions, where=self.where,
+                                        use_or=self.use_or, limit=self.limit, offset=self.offset,
+                                        order_by=self.order_by)
+        row = self.manager.compiler.execute(query, params)[0]
+        return dict(zip(aggregates, row))
+
+    @staticmethod
+    def _named_aggregates(args: Sequence[Aggregate], kwargs: Dict[str, Aggregate]) -> Dict[str, Aggregate]:
+        aggregates = {}
+        for aggregate in args:
+            aggregates[aggregate.default_alias] = aggregate
+        aggregates.update(kwargs)
+        for alias, aggregate in aggregates.items():
+            if not isinstance(aggregate, Aggregate):
+                raise TypeError(f"{alias!r} is not an aggregate: {aggregate!r}")
+        return aggregates
+
+    def in_bulk(self, ids: Iterable[Any], field: str = 'id') -> Dict[Any, Any]:
+        """
+        Matching results whose ``field`` is in ``ids``, as a dict keyed by
+        that value. ``field`` should be unique (the id, an asset id).
+
+        Runs one ``IN (?, ?, ...)`` query per chunk of ids, sized so the
+        query stays under SQLite's host-parameter limit together with
+        this iterable's own filters. Ids that match nothing are absent
+        from the result. After :meth:`values` or :meth:`values_list` the
+        rows are keyed the same way, and ``field`` must be one of the
+        selected fields.
+        """
+        if self.limit is not None or self.offset:
+            raise ValueError("in_bulk() can't be combined with limit, offset or slicing")
+        key = self._bulk_key(field)
+        ids = list(dict.fromkeys(ids))
+        if not ids:
+            return {}
+        column = self.manager._get_db_field(field)
+        where = [Or(self.where)] if self.use_or and self.where else list(self.where)
+        chunk_size = max(MAX_IN_PARAMS - sum(len(clause.params) for clause in where), 1)
+        results = {}
+        for chunk in _chunked(ids, chunk_size):
+            batch = self._clone(where=where + [Where(column, list(chunk), operator='IN')], use_or=False)
+            for obj in batch:
+                results[key(obj)] = obj
+        return results
+
+    def _bulk_key(self, field: str) -> Callable[[Any], Any]:
+        """How :meth:`in_bulk` reads ``field`` back off a result."""
+        return operator.attrgetter(field)
+
+    def values(self, *fields: str) -> 'ValuesIterable':
+        """
+        Rows as ``{field: value}`` dicts instead of models. Defaults to
+        every mapped field. Follow with :meth:`ValuesIterable.annotate`
+        to group by ``fields``.
+        """
+        return self._values(ValuesIterable, fields)
+
+    def values_list(self, *fields: str, flat: bool = False) -> 'ValuesListIterable':
+        """
+        Rows as tuples of ``fields`` (every mapped field by default), or
+        with ``flat=True`` and a single field, just its values::
+
+            Annotation.manager.filter(type=1).values_list('asset_id', 'selected_text')
+            Book.manager.values_list('title', flat=True)
+        """
+        return self._values(ValuesListIterable, fields, flat=flat)
+
+    def _values(self, cls, fields: Sequence[str], **options) -> 'ValuesIterable':
+        # Only the requested columns are selected, and rows never become
+        # models: no dataclass, no __post_init__ conversions, no relations.
+        names = list(fields) or list(self.manager.field_map)
+        columns = [self.manager._get_db_field(name) for name in names]
+        return cls(self.manager, fields=columns, names=names, where=self.where,
+                   use_or=self.use_or, order_by=self.order_by, limit=self.limit,
+                   offset=self.offset, **options)
+
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        if self._result_cache is not None:
+            return self._result_cache[index]
+
+        if isinstance(index, slice):
+            start, stop, step = index.start, index.stop, index.step
+            if (step not in (None, 1) or (start is not None and start < 0)
+                    or (stop is not None and stop < 0)):
+                return self._fetch_all()[index]
+            return self._window(start or 0, stop)
+
+        if not isinstance(index, int):
+            raise TypeError(f"indices must be integers or slices, not {type(index).__name__}")
+        if index < 0:
+            return self._fetch_all()[index]
+        results = list(self._window(index, index + 1))
+        if not results:
+            raise IndexError("ModelIterable index out of range")
+        return results[0]
+
+    def _window(self, start: int, stop: Optional[int]) -> 'ModelIterable':
+        """Narrow the current LIMIT/OFFSET window to ``[start:stop]``."""
+        offset = (self.offset or 0) + start
+        limit = None if stop is None else max(stop - start, 0)
+        if self.limit is not None:
+            remaining = max(self.limit - start, 0)
+            limit = remaining if limit is None else min(limit, remaining)
+        return self._clone(limit=limit, offset=offset or None)
+
+    def paginate(self, order_by: Optional[str] = None, page_size: int = 100,
+                 after: Optional[str] = None) -> Page:
+        """
+        One page of results in keyset (seek) order.
+
+        Rows are ordered by ``order_by`` (``-`` prefix for descending;
+        defaults to the iterable's own ordering, else ``modification_date``
+        where the model has one, else ``id``) with the primary key as
+        tiebreaker, and each page starts with a
+        ``(key, pk) > (?, ?)`` predicate on the last row of the previous
+        one instead of an OFFSET — so page 1000 costs the same as page 1.
+        Pass the returned :attr:`Page.next_token` as ``after`` to continue::
+
+            page = Annotation.manager.filter(type=1).paginate(page_size=500)
+            while page.has_next:
+                page = Annotation.manager.filter(type=1).paginate(page_size=500, after=page.next_token)
+        """
+        if page_size < 1:
+            raise ValueError("page_size must be a positive integer")
+        if self.limit is not None or self.offset or self.group_by:
+            raise ValueError("paginate() can't be combined with limit, offset, slicing or annotate()")
+        if self.order_by:
+            own = self._order_by_field()
+            if order_by is not None and order_by != own:
+                raise ValueError(f"paginate(order_by={order_by!r}) conflicts with this iterable's "
+                                 f"ordering {own!r}")
+            order_by = own
+        elif order_by is None:
+            order_by = 'modification_date' if 'modification_date' in self.manager.field_map else 'id'
+        descending = order_by.startswith('-')
+        key = self.manager._get_db_field(order_by.lstrip('-'))
+        pk = self.manager._get_db_field('id')
+        direction = ' DESC' if descending else ''
+        order = f"{key}{direction}" if key == pk else f"{key}{direction}, {pk}{direction}"
+
+        where = list(self.where)
+        if self.use_or and where:
+            where = [Or(where)]
+        if after is not None:
+            key_value, pk_value = decode_token(after, order_by)
+            where.append(Seek(key, pk, key_value, pk_value, descending=descending))
+
+        # The raw key and pk ride along at the end of each row for the
+        # next token; datetimes etc. on the model don't round-trip.
+        query, params = Query.select(self.manager.table_name, fields=list(self.fields) + [key, pk],
+                                     where=where, order_by=order, limit=page_size + 1)
+        factory = self._row_factory()
+
+        def page_row(cursor, row):
+            result = row[:-2] if factory is None else factory(cursor, row[:-2])
+            return result, row[-2], row[-1]
+
+        rows = self.manager.compiler.execute(query, params, row_factory=page_row)
+        items = [result for result, _, _ in rows[:page_size]]
+        if self._prefetch:
+            self.manager.prefetch_related(items, self._prefetch)
+        next_token = None
+        if len(rows) > page_size:
+            _, key_value, pk_value = rows[page_size - 1]
+            next_token = encode_token(order_by, key_value, pk_value)
+        return Page(items=items, next_token=next_token)
+
+    def _order_by_field(self) -> str:
+        """This iterable's ORDER BY as a ``[-]field`` name, for paginate()."""
+        column, _, direction = self.order_by.partition(' ')
+        fields = [field for field, db_field in self.manager.field_map.items() if db_field == column]
+        if not fields or direction not in ('', 'DESC'):
+            raise ValueError(f"paginate() can't page in the order {self.order_by!r}")
+        return ('-' if direction else '') + fields[0]
+
+    def iterator(self, chunk_size: int = 2000) -> Iterator[Any]:
+        """
+        Stream models without materializing the whole result set.
+
+        Rows are pulled from a dedicated cursor ``chunk_size`` at a time
+        and turned into models as they arrive, so peak memory stays flat
+        no matter how many rows match. Streamed results are not cached.
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be a positive integer")
+        if self._result_cache is not None:
+            yield from self._result_cache
+            return
+        query, params = self._compile()
+        results = self.manager.compiler.iterate(query, params, chunk_size=chunk_size,
+                                                row_factory=self._row_factory())
+        if not self._prefetch:
+            yield from results
+            return
+        # Prefetch a chunk's worth of relations at a time.
+        batch = []
+        for result in results:
+            batch.append(result)
+            if len(batch) >= chunk_size:
+                self.manager.prefetch_related(batch, self._prefetch)
+                yield from batch
+                batch = []
+        if batch:
+            self.manager.prefetch_related(batch, self._prefetch)
+            yield from batch
+
+
+class ValuesIterable(ModelIterable):
+    """
+    A :class:`ModelIterable` yielding plain dicts, built by
+    :meth:`ModelIterable.values`.
+
+    :meth:`annotate` adds aggregate columns and groups by the selected
+    fields, so per-group statistics come straight out of SQL::
+
+        Annotation.manager.filter(type=1).values('asset_id').annotate(Count('*'))
+        # [{'asset_id': 'ASSET1', 'count': 3}, ...]
+    """
+
+    def __init__(self, manager: 'ModelManager', fields: List[str], names: List[str], **kwargs):
+        super().__init__(manager, fields, **kwargs)
+        self.names = names
+
+    def prefetch(self, *names: str) -> 'ModelIterable':
+        raise TypeError("prefetch() can't be combined with values()")
+
+    def annotate(self, *args: Aggregate, **kwargs: Aggregate) -> 'ValuesIterable':
+        aggregates = self._named_aggregates(args, kwargs)
+        clashes = set(aggregates) & set(self.names)
+        if clashes:
+            raise ValueError(f"annotation names clash with selected fields: {sorted(clashes)}")
+        group_by = self.group_by or list(self.fields)
+        return self._clone(
+            fields=self.fields + [aggregate.resolve(self.manager) for aggregate in aggregates.values()],
+            names=self.names + list(aggregates),
+            group_by=group_by or None,
+        )
+
+    def _bulk_key(self, field: str) -> Callable[[Any], Any]:
+        if field not in self.names:
+            raise TypeError(f"in_bulk() field {field!r} must be one of the selected fields {self.names}")
+        return operator.itemgetter(field)
+
+    def _row_factory(self) -> Optional[RowFactory]:
+        names = self.names
+        return lambda cursor, row: dict(zip(names, row))
+
+
+class ValuesListIterable(ValuesIterable):
+    """
+    A :class:`ValuesIterable` yielding tuples — the rows exactly as
+    sqlite3 returns them, so nothing is built per row at all — or,
+    with ``flat=True``, the bare values of its single field.
+    """
+
+    def __init__(self, manager: 'ModelManager', fields: List[str], names: List[str],
+                 flat: bool = False, **kwargs):
+        if flat and len(names) != 1:
+            raise TypeError("values_list(flat=True) takes exactly one field")
+        super().__init__(manager, fields, names, **kwargs)
+        self.flat = flat
+
+    def annotate(self, *args: Aggregate, **kwargs: Aggregate) -> 'ValuesIterable':
+        if self.flat:
+            raise TypeError("annotate() can't be combined with values_list(flat=True)")
+        return super().annotate(*args, **kwargs)
+
+    def _bulk_key(self, field: str) -> Callable[[Any], Any]:
+        super()._bulk_key(field)
+        if self.flat:
+            return lambda value: value
+        return operator.itemgetter(self.names.index(field))
+
+    def _row_factory(self) -> Optional[RowFactory]:
+        if self.flat:
+            return lambda cursor, row: row[0]
+        return None
 
 
 class ModelManager:
+    # Shared by every manager. It talks to the process-wide default
+    # client, which only connects when the first query runs.
+    compiler = QueryCompiler()
+
     def __init__(self, model_class):
         self.model_class = model_class
-        self.compiler = QueryCompiler(AppleBooksDBClient())
 
         self.model_name = self.model_class.__name__
         self.table_name = None
+        # model field name -> db column, resolved once per model class
+        self.field_map = {}
         if self.model_name != 'Model':
             self.table_name = self.model_class._get_mappings('Tables')[self.model_name.lower()]
-
-    def _create_callable(self, query: str) -> Callable[[], list[Any]]:
-        return partial(self.compiler.execute, query)
+            self.field_map = self.model_class._get_mappings(self.model_name)
 
     def _get_db_field(self, field: str) -> str:
-        return self.model_class._get_mappings(self.model_name)[field]
+        return self.field_map[field]
 
     def _get_fields(self, only: List[str] = None) -> List[str]:
-        fields = list(self.model_class._get_mappings(self.model_name).values())
+        fields = list(self.field_map.values())
         if only:
             fields = [field for field in fields if field in only]
         return fields
@@ -51,97 +455,228 @@ class ModelManager:
         if order_by:
             field = order_by[1:] if order_by.startswith('-') else order_by
             direction = ' DESC' if order_by.startswith('-') else ''
-            order_by = self.model_class._get_mappings(self.model_name)[field] + direction
+            order_by = self.field_map[field] + direction
         return order_by
 
     def all(self, only: List[str] = None, limit: int = None, order_by: str = None) -> ModelIterable:
         fields = self._get_fields(only)
         order_by = self._format_order_by(order_by)
-        query = Query.select(self.table_name, fields=fields, limit=limit, order_by=order_by)
-        return ModelIterable(callable=self._create_callable(query), model_class=self.model_class)
+        return ModelIterable(self, fields=fields, limit=limit or None, order_by=order_by)
 
-    def filter(self, only: List[str] = None, use_or: bool = False, limit: int = None,
+    def _build_where(self, lookup: str, value: Any) -> Where:
+        """Turn one ``field__lookup=value`` keyword into a WHERE clause."""
+        if lookup.endswith('__icontains'):
+            # FOLD() is registered on every connection; LIKE alone only
+            # ignores case for ASCII.
+            db_field = self._get_db_field(lookup.split('__')[0])
+            needle = fold(value).replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+            return Where(f"FOLD({db_field})", f'%{needle}%', operator='LIKE', escape='\\')
+        elif lookup.endswith('__regex') or lookup.endswith('__iregex'):
+            pattern = value if lookup.endswith('__regex') else f'(?i){value}'
+            try:
+                compile_pattern(pattern)
+            except re.error as e:
+                raise ValueError(f"Invalid regular expression {value!r}: {e}")
+            return Where(self._get_db_field(lookup.split('__')[0]), pattern, operator='REGEXP')
+        elif lookup.endswith('__contains'):
+            return Where(self._get_db_field(lookup.split('__')[0]), f'%{value}%', operator='LIKE')
+        elif lookup.endswith('__in'):
+            return Where(self._get_db_field(lookup.split('__')[0]), value, operator='IN')
+        elif lookup.endswith('__gt'):
+            return Where(self._get_db_field(lookup.split('__')[0]), value, operator='>')
+        elif lookup.endswith('__gte'):
+            return Where(self._get_db_field(lookup.split('__')[0]), value, operator='>=')
+        elif lookup.endswith('__lt'):
+            return Where(self._get_db_field(lookup.split('__')[0]), value, operator='<')
+        elif lookup.endswith('__lte'):
+            return Where(self._get_db_field(lookup.split('__')[0]), value, operator='<=')
+        elif lookup.endswith('__ne'):
+            return Where(self._get_db_field(lookup.split('__')[0]), value, operator='!=')
+        elif lookup.endswith('__isnull'):
+            db_field = self._get_db_field(lookup.split('__')[0])
+            if value:
+                return Where(db_field, 'NULL', operator='IS')
+            return Where(db_field, 'NULL', operator='IS NOT')
+        return Where(self._get_db_field(lookup), value, operator='=')
+
+    def filter(self, *predicates: Q, only: List[str] = None, use_or: bool = False, limit: int = None,
                order_by: str = None, **filters) -> ModelIterable:
+        """
+        Rows matching every predicate and keyword lookup.
+
+        Positional :class:`~py_apple_books.models.predicates.Q` objects
+        carry arbitrarily nested AND/OR/NOT logic; each compiles to a
+        single parenthesized clause alongside the keyword lookups.
+        ``use_or`` ORs the top-level clauses instead of ANDing them.
+        """
         fields = self._get_fields(only)
 
-        where_clauses = []
-        for field, value in filters.items():
-            if field.endswith('__contains'):
-                where_clauses.append(Where(self._get_db_field(field.split('__')[0]), f'%{value}%', operator='LIKE'))
-            elif field.endswith('__in'):
-                where_clauses.append(Where(self._get_db_field(field.split('__')[0]), value, operator='IN'))
-            elif field.endswith('__gt'):
-                where_clauses.append(Where(self._get_db_field(field.split('__')[0]), value, operator='>'))
-            elif field.endswith('__gte'):
-                where_clauses.append(Where(self._get_db_field(field.split('__')[0]), value, operator='>='))
-            elif field.endswith('__lt'):
-                where_clauses.append(Where(self._get_db_field(field.split('__')[0]), value, operator='<'))
-            elif field.endswith('__lte'):
-                where_clauses.append(Where(self._get_db_field(field.split('__')[0]), value, operator='<='))
-            elif field.endswith('__ne'):
-                where_clauses.append(Where(self._get_db_field(field.split('__')[0]), value, operator='!='))
-            elif field.endswith('__isnull'):
-                db_field = self._get_db_field(field.split('__')[0])
-                if value:
-                    where_clauses.append(Where(db_field, 'NULL', operator='IS'))
-                else:
-                    where_clauses.append(Where(db_field, 'NULL', operator='IS NOT'))
-            else:
-                where_clauses.append(Where(self._get_db_field(field), value, operator='='))
+        where_clauses = [predicate.resolve(self) for predicate in predicates]
+        where_clauses += [self._build_where(field, value) for field, value in filters.items()]
 
         order_by = self._format_order_by(order_by)
-        query = Query.select(self.table_name, fields=fields, where=where_clauses, use_or=use_or,
-                             limit=limit, order_by=order_by)
-        return ModelIterable(callable=self._create_callable(query), model_class=self.model_class)
+        return ModelIterable(self, fields=fields, where=where_clauses, use_or=use_or,
+                             limit=limit or None, order_by=order_by)
+
+    def count(self) -> int:
+        return self.all().count()
+
+    def exists(self) -> bool:
+        return self.all().exists()
+
+    def aggregate(self, *args: Aggregate, **kwargs: Aggregate) -> Dict[str, Any]:
+        return self.all().aggregate(*args, **kwargs)
+
+    def values(self, *fields: str) -> ValuesIterable:
+        return self.all().values(*fields)
+
+    def in_bulk(self, ids: Iterable[Any], field: str = 'id') -> Dict[Any, Any]:
+        return self.all().in_bulk(ids, field=field)
 
-    def handle_relations(self, model_object):
+    def paginate(self, order_by: Optional[str] = None, page_size: int = 100,
+                 after: Optional[str] = None) -> Page:
+        return self.all().paginate(order_by=order_by, page_size=page_size, after=after)
+
+    def values_list(self, *fields: str, flat: bool = False) -> ValuesListIterable:
+        return self.all().values_list(*fields, flat=flat)
+
+    def get_related(self, model_object, relation: dict) -> Any:
         """
-        Handle the relations for a model object.
+        Resolve one relation for a model object.
+
+        Called by the relation descriptors on first attribute access.
+        To-many relations resolve to a lazy :class:`ModelIterable`;
+        to-one relations to the related object, or ``None``.
         """
+        related_model = relation['related_model']
+        extra = relation.get('extra_filters', {}) or {}
+
+        # handle one-to-many relations
+        if relation['type'] == 'OneToMany':
+            foreign_key = relation['foreign_key']
+            val = getattr(model_object, foreign_key)
+            return related_model.manager.filter(**{foreign_key: val, **extra})
+
+        # handle many-to-one and one-to-one relations
+        if relation['type'] in ('ManyToOne', 'OneToOne'):
+            foreign_key = relation['foreign_key']
+            val = getattr(model_object, foreign_key)
+            try:
+                return related_model.manager.filter(**{foreign_key: val, **extra})[0]
+            except IndexError:
+                return None
+
+        # handle many-to-many relations
+        if relation['type'] == 'ManyToMany':
+            related_ids = self.get_related_ids(model_object, relation)
+            return related_model.manager.filter(
+                **{f"{relation['to_key']}__in": related_ids, **extra}
+            )
+
+        raise ValueError(f"Unknown relation type {relation['type']!r}")
+
+    def _get_relation(self, name: str) -> dict:
         for relation in self.model_class.relations:
+            if relation['name'] == name:
+                return relation
+        raise ValueError(f"{self.model_name} has no relation named {name!r}")
+
+    def _fetch_in(self, related_model, key: str, values: Sequence[Any], extra: dict) -> list:
+        """
+        Fetch ``related_model`` rows whose ``key`` is in ``values``, one
+        IN query per chunk so large key sets stay under SQLite's
+        host-parameter limit.
+        """
+        results = []
+        for chunk in _chunked(list(values)):
+            results.extend(related_model.manager.filter(**{f"{key}__in": list(chunk), **extra}))
+        return results
+
+    def _related_iterable(self, related_model, filters: dict, results: list) -> ModelIterable:
+        """An already-evaluated ModelIterable equivalent to ``filter(**filters)``."""
+        return related_model.manager.filter(**filters).with_results(results)
+
+    def prefetch_related(self, model_objects: List[Any], names: Iterable[str]) -> None:
+        """
+        Resolve the named relations for all ``model_objects`` at once.
+
+        Each relation costs one query per chunk of distinct keys (plus
+        one per chunk against the join table for many-to-many), instead
+        of one query per object. Results are stored exactly where the
+        lazy relation descriptors would memoize them.
+        """
+        if not model_objects:
+            return
+        for name in names:
+            relation = self._get_relation(name)
+            related_model = relation['related_model']
             extra = relation.get('extra_filters', {}) or {}
 
-            # handle one-to-many relations
-            if relation['type'] == 'OneToMany':
-                related_model = relation['related_model']
+            if relation['type'] in ('OneToMany', 'ManyToOne', 'OneToOne'):
                 foreign_key = relation['foreign_key']
-                val = getattr(model_object, foreign_key)
-                setattr(model_object, relation['name'],
-                        related_model.manager.filter(**{foreign_key: val, **extra}))
+                keys = list(dict.fromkeys(
+                    getattr(obj, foreign_key) for obj in model_objects
+                    if getattr(obj, foreign_key) is not None
+                ))
+                # The reverse side of the relation is the object we're
+                # prefetching for; hand it over instead of a lookup.
+                reverse = tuple(
+                    r['name'] for r in related_model.relations
+                    if r['related_model'] is self.model_class and r.get('foreign_key') == foreign_key
+                )
+                grouped = {}
+                for related in self._fetch_in(related_model, foreign_key, keys, extra):
+                    grouped.setdefault(getattr(related, foreign_key), []).append(related)
+
+                for obj in model_objects:
+                    val = getattr(obj, foreign_key)
+                    matches = grouped.get(val, [])
+                    if relation['type'] == 'OneToMany':
+                        for related in matches:
+                            for reverse_name in reverse:
+                                setattr(related, reverse_name, obj)
+                        setattr(obj, name, self._related_iterable(
+                            related_model, {foreign_key: val, **extra}, matches))
+                    else:
+                        setattr(obj, name, matches[0] if matches else None)
 
-            # handle many-to-one relations
-            elif relation['type'] == 'ManyToOne':
-                related_model = relation['related_model']
-                foreign_key = relation['foreign_key']
-                val = getattr(model_object, foreign_key)
-                try:
-                    setattr(model_object, relation['name'],
-                            related_model.manager.filter(**{foreign_key: val, **extra})[0])
-                except IndexError:
-                    setattr(model_object, relation['name'], None)
-
-            # handle one-to-one relations
-            elif relation['type'] == 'OneToOne':
-                related_model = relation['related_model']
-                foreign_key = relation['foreign_key']
-                val = getattr(model_object, foreign_key)
-                try:
-                    setattr(model_object, relation['name'],
-                            related_model.manager.filter(**{foreign_key: val, **extra})[0])
-                except IndexError:
-                    setattr(model_object, relation['name'], None)
-
-            # handle many-to-many relations
             elif relation['type'] == 'ManyToMany':
-                related_ids = self.get_related_ids(model_object, relation)
-                related_model = relation['related_model']
-                setattr(
-                    model_object,
-                    relation['name'],
-                    related_model.manager.filter(
-                        **{f"{relation['to_key']}__in": related_ids, **extra}
-                    ),
-                )
+                from_values = list(dict.fromkeys(
+                    getattr(obj, relation['from_key']) for obj in model_objects
+                ))
+                related_ids = {}
+                for from_value, to_value in self._get_related_id_pairs(relation, from_values):
+                    related_ids.setdefault(from_value, []).append(to_value)
+
+                to_key = relation['to_key']
+                all_ids = list(dict.fromkeys(i for ids in related_ids.values() for i in ids))
+                grouped = {}
+                for position, related in enumerate(self._fetch_in(related_model, to_key, all_ids, extra)):
+                    grouped.setdefault(getattr(related, to_key), []).append((position, related))
+
+                for obj in model_objects:
+                    ids = related_ids.get(getattr(obj, relation['from_key']), [])
+                    # keep the order a plain ``to_key__in`` filter would return
+                    matches = [related for _, related in sorted(
+                        pair for key in set(ids) for pair in grouped.get(key, [])
+                    )]
+                    setattr(obj, name, self._related_iterable(
+                        related_model, {f"{to_key}__in": ids, **extra}, matches))
+
+    def _get_related_id_pairs(self, relation: dict, values: Sequence[Any]) -> list[tuple]:
+        """
+        ``(from_value, to_value)`` rows of a many-to-many join table for
+        every ``from_value`` in ``values``.
+        """
+        join_table = self.model_class._get_mappings('Tables')[relation['join_table']]
+        from_key = self.model_class._get_mappings(relation['join_table'])[relation['from_key']]
+        to_key = self.model_class._get_mappings(relation['join_table'])[relation['to_key']]
+        pairs = []
+        for chunk in _chunked(list(values)):
+            query, params = Query.select(join_table, fields=[from_key, to_key],
+                                         where=[Where(from_key, list(chunk), operator='IN')])
+            pairs.extend(self.compiler.execute(query, params))
+        return pairs
 
     def get_related_ids(self, model_object, relation: dict) -> list[str]:
         """
@@ -153,8 +688,8 @@ class ModelManager:
         to_key = self.model_class._get_mappings(relation['join_table'])[relation['to_key']]
         val = getattr(model_object, relation['from_key'])
 
-        query = Query.select(join_table, fields=[to_key], where=[Where(from_key, val, operator='=')])
-        related_ids = self.compiler.execute(query)
+        query, params = Query.select(join_table, fields=[to_key], where=[Where(from_key, val, operator='=')])
+        related_ids = self.compiler.execute(query, params)
         return [row[0] for row in related_ids]
 
     # TODO
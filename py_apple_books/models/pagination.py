@@ -0,0 +1,47 @@
+import base64
+import binascii
+import json
+from dataclasses import dataclass
+from typing import Any, Generic, List, Optional, Tuple, TypeVar
+
+T = TypeVar('T')
+
+
+@dataclass
+class Page(Generic[T]):
+    """One page of a keyset-paginated query.
+
+    ``next_token`` is ``None`` on the last page; otherwise pass it as
+    ``after=`` to fetch the next one.
+    """
+    items: List[T]
+    next_token: Optional[str] = None
+
+    @property
+    def has_next(self) -> bool:
+        return self.next_token is not None
+
+    def __iter__(self):
+        return iter(self.items)
+
+    def __len__(self):
+        return len(self.items)
+
+
+def encode_token(order_by: str, key: Any, pk: Any) -> str:
+    """Opaque continuation token for the position ``(key, pk)``."""
+    payload = json.dumps([order_by, key, pk], separators=(',', ':'))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip('=')
+
+
+def decode_token(token: str, order_by: str) -> Tuple[Any, Any]:
+    """``(key, pk)`` from a token made by :func:`encode_token` for ``order_by``."""
+    try:
+        padded = token + '=' * (-len(token) % 4)
+        token_order, key, pk = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (ValueError, TypeError, binascii.Error):
+        raise ValueError(f"Invalid pagination token: {token!r}")
+    if token_order != order_by:
+        raise ValueError(f"Pagination token was issued for order_by={token_order!r}, "
+                         f"not {order_by!r}")
+    return key, pk
@@ -0,0 +1,62 @@
+from typing import Any, Union
+from py_apple_books.db.clause import And, Clause, Not, Or
+
+
+class Q:
+    """
+    A composable filter predicate.
+
+    Keyword lookups are the same as :meth:`ModelManager.filter
+    <py_apple_books.models.manager.ModelManager.filter>` takes and are
+    ANDed together. Predicates combine with ``&``, ``|`` and ``~`` into
+    a tree that compiles to one nested SQL ``WHERE`` expression::
+
+        Annotation.manager.filter(
+            Q(selected_text__contains=text) | Q(note__contains=text),
+            type__ne=3,
+        )
+    """
+    AND = 'AND'
+    OR = 'OR'
+
+    def __init__(self, *children: 'Q', _connector: str = AND, _negated: bool = False, **lookups: Any):
+        for child in children:
+            if not isinstance(child, Q):
+                raise TypeError(f"Q() positional arguments must be Q objects, not {type(child).__name__}")
+        self.children: list[Union['Q', tuple[str, Any]]] = [*children, *lookups.items()]
+        self.connector = _connector
+        self.negated = _negated
+
+    def _combine(self, other: 'Q', connector: str) -> 'Q':
+        if not isinstance(other, Q):
+            return NotImplemented
+        # (a | b) | c  ->  (a | b | c)
+        children = [
+            child for q in (self, other)
+            for child in (q.children if q.connector == connector and not q.negated else [q])
+        ]
+        combined = Q(_connector=connector)
+        combined.children = children
+        return combined
+
+    def __and__(self, other: 'Q') -> 'Q':
+        return self._combine(other, self.AND)
+
+    def __or__(self, other: 'Q') -> 'Q':
+        return self._combine(other, self.OR)
+
+    def __invert__(self) -> 'Q':
+        return Q(self, _negated=True)
+
+    def __repr__(self):
+        children = ', '.join(repr(child) if isinstance(child, Q) else f"{child[0]}={child[1]!r}"
+                             for child in self.children)
+        text = f"({self.connector}: {children})"
+        return f"<Q: NOT {text}>" if self.negated else f"<Q: {text}>"
+
+    def resolve(self, manager) -> Clause:
+        """Compile to a clause tree, resolving field names through ``manager``."""
+        clauses = [child.resolve(manager) if isinstance(child, Q) else manager._build_where(*child)
+                   for child in self.children]
+        clause = Or(clauses) if self.connector == self.OR else And(clauses)
+        return Not(clause) if self.negated else clause
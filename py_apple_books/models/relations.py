@@ -3,8 +3,37 @@ from typing import TypeVar, Type, Optional, Mapping, Any
 T = TypeVar('T')
 
 
+class LazyRelation:
+    """
+    Descriptor that resolves a relation the first time it's read.
+
+    Building a model from a row runs no relation queries; the related
+    object (or :class:`ModelIterable`) is looked up on first attribute
+    access and stored on the instance. Being a non-data descriptor, the
+    stored value shadows the descriptor from then on, and prefetching
+    can pre-populate it with a plain ``setattr``.
+    """
+
+    # Relation spec built by ModelBase (name, type, keys, filters).
+    relation: Optional[dict] = None
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        value = type(instance).manager.get_related(instance, self.relation)
+        instance.__dict__[self.relation['name']] = value
+        return value
+
+
+class ReverseRelation(LazyRelation):
+    """The backward side of a relation, installed on the related model."""
+
+    def __init__(self, relation: dict):
+        self.relation = relation
+
+
 # TODO: add validations
-class Relation:
+class Relation(LazyRelation):
     def __init__(
         self,
         related_model: Type[T],
@@ -0,0 +1,251 @@
+"""Full-text search over annotation text through a sidecar FTS5 index.
+
+Apple's databases can't be given indexes of our own, so ``LIKE '%x%'``
+searches scan every annotation, match case-sensitively outside ASCII and
+come back unranked. :class:`AnnotationSearchIndex` keeps a separate
+SQLite file with an FTS5 table over ``selected_text``,
+``representative_text`` and ``note``, keyed by the annotation's
+``Z_PK``, and answers searches from it ranked by BM25.
+
+The index is synced incrementally: it remembers the
+``(modification_date, Z_PK)`` position of the last annotation it saw and
+only reads annotations modified after it. Annotations removed from the
+Apple database outright (rather than soft-deleted) leave no
+modification trail, so each sync also compares row counts and, on a
+mismatch, drops index rows whose annotation is gone. Reading-position
+bookmarks and soft-deleted annotations are never indexed.
+"""
+
+import json
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, List, Optional, Sequence, Tuple, Union
+
+from py_apple_books.db import Query
+from py_apple_books.db.clause import Or, Seek, Where
+from py_apple_books.exceptions import AppleBooksError
+from py_apple_books.models import Annotation
+from py_apple_books.models.manager import ModelIterable
+
+DEFAULT_INDEX_PATH = Path.home() / "Library/Caches/py_apple_books/annotation_index.sqlite"
+
+SEARCH_FIELDS = ('selected_text', 'representative_text', 'note')
+
+# Match modes for :meth:`AnnotationSearchIndex.search`.
+WORDS = 'words'
+PREFIX = 'prefix'
+PHRASE = 'phrase'
+RAW = 'raw'
+
+_READING_BOOKMARK = 3
+
+_SCHEMA = f"""
+CREATE VIRTUAL TABLE IF NOT EXISTS annotation_fts USING fts5(
+    {', '.join(SEARCH_FIELDS)},
+    tokenize = 'unicode61 remove_diacritics 2',
+    prefix = '2 3'
+);
+CREATE TABLE IF NOT EXISTS sync_state (key TEXT PRIMARY KEY, value TEXT);
+"""
+
+
+def _quote(term: str) -> str:
+    return '"' + term.replace('"', '""') + '"'
+
+
+def build_match(text: str, mode: str = WORDS, fields: Optional[Sequence[str]] = None) -> str:
+    """
+    FTS5 ``MATCH`` expression for user text.
+
+    ``words`` requires every word; ``prefix`` also lets the last word be
+    a prefix (search-as-you-type); ``phrase`` requires the words
+    adjacent and in order; ``raw`` passes FTS5 query syntax through.
+    """
+    if mode == RAW:
+        expression = text
+    else:
+        words = text.split()
+        if not words:
+            raise ValueError("search text is empty")
+        if mode == PHRASE:
+            expression = _quote(' '.join(words))
+        elif mode in (WORDS, PREFIX):
+            terms = [_quote(word) for word in words]
+            if mode == PREFIX:
+                terms[-1] += '*'
+            expression = ' '.join(terms)
+        else:
+            raise ValueError(f"unknown search mode {mode!r}")
+    if fields:
+        unknown = set(fields) - set(SEARCH_FIELDS)
+        if unknown:
+            raise ValueError(f"not searchable: {sorted(unknown)}")
+        expression = f"{{{' '.join(fields)}}} : ({expression})"
+    return expression
+
+
+class AnnotationSearchIndex:
+    """
+    Sidecar FTS5 index of annotation text. See the module docstring.
+
+    Searches sync first whenever the Apple database has changed since
+    the last sync, so results are never stale; call :meth:`sync`
+    yourself to move that cost off the first search.
+    """
+
+    def __init__(self, path: Union[str, Path, None] = None, batch_size: int = 2000):
+        self.path = Path(path) if path is not None else DEFAULT_INDEX_PATH
+        self.batch_size = batch_size
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.RLock()
+        self._synced_token: Any = None
+
+    @property
+    def manager(self):
+        return Annotation.manager
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            try:
+                conn.executescript(_SCHEMA)
+            except sqlite3.OperationalError as e:
+                conn.close()
+                raise AppleBooksError(f"SQLite FTS5 is not available: {e}")
+            self._conn = conn
+        return self._conn
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+            self._synced_token = None
+
+    def __enter__(self) -> 'AnnotationSearchIndex':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    # -- sync --
+    def _state(self, conn: sqlite3.Connection, key: str) -> Any:
+        row = conn.execute("SELECT value FROM sync_state WHERE key = ?", (key,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def _set_state(self, conn: sqlite3.Connection, key: str, value: Any) -> None:
+        conn.execute("INSERT OR REPLACE INTO sync_state (key, value) VALUES (?, ?)",
+                     (key, json.dumps(value)))
+
+    def _source(self) -> str:
+        client = self.manager.compiler.client
+        anno_db = getattr(client, 'anno_db', None)
+        return str(anno_db[1]) if anno_db else type(client).__name__
+
+    def sync(self) -> int:
+        """Bring the index up to date; returns the number of annotations (re)indexed or removed."""
+        with self._lock:
+            conn = self._connection()
+            compiler = self.manager.compiler
+            token = compiler.client.change_token()
+            field_map = self.manager.field_map
+            pk, modified = field_map['id'], field_map['modification_date']
+            deleted, kind = field_map['is_deleted'], field_map['type']
+            text_columns = [field_map[field] for field in SEARCH_FIELDS]
+
+            source = self._source()
+            if self._state(conn, 'source') != source:
+                # A different library: start over.
+                with conn:
+                    conn.execute("DELETE FROM annotation_fts")
+                    conn.execute("DELETE FROM sync_state")
+                    self._set_state(conn, 'source', source)
+
+            position = self._state(conn, 'position')
+            touched = 0
+            while True:
+                where = [Seek(modified, pk, *position)] if position else []
+                query, params = Query.select(self.manager.table_name,
+                                             fields=[pk, modified, deleted, kind] + text_columns,
+                                             where=where, order_by=f"{modified}, {pk}",
+                                             limit=self.batch_size)
+                rows = compiler.execute(query, params)
+                if not rows:
+                    break
+                with conn:
+                    for row_pk, _, is_deleted, row_kind, *texts in rows:
+                        conn.execute("DELETE FROM annotation_fts WHERE rowid = ?", (row_pk,))
+                        if not is_deleted and row_kind != _READING_BOOKMARK and any(texts):
+                            conn.execute(
+                                f"INSERT INTO annotation_fts (rowid, {', '.join(SEARCH_FIELDS)}) "
+                                f"VALUES (?, ?, ?, ?)",
+                                (row_pk, *texts),
+                            )
+                    position = [rows[-1][1], rows[-1][0]]
+                    self._set_state(conn, 'position', position)
+                touched += len(rows)
+                if len(rows) < self.batch_size:
+                    break
+
+            touched += self._drop_removed(conn)
+            self._synced_token = token
+            return touched
+
+    def _indexable(self) -> list:
+        """WHERE clauses matching exactly the rows :meth:`sync` indexes."""
+        field_map = self.manager.field_map
+        return [
+            Where(f"IFNULL({field_map['type']}, 0)", _READING_BOOKMARK, operator='!='),
+            Where(f"IFNULL({field_map['is_deleted']}, 0)", 0),
+            Or([Where(f"IFNULL({field_map[field]}, '')", '', operator='!=') for field in SEARCH_FIELDS]),
+        ]
+
+    def _drop_removed(self, conn: sqlite3.Connection) -> int:
+        indexed = conn.execute("SELECT COUNT(*) FROM annotation_fts").fetchone()[0]
+        query, params = Query.count(self.manager.table_name, where=self._indexable())
+        if indexed == self.manager.compiler.execute(query, params)[0][0]:
+            return 0
+        query, params = Query.select(self.manager.table_name, fields=[self.manager.field_map['id']])
+        live = {row[0] for row in self.manager.compiler.execute(query, params)}
+        stale = [(rowid,) for (rowid,) in conn.execute("SELECT rowid FROM annotation_fts")
+                 if rowid not in live]
+        with conn:
+            conn.executemany("DELETE FROM annotation_fts WHERE rowid = ?", stale)
+        return len(stale)
+
+    def _ensure_synced(self) -> None:
+        if self.manager.compiler.client.change_token() != self._synced_token:
+            self.sync()
+
+    # -- search --
+    def search_ids(self, text: str, mode: str = WORDS, fields: Optional[Sequence[str]] = None,
+                   limit: Optional[int] = None) -> List[Tuple[int, float]]:
+        """``(annotation id, bm25 score)`` pairs, best match first."""
+        match = build_match(text, mode, fields)
+        with self._lock:
+            self._ensure_synced()
+            query = ("SELECT rowid, bm25(annotation_fts) FROM annotation_fts "
+                     "WHERE annotation_fts MATCH ? ORDER BY rank")
+            params: tuple = (match,)
+            if limit is not None:
+                query += " LIMIT ?"
+                params += (limit,)
+            try:
+                return self._connection().execute(query, params).fetchall()
+            except sqlite3.OperationalError as e:
+                raise ValueError(f"Invalid search query {text!r}: {e}")
+
+    def search(self, text: str, mode: str = WORDS, fields: Optional[Sequence[str]] = None,
+               limit: Optional[int] = None, order_by: Optional[str] = None) -> ModelIterable:
+        """
+        Annotations matching ``text``, ranked by BM25 unless ``order_by``
+        is given. Matching is by token, case- and accent-insensitive.
+        """
+        ids = [rowid for rowid, _ in self.search_ids(text, mode, fields, limit)]
+        if order_by:
+            return self.manager.filter(id__in=ids, order_by=order_by)
+        by_id = self.manager.in_bulk(ids)
+        ranked = [by_id[i] for i in ids if i in by_id]
+        return self.manager.filter(id__in=ids).with_results(ranked)
@@ -12,10 +12,11 @@ from __future__ import annotations
 import configparser
 import pathlib
 import re
+from collections import Counter
 from datetime import datetime
-from typing import Optional, Set
-
-from bs4 import BeautifulSoup, NavigableString, Tag
+from html.entities import html5
+from html.parser import HTMLParser
+from typing import Dict, FrozenSet, Iterable, Mapping, Optional, Set, Union
 
 
 # ---------------------------------------------------------------------------
@@ -45,20 +46,23 @@ def apple_timestamp_to_datetime(raw):
 # HTML → plain text extraction
 # ---------------------------------------------------------------------------
 #
-# EPUBs ship XHTML. ebooklib gives us raw bytes via ``item.get_content()``
-# but no text extraction; bs4's ``get_text()`` concatenates everything
-# without block-level awareness (``<p>A</p><p>B</p>`` → ``"AB"``). The
-# helpers below preprocess the DOM so bs4's own ``get_text()`` produces
-# readable paragraph-separated output, and add anchor-window support
-# so Project Gutenberg-style multi-section files can be split cleanly
-# by their NCX fragments.
-
-
-# Contents of these elements is dropped entirely before extraction.
+# EPUBs ship XHTML. We turn it into paragraph-separated plain text in a
+# single pass over :class:`html.parser.HTMLParser` events — no document
+# tree is built. The output matches what the earlier BeautifulSoup
+# pipeline (html.parser backend) produced, so the tree rules it applied
+# are mirrored here: an end tag closes the most recent open element of
+# that name (and everything opened inside it), or nothing if there is
+# none; void elements close immediately; and a whitespace-only run of
+# text collapses to a single space or newline outside ``<pre>`` and
+# ``<textarea>``. Anchor-window support lets Project Gutenberg-style
+# multi-section files be split cleanly by their NCX fragments.
+
+
+# Contents of these elements is dropped entirely.
 _SKIP_TAGS = {"script", "style", "head"}
 
-# Tags that should introduce a newline before/after their contents so
-# paragraph breaks survive ``get_text()``.
+# Tags that introduce a newline before/after their contents so
+# paragraph breaks survive extraction.
 _BLOCK_LEVEL_TAGS = {
     "address", "article", "aside", "blockquote", "br", "details", "div",
     "dl", "dd", "dt", "figure", "footer", "header", "hgroup", "hr",
@@ -67,9 +71,342 @@ _BLOCK_LEVEL_TAGS = {
     "td", "th", "ul",
 }
 
+# Elements that never have content; a start tag closes them at once.
+_VOID_TAGS = {
+    "area", "base", "basefont", "bgsound", "br", "col", "command", "embed",
+    "frame", "hr", "image", "img", "input", "isindex", "keygen", "link",
+    "menuitem", "meta", "nextid", "param", "source", "spacer", "track", "wbr",
+}
+
+# Whitespace-only text inside these is kept as is.
+_PRESERVE_WHITESPACE_TAGS = {"pre", "textarea"}
+
+# Text directly inside these (ruby annotations, templates) is not part
+# of the main content; it only shows up in anchor windows.
+_NON_CONTENT_TEXT_TAGS = {"rt", "rp", "template", "script", "style"}
+
+_ASCII_SPACES = "\x20\x0a\x09\x0c\x0d"
+
+# Kinds of string: a run of document text, a CDATA section, a comment /
+# declaration / processing instruction, or a paragraph break we add.
+_TEXT, _CDATA, _MARKUP, _BREAK = "text", "cdata", "markup", "break"
+
+
+class _WhitespaceNormalizer:
+    """Incremental :func:`normalize_whitespace`: ``write`` text in any
+    number of pieces, then ``getvalue()`` equals normalizing their
+    concatenation."""
+
+    # str.splitlines() boundaries, less \v and \f: those are
+    # horizontal whitespace here and become spaces first.
+    _LINE_BREAK = re.compile("[\n\r\x1c\x1d\x1e\x85\u2028\u2029]")
+    _VERTICAL_TAB_FORM_FEED = str.maketrans("\v\f", "  ")
+    _HORIZONTAL_SPACE = re.compile(r"[ \t\f\v]+")
+
+    def __init__(self) -> None:
+        self._lines: list = []
+        self._line: list = []
+        self._prev_blank = True
+        self._after_cr = False
+
+    def write(self, text: str) -> None:
+        if not text:
+            return
+        if self._after_cr and text[0] == "\n":
+            # The second half of a \r\n split across pieces.
+            text = text[1:]
+        self._after_cr = False
+        if not self._LINE_BREAK.search(text):
+            self._line.append(text)
+            return
+        text = text.translate(self._VERTICAL_TAB_FORM_FEED)
+        pieces = text.splitlines(True)
+        for piece in pieces[:-1]:
+            self._line.append(piece)
+            self._end_line()
+        last = pieces[-1]
+        if self._LINE_BREAK.search(last[-1]):
+            self._line.append(last)
+            self._end_line()
+            self._after_cr = last[-1] == "\r"
+        else:
+            self._line.append(last)
+
+    def _end_line(self) -> None:
+        line = self._HORIZONTAL_SPACE.sub(" ", "".join(self._line)).strip()
+        self._line = []
+        if line:
+            self._lines.append(line)
+            self._prev_blank = False
+        elif not self._prev_blank:
+            self._lines.append("")
+            self._prev_blank = True
+
+    def getvalue(self) -> str:
+        if self._line:
+            self._end_line()
+        return "\n".join(self._lines).strip()
+
+
+class _StopParsing(Exception):
+    """Raised to abandon the parse once an anchor window has closed."""
+
+
+class _ChapterTextParser(HTMLParser):
+    """Event-driven chapter text extraction; see :func:`extract_chapter_text`.
+
+    Tracks only the stack of open tag names plus counters for the
+    contexts that matter (inside a skipped element, a
+    whitespace-preserving one, a non-content one) and writes text
+    straight into normalizers: one for the main content (the first
+    ``<body>``, or the whole document if there is none) and one per
+    anchor window. ``windows`` maps each start anchor to the ids that
+    close its window. The main content is kept while ``want_content``
+    is set or some start anchor hasn't been seen yet, since it stands
+    in for a missing anchor's window.
+    """
+
+    def __init__(self, windows: Mapping[str, FrozenSet[str]], want_content: bool) -> None:
+        super().__init__(convert_charrefs=False)
+        self.windows = windows
+        self.want_content = want_content
+        self.pending = set(windows)
+        self.open_windows: Dict[str, _WhitespaceNormalizer] = {}
+        self.closed_windows: Dict[str, _WhitespaceNormalizer] = {}
+        self.stack: list = []
+        self.open_counts: Counter = Counter()
+        self.skip_depth = 0
+        self.preserve_depth = 0
+        self.non_content_depth = 0
+        self.already_closed: list = []
+        self.data: list = []
+        # Main content: None before the first <body>, then the body's
+        # stack index while it is open, then -1.
+        self.body_index: Optional[int] = None
+        self.content: Optional[_WhitespaceNormalizer] = (
+            _WhitespaceNormalizer() if want_content or windows else None
+        )
+        self.stopped = False
+
+    # -- output --
+
+    def _emit(self, text: str, kind: str = _TEXT) -> None:
+        if self.skip_depth:
+            return
+        for window in self.open_windows.values():
+            # Anchor windows take every string in document order.
+            window.write(text)
+        if self.content is not None and self.body_index != -1 and kind != _MARKUP and (
+            kind != _TEXT or not self.non_content_depth
+        ):
+            self.content.write(text)
+
+    def _flush(self, kind: str = _TEXT) -> None:
+        if not self.data:
+            return
+        text = "".join(self.data)
+        self.data = []
+        if not self.preserve_depth and not text.strip(_ASCII_SPACES):
+            text = "\n" if "\n" in text else " "
+        self._emit(text, kind)
+
+    def _markup(self, text: str) -> None:
+        """A comment, declaration or processing instruction: its own run."""
+        self._flush()
+        self.data.append(text)
+        self._flush(_MARKUP)
+
+    # -- tree --
+
+    def _push(self, tag: str, attrs: list) -> None:
+        if tag in _BLOCK_LEVEL_TAGS:
+            self._emit("\n", _BREAK)
+        self.stack.append(tag)
+        self.open_counts[tag] += 1
+        self.skip_depth += tag in _SKIP_TAGS
+        self.preserve_depth += tag in _PRESERVE_WHITESPACE_TAGS
+        self.non_content_depth += tag in _NON_CONTENT_TEXT_TAGS
+        if self.skip_depth:
+            return
+        if self.windows:
+            element_id = None
+            for name, value in attrs:
+                if name == "id":
+                    element_id = value if value is not None else ""
+            if element_id is not None:
+                self._anchor(element_id)
+        if tag == "body" and self.body_index is None:
+            # The first body is the main content: drop what came before.
+            self.body_index = len(self.stack) - 1
+            if self.content is not None:
+                self.content = _WhitespaceNormalizer()
+
+    def _anchor(self, element_id: str) -> None:
+        for anchor in [a for a in self.open_windows if element_id in self.windows[a]]:
+            self.closed_windows[anchor] = self.open_windows.pop(anchor)
+        if element_id in self.pending:
+            self.pending.discard(element_id)
+            self.open_windows[element_id] = _WhitespaceNormalizer()
+            if not self.pending and not self.want_content:
+                self.content = None
+        if not self.open_windows and not self.pending and self.content is None:
+            # Every window has closed and nothing else is wanted.
+            self.stopped = True
+            raise _StopParsing
+
+    def _pop(self) -> None:
+        tag = self.stack.pop()
+        self.open_counts[tag] -= 1
+        self.skip_depth -= tag in _SKIP_TAGS
+        self.preserve_depth -= tag in _PRESERVE_WHITESPACE_TAGS
+        self.non_content_depth -= tag in _NON_CONTENT_TEXT_TAGS
+        if self.body_index == len(self.stack):
+            self.body_index = -1
+        if tag in _BLOCK_LEVEL_TAGS:
+            self._emit("\n", _BREAK)
+
+    def _pop_to(self, tag: str) -> None:
+        if not self.open_counts[tag]:
+            return
+        while self.stack[-1] != tag:
+            self._pop()
+        self._pop()
+
+    # -- HTMLParser events --
+
+    def handle_starttag(self, tag: str, attrs: list, startend: bool = False) -> None:
+        self._flush()
+        self._push(tag, attrs)
+        if tag in _VOID_TAGS and not startend:
+            self._pop_to(tag)
+            # Swallow a matching redundant end tag (``<br></br>``).
+            self.already_closed.append(tag)
+
+    def handle_startendtag(self, tag: str, attrs: list) -> None:
+        self.handle_starttag(tag, attrs, startend=True)
+        self._flush()
+        self._pop_to(tag)
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag in self.already_closed:
+            self.already_closed.remove(tag)
+            return
+        self._flush()
+        self._pop_to(tag)
+
+    def handle_data(self, data: str) -> None:
+        self.data.append(data)
+
+    def handle_charref(self, name: str) -> None:
+        match = _CHARREF.match(name)
+        if match is None:
+            self.data.append(name)
+            return
+        digits, rest = match.groups()
+        self.data.append(_numeric_character_reference(int(digits, 16 if name[0] in "xX" else 10)))
+        self.data.append(rest)
+
+    def handle_entityref(self, name: str) -> None:
+        self.data.append(_HTML_ENTITIES.get(name, f"&{name}"))
+
+    def handle_comment(self, data: str) -> None:
+        self._markup(data)
+
+    def handle_decl(self, decl: str) -> None:
+        self._markup(decl[len("DOCTYPE "):])
+
+    def unknown_decl(self, data: str) -> None:
+        if data.upper().startswith("CDATA["):
+            self._flush()
+            self.data.append(data[len("CDATA["):])
+            self._flush(_CDATA)
+        else:
+            self._markup(data)
+
+    def handle_pi(self, data: str) -> None:
+        self._markup(data)
+
+    def run(self, markup: str) -> None:
+        """Parse all of ``markup``, or up to the point nothing more is wanted."""
+        try:
+            self.feed(markup)
+            self.close()
+        except _StopParsing:
+            return
+        # Close out the last run of text and any unclosed elements.
+        self._flush()
+        while self.stack:
+            self._pop()
+
+    def text(self, anchor: Optional[str] = None) -> str:
+        """The window text for ``anchor`` once parsed, falling back to
+        the main content when there is no such anchor in the document."""
+        window = self.open_windows.get(anchor, self.closed_windows.get(anchor))
+        if window is not None:
+            return window.getvalue()
+        return self.content.getvalue()
+
+
+_CHARREF = re.compile(r"[xX]?([0-9a-fA-F]+)(.*)", re.S)
+
+# Entity names with and without the trailing semicolon.
+_HTML_ENTITIES = {name.rstrip(";"): char for name, char in html5.items()}
+
+
+def _numeric_character_reference(code: int) -> str:
+    """Character for ``&#code;``, per the HTML spec: invalid code points
+    become U+FFFD and C1 controls are read as Windows-1252."""
+    if code == 0 or code > 0x10FFFF or 0xD800 <= code <= 0xDFFF:
+        return "\ufffd"
+    if 0x80 <= code <= 0x9F:
+        try:
+            return bytes([code]).decode("cp1252")
+        except UnicodeDecodeError:
+            pass
+    return chr(code)
+
+
+_XML_ENCODING = re.compile(rb"^\s*<\?.*encoding=['\"](.*?)['\"].*\?>", re.I)
+_META_CHARSET = re.compile(rb"<\s*meta[^>]+charset\s*=\s*[\"']?([^>]*?)[ /;'\">]", re.I)
+_BOMS = (
+    (b"\xef\xbb\xbf", "utf-8"),
+    (b"\x00\x00\xfe\xff", "utf-32be"),
+    (b"\xff\xfe\x00\x00", "utf-32le"),
+    (b"\xfe\xff", "utf-16be"),
+    (b"\xff\xfe", "utf-16le"),
+)
+
+
+def _decode_html(html_bytes: bytes) -> str:
+    """Decode chapter bytes: byte-order mark, else the encoding the
+    document declares, else UTF-8, else Windows-1252."""
+    candidates = []
+    for bom, encoding in _BOMS:
+        if html_bytes.startswith(bom) and (
+            len(bom) > 2 or (len(html_bytes) >= 4 and html_bytes[2:4] != b"\x00\x00")
+        ):
+            html_bytes = html_bytes[len(bom):]
+            candidates.append(encoding)
+            break
+    declared = _XML_ENCODING.search(html_bytes, endpos=1024) or _META_CHARSET.search(
+        html_bytes, endpos=max(2048, int(len(html_bytes) * 0.05))
+    )
+    if declared:
+        candidates.append(declared.group(1).decode("ascii", "replace").lower())
+    candidates += ["utf-8", "windows-1252"]
+    for errors in ("strict", "replace"):
+        for encoding in candidates:
+            if errors == "replace" and encoding == "ascii":
+                continue
+            try:
+                return html_bytes.decode(encoding, errors)
+            except (UnicodeDecodeError, LookupError):
+                continue
+    return html_bytes.decode("utf-8", "replace")
+
 
 def extract_chapter_text(
-    html_bytes: bytes,
+    html_bytes: Union[bytes, str],
     start_anchor: Optional[str] = None,
     stop_anchors: Optional[Set[str]] = None,
 ) -> str:
@@ -79,52 +416,36 @@ def extract_chapter_text(
     element with ``id=start_anchor`` and continues in document order
     until one of the ``stop_anchors`` is encountered — this lets
     multi-section XHTML files (Project Gutenberg layout) be split by
-    their NCX fragment anchors without bleed-through.
+    their NCX fragment anchors without bleed-through. Parsing stops at
+    the stop anchor.
 
     When ``start_anchor`` is absent or can't be found, the whole
     ``<body>`` (or whole document if there's no body) is returned.
     """
-    stop_anchors = stop_anchors or set()
-    soup = BeautifulSoup(html_bytes, "html.parser")
-
-    for tag_name in _SKIP_TAGS:
-        for tag in soup.find_all(tag_name):
-            tag.decompose()
-
-    # Insert explicit newlines around block-level tags so bs4's own
-    # ``get_text()`` produces paragraph-separated output.
-    for tag in list(soup.find_all(_BLOCK_LEVEL_TAGS)):
-        tag.insert_before("\n")
-        tag.insert_after("\n")
-
-    if start_anchor:
-        anchor_el = soup.find(id=start_anchor)
-        if anchor_el is not None:
-            return _text_in_window(soup, anchor_el, stop_anchors)
-
-    root = soup.body if soup.body is not None else soup
-    return normalize_whitespace(root.get_text())
-
-
-def _text_in_window(
-    soup: BeautifulSoup, anchor_el: Tag, stop_anchors: Set[str]
-) -> str:
-    """Collect text in document order from ``anchor_el`` forward,
-    stopping at the first element whose ``id`` is in ``stop_anchors``.
-    Used by :func:`extract_chapter_text` for fragment scoping.
+    markup = html_bytes if isinstance(html_bytes, str) else _decode_html(html_bytes)
+    windows = {start_anchor: frozenset(stop_anchors or ())} if start_anchor else {}
+    parser = _ChapterTextParser(windows, want_content=not start_anchor)
+    parser.run(markup)
+    return parser.text(start_anchor)
+
+
+def extract_sections_text(html_bytes: Union[bytes, str], fragments: Iterable[str]) -> Dict[str, str]:
+    """Split a multi-section XHTML file into the text of each of its
+    ``fragments`` in a single parse.
+
+    Each fragment's section runs from its anchor to the next element
+    whose id is one of the other fragments, so the result for ``f`` is
+    exactly ``extract_chapter_text(html_bytes, f, others)``. The empty
+    fragment (a ToC entry pointing at the file itself) and fragments
+    missing from the document map to the whole ``<body>`` text.
     """
-    collecting = False
-    parts: list = []
-    for node in soup.descendants:
-        if isinstance(node, Tag):
-            if node is anchor_el:
-                collecting = True
-                continue
-            if collecting and node.get("id") in stop_anchors:
-                break
-        elif collecting and isinstance(node, NavigableString):
-            parts.append(str(node))
-    return normalize_whitespace("".join(parts))
+    markup = html_bytes if isinstance(html_bytes, str) else _decode_html(html_bytes)
+    fragments = set(fragments)
+    anchors = fragments - {""}
+    windows = {anchor: frozenset(anchors - {anchor}) for anchor in anchors}
+    parser = _ChapterTextParser(windows, want_content="" in fragments)
+    parser.run(markup)
+    return {fragment: parser.text(fragment or None) for fragment in fragments}
 
 
 def normalize_whitespace(text: str) -> str:
@@ -136,18 +457,9 @@ def normalize_whitespace(text: str) -> str:
       (paragraph boundary).
     * Leading and trailing whitespace on the overall string is stripped.
     """
-    text = re.sub(r"[ \t\f\v]+", " ", text)
-    lines = [line.strip() for line in text.splitlines()]
-    out: list = []
-    prev_blank = True
-    for line in lines:
-        if line:
-            out.append(line)
-            prev_blank = False
-        elif not prev_blank:
-            out.append("")
-            prev_blank = True
-    return "\n".join(out).strip()
+    normalizer = _WhitespaceNormalizer()
+    normalizer.write(text)
+    return normalizer.getvalue()
 
 
 def snap_window(
@@ -0,0 +1,308 @@
+"""Change notifications for the Apple Books databases.
+
+:class:`LibraryWatcher` monitors the ``.sqlite`` and ``-wal`` files in the
+directories a client's ``book_lib_db`` and ``anno_db`` point at, and
+dispatches a typed :class:`WatchEvent` — ``library_changed`` or
+``annotations_changed`` — whenever Apple Books (or anyone else) writes
+to them. Instead of polling :func:`~py_apple_books.changes.changes_since`
+on a timer, a sync job can wait for an event and only then ask what
+changed.
+
+On Linux the watcher uses inotify (through :mod:`ctypes`, no extra
+dependency); everywhere else, or if inotify can't be set up, it falls
+back to comparing file mtimes and sizes every ``poll_interval`` seconds.
+A single transaction touches the database, its WAL and sometimes both
+files several times, so raw notifications are debounced: an event fires
+once writes have been quiet for ``debounce`` seconds, or at the latest
+``max_delay`` seconds after the first of a continuous burst.
+
+Events are delivered to callbacks registered with
+:meth:`LibraryWatcher.subscribe` (on the watcher's thread), or through
+``async for event in watcher``. Cache layers subscribe to drop their
+state::
+
+    watcher = LibraryWatcher()
+    watcher.subscribe(lambda event: ModelManager.compiler.invalidate())
+    watcher.start()
+"""
+
+import asyncio
+import ctypes
+import ctypes.util
+import logging
+import os
+import select
+import struct
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import AsyncIterator, Callable, Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+
+from py_apple_books.db.client import get_default_client
+
+logger = logging.getLogger(__name__)
+
+LIBRARY_CHANGED = 'library_changed'
+ANNOTATIONS_CHANGED = 'annotations_changed'
+
+# Files whose writes mean the data changed. ``-shm`` is deliberately
+# absent: readers touch it too.
+_WATCHED_SUFFIXES = ('.sqlite', '.sqlite-wal')
+
+
+@dataclass(frozen=True)
+class WatchEvent:
+    kind: str
+    directory: Path
+    time: float
+
+
+Callback = Callable[[WatchEvent], None]
+
+
+# ---------------------------------------------------------------------------
+# Backends: each waits up to ``timeout`` and returns the kinds that changed
+# ---------------------------------------------------------------------------
+
+
+class _PollBackend:
+    name = 'poll'
+
+    def __init__(self, directories: Dict[str, Path], interval: float, stop: threading.Event):
+        self.directories = directories
+        self.idle_timeout = interval
+        self.stop = stop
+        self.signatures = {kind: self._signature(path) for kind, path in directories.items()}
+
+    @staticmethod
+    def _signature(directory: Path) -> Tuple:
+        entries = []
+        try:
+            names = sorted(os.listdir(directory))
+        except OSError:
+            return ()
+        for name in names:
+            if name.endswith(_WATCHED_SUFFIXES):
+                try:
+                    st = os.stat(directory / name)
+                except OSError:
+                    continue
+                entries.append((name, st.st_mtime_ns, st.st_size))
+        return tuple(entries)
+
+    def wait(self, timeout: float) -> Set[str]:
+        self.stop.wait(timeout)
+        changed = set()
+        for kind, path in self.directories.items():
+            signature = self._signature(path)
+            if signature != self.signatures[kind]:
+                self.signatures[kind] = signature
+                changed.add(kind)
+        return changed
+
+    def close(self) -> None:
+        pass
+
+
+class _InotifyBackend:
+    name = 'inotify'
+    # Only bounds how long stop() takes; events wake the select at once.
+    idle_timeout = 0.25
+
+    IN_MODIFY = 0x00000002
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    IN_DELETE = 0x00000200
+    MASK = IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE | IN_DELETE
+    _EVENT = struct.Struct('iIII')
+
+    def __init__(self, directories: Dict[str, Path]):
+        if not sys.platform.startswith('linux'):
+            raise OSError("inotify is only available on Linux")
+        libc = ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True)
+        self.fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self.kinds: Dict[int, str] = {}
+        try:
+            for kind, path in directories.items():
+                wd = libc.inotify_add_watch(self.fd, os.fsencode(path), self.MASK)
+                if wd < 0:
+                    raise OSError(ctypes.get_errno(), f"inotify_add_watch failed for {path}")
+                self.kinds[wd] = kind
+        except BaseException:
+            os.close(self.fd)
+            raise
+
+    def wait(self, timeout: float) -> Set[str]:
+        readable, _, _ = select.select([self.fd], [], [], timeout)
+        if not readable:
+            return set()
+        try:
+            data = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return set()
+        changed = set()
+        offset = 0
+        while offset < len(data):
+            wd, _mask, _cookie, length = self._EVENT.unpack_from(data, offset)
+            offset += self._EVENT.size
+            name = data[offset:offset + length].rstrip(b'\0').decode(errors='replace')
+            offset += length
+            if wd in self.kinds and name.endswith(_WATCHED_SUFFIXES):
+                changed.add(self.kinds[wd])
+        return changed
+
+    def close(self) -> None:
+        os.close(self.fd)
+
+
+# ---------------------------------------------------------------------------
+# Watcher
+# ---------------------------------------------------------------------------
+
+
+class LibraryWatcher:
+    """
+    Watch the library and annotation databases and dispatch debounced
+    :class:`WatchEvent` notifications. See the module docstring.
+    """
+
+    def __init__(self, client=None, debounce: float = 0.2, max_delay: float = 2.0,
+                 poll_interval: float = 1.0, use_inotify: bool = True):
+        """
+        Args:
+            client: Client whose ``book_lib_db``/``anno_db`` directories
+                to watch; defaults to the process-wide client.
+            debounce: Quiet period, in seconds, that ends a burst of writes.
+            max_delay: Upper bound on how long a continuous burst can
+                hold back its event.
+            poll_interval: Seconds between checks for the polling backend.
+            use_inotify: Try inotify first (Linux only).
+        """
+        client = client or get_default_client()
+        self.directories = {
+            LIBRARY_CHANGED: Path(client.book_lib_db[1]),
+            ANNOTATIONS_CHANGED: Path(client.anno_db[1]),
+        }
+        self.debounce = debounce
+        self.max_delay = max_delay
+        self.poll_interval = poll_interval
+        self.use_inotify = use_inotify
+        self.backend: Optional[str] = None
+        self._subscribers: List[Tuple[Callback, Optional[FrozenSet[str]]]] = []
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    # -- subscriptions --
+    def subscribe(self, callback: Callback, kinds: Optional[Iterable[str]] = None) -> Callable[[], None]:
+        """
+        Call ``callback(event)`` for every event (or only those of
+        ``kinds``). Callbacks run on the watcher thread. Returns a
+        function that unsubscribes.
+        """
+        entry = (callback, frozenset(kinds) if kinds is not None else None)
+        with self._lock:
+            self._subscribers.append(entry)
+
+        def unsubscribe():
+            with self._lock:
+                if entry in self._subscribers:
+                    self._subscribers.remove(entry)
+        return unsubscribe
+
+    def _dispatch(self, kinds: Set[str]) -> None:
+        now = time.time()
+        with self._lock:
+            subscribers = list(self._subscribers)
+        for kind in sorted(kinds):
+            event = WatchEvent(kind=kind, directory=self.directories[kind], time=now)
+            for callback, wanted in subscribers:
+                if wanted is not None and kind not in wanted:
+                    continue
+                try:
+                    callback(event)
+                except Exception:
+                    logger.exception("Error in watcher callback %r", callback)
+
+    async def events(self, kinds: Optional[Iterable[str]] = None) -> AsyncIterator[WatchEvent]:
+        """Async iterator over events, delivered on the running event loop."""
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue()
+
+        def enqueue(event: WatchEvent) -> None:
+            loop.call_soon_threadsafe(queue.put_nowait, event)
+
+        unsubscribe = self.subscribe(enqueue, kinds)
+        try:
+            while True:
+                yield await queue.get()
+        finally:
+            unsubscribe()
+
+    def __aiter__(self) -> AsyncIterator[WatchEvent]:
+        return self.events()
+
+    # -- lifecycle --
+    def _open_backend(self):
+        if self.use_inotify:
+            try:
+                return _InotifyBackend(self.directories)
+            except (OSError, AttributeError):
+                pass
+        return _PollBackend(self.directories, self.poll_interval, self._stop)
+
+    def start(self) -> 'LibraryWatcher':
+        """Start watching in a daemon thread. The files' current state is the baseline."""
+        if self._thread is not None:
+            return self
+        self._stop.clear()
+        backend = self._open_backend()
+        self.backend = backend.name
+        self._thread = threading.Thread(target=self._run, args=(backend,),
+                                        name='py-apple-books-watcher', daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        thread, self._thread = self._thread, None
+        if thread is not None:
+            self._stop.set()
+            thread.join()
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None
+
+    def __enter__(self) -> 'LibraryWatcher':
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.stop()
+
+    def _run(self, backend) -> None:
+        pending: Set[str] = set()
+        first = last = 0.0
+        try:
+            while not self._stop.is_set():
+                if pending:
+                    now = time.monotonic()
+                    timeout = max(min(last + self.debounce, first + self.max_delay) - now, 0.0)
+                else:
+                    timeout = backend.idle_timeout
+                changed = backend.wait(timeout)
+                now = time.monotonic()
+                if changed:
+                    if not pending:
+                        first = now
+                    pending |= changed
+                    last = now
+                if pending and (now - last >= self.debounce or now - first >= self.max_delay):
+                    kinds, pending = pending, set()
+                    self._dispatch(kinds)
+        finally:
+            backend.close()
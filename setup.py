@@ -13,10 +13,8 @@ setup(
     author_email='vgnshiyer@gmail.com',
     packages=find_packages(exclude=['tests', 'tests.*']),
     install_requires=[
-        # EPUB parsing: handles EPUB2 (NCX) and EPUB3 (nav doc) ToCs.
+        # Fallback EPUB parsing for packages the stdlib reader can't handle.
         'ebooklib>=0.20',
-        # XHTML → plain text for chapter content extraction.
-        'beautifulsoup4>=4.12',
     ],
     extras_require={
         'dev': ['pytest>=7.0'],
@@ -4,11 +4,17 @@ Includes a helper to build unzipped EPUB bundle directories in a tmp
 path. Apple Books stores EPUBs unzipped on disk, so fixture EPUBs are
 written as directories rather than ``.zip`` files — ``BookContent``
 only supports that layout.
+
+Also builds a miniature Apple Books library — ``BKLibrary`` and
+``AEAnnotation`` SQLite files with the columns ``mappings.ini`` reads —
+and installs a client pointing at it as the process-wide default, so
+manager and facade tests run real SQL without touching ``~/Library``.
 """
 
 from __future__ import annotations
 
 import pathlib
+import sqlite3
 import zipfile
 from dataclasses import dataclass
 from typing import List, Optional
@@ -16,6 +22,8 @@ from typing import List, Optional
 import pytest
 from ebooklib import epub
 
+from py_apple_books.db import AppleBooksDBClient, set_default_client
+
 
 @dataclass
 class _BuiltEpub:
@@ -99,3 +107,120 @@ def epub_factory(tmp_path):
 def simple_epub(epub_factory):
     """A default 3-chapter EPUB bundle."""
     return epub_factory()
+
+
+# ---------------------------------------------------------------------------
+# Miniature Apple Books library
+# ---------------------------------------------------------------------------
+
+_LIBRARY_SCHEMA = """
+CREATE TABLE ZBKLIBRARYASSET (
+    Z_PK INTEGER PRIMARY KEY, ZASSETID VARCHAR, ZTITLE VARCHAR,
+    ZAUTHOR VARCHAR, ZBOOKDESCRIPTION VARCHAR, ZGENRE VARCHAR,
+    ZCONTENTTYPE INTEGER, ZPAGECOUNT INTEGER, ZPATH VARCHAR,
+    ZFILESIZE INTEGER, ZISFINISHED INTEGER, ZREADINGPROGRESS FLOAT,
+    ZDURATION FLOAT, ZCREATIONDATE TIMESTAMP, ZDATEFINISHED TIMESTAMP,
+    ZLASTOPENDATE TIMESTAMP, ZPURCHASEDATE TIMESTAMP, ZISEXPLICIT INTEGER,
+    ZISLOCKED INTEGER, ZISEPHEMERAL INTEGER, ZISHIDDEN INTEGER,
+    ZISSAMPLE INTEGER, ZISSTOREAUDIOBOOK INTEGER, ZRATING INTEGER
+);
+CREATE TABLE ZBKCOLLECTION (
+    Z_PK INTEGER PRIMARY KEY, ZTITLE VARCHAR, ZDETAILS VARCHAR,
+    ZDELETEDFLAG INTEGER, ZHIDDEN INTEGER
+);
+CREATE TABLE ZBKCOLLECTIONMEMBER (
+    Z_PK INTEGER PRIMARY KEY, ZCOLLECTION INTEGER, ZASSETID VARCHAR
+);
+"""
+
+_ANNOTATION_SCHEMA = """
+CREATE TABLE ZAEANNOTATION (
+    Z_PK INTEGER PRIMARY KEY, ZANNOTATIONASSETID VARCHAR,
+    ZANNOTATIONDELETED INTEGER, ZANNOTATIONISUNDERLINE INTEGER,
+    ZANNOTATIONSTYLE INTEGER, ZANNOTATIONTYPE INTEGER,
+    ZANNOTATIONCREATIONDATE TIMESTAMP, ZANNOTATIONMODIFICATIONDATE TIMESTAMP,
+    ZANNOTATIONSELECTEDTEXT VARCHAR, ZANNOTATIONREPRESENTATIVETEXT VARCHAR,
+    ZANNOTATIONNOTE VARCHAR, ZANNOTATIONLOCATION VARCHAR,
+    ZFUTUREPROOFING5 VARCHAR
+);
+"""
+
+# Genres cycle so per-genre grouping has something to group.
+_GENRES = ["Fiction", "History", "Science"]
+
+LIBRARY_BOOK_COUNT = 6
+# Per book: one reading-position bookmark (type 3), three highlights
+# (type 1) and one note (type 2).
+LIBRARY_ANNOTATIONS_PER_BOOK = 5
+
+
+def _build_library(root: pathlib.Path) -> tuple[pathlib.Path, pathlib.Path]:
+    lib_dir = root / "BKLibrary"
+    anno_dir = root / "AEAnnotation"
+    lib_dir.mkdir(parents=True)
+    anno_dir.mkdir(parents=True)
+
+    conn = sqlite3.connect(lib_dir / "BKLibrary-1-091020131601.sqlite")
+    conn.executescript(_LIBRARY_SCHEMA)
+    for i in range(1, LIBRARY_BOOK_COUNT + 1):
+        conn.execute(
+            "INSERT INTO ZBKLIBRARYASSET (Z_PK, ZASSETID, ZTITLE, ZAUTHOR, "
+            "ZGENRE, ZISFINISHED, ZREADINGPROGRESS, ZCREATIONDATE, ZLASTOPENDATE) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (i, f"ASSET{i}", f"Book {i}", f"Author {i}", _GENRES[i % 3],
+             int(i == 1), (i % 4) / 4.0, 600000000.0 + i, 700000000.0 + i),
+        )
+    conn.executemany(
+        "INSERT INTO ZBKCOLLECTION VALUES (?, ?, ?, 0, 0)",
+        [(1, "Favourites", "Best ones"), (2, "Later", None), (3, "Empty", None)],
+    )
+    conn.executemany(
+        "INSERT INTO ZBKCOLLECTIONMEMBER (ZCOLLECTION, ZASSETID) VALUES (?, ?)",
+        [(1, "ASSET1"), (1, "ASSET2"), (2, "ASSET3")],
+    )
+    conn.commit()
+    conn.close()
+
+    conn = sqlite3.connect(anno_dir / "AEAnnotation_v10312011_1727_local.sqlite")
+    conn.executescript(_ANNOTATION_SCHEMA)
+    pk = 0
+    for book in range(1, LIBRARY_BOOK_COUNT + 1):
+        for j in range(LIBRARY_ANNOTATIONS_PER_BOOK):
+            pk += 1
+            kind = 3 if j == 0 else (2 if j == 4 else 1)
+            conn.execute(
+                "INSERT INTO ZAEANNOTATION VALUES (?, ?, 0, 0, ?, ?, ?, ?, ?, ?, ?, ?, NULL)",
+                (
+                    pk, f"ASSET{book}",
+                    0 if kind == 3 else j,
+                    kind,
+                    650000000.0 + pk,
+                    660000000.0 + pk,
+                    None if kind == 3 else f"highlight {pk}",
+                    None if kind == 3 else f"context {pk}",
+                    f"note {pk}" if kind == 2 else None,
+                    f"epubcfi(/6/8[item{j}]!/4/2/1,:0,:5)",
+                ),
+            )
+    conn.commit()
+    conn.close()
+    return lib_dir, anno_dir
+
+
+@pytest.fixture
+def library(tmp_path):
+    """A miniature Apple Books library installed as the default client.
+
+    Yields the :class:`AppleBooksDBClient`; the previous default client
+    is restored afterwards.
+    """
+    lib_dir, anno_dir = _build_library(tmp_path / "Documents")
+    client = AppleBooksDBClient()
+    client.book_lib_db = ("lib_db", lib_dir)
+    client.anno_db = ("anno_db", anno_dir)
+    previous = set_default_client(client)
+    try:
+        yield client
+    finally:
+        client.close()
+        set_default_client(previous)
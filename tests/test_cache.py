@@ -0,0 +1,126 @@
+"""Tests for py_apple_books.db.cache and the QueryCompiler result cache.
+
+:class:`QueryCache` bookkeeping is tested on its own; the compiler
+integration runs against the miniature library, with writes committed
+through a separate connection so that the on-disk change token moves.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+from contextlib import closing
+
+import pytest
+
+from py_apple_books.db.cache import QueryCache
+from py_apple_books.db.query import QueryCompiler
+
+
+class TestQueryCache:
+    def test_hit_and_miss(self):
+        cache = QueryCache()
+        assert cache.get("k", token=1) is None
+        cache.put("k", [(1,)], token=1)
+        assert cache.get("k", token=1) == [(1,)]
+        stats = cache.stats()
+        assert (stats.hits, stats.misses, stats.entries) == (1, 1, 1)
+        assert stats.hit_rate == 0.5
+
+    def test_empty_result_is_cached(self):
+        cache = QueryCache()
+        cache.put("k", [], token=1)
+        assert cache.get("k", token=1) == []
+
+    def test_lru_eviction_by_count(self):
+        cache = QueryCache(max_entries=2)
+        cache.put("a", [(1,)], token=0)
+        cache.put("b", [(2,)], token=0)
+        cache.get("a", token=0)
+        cache.put("c", [(3,)], token=0)
+        assert cache.get("b", token=0) is None
+        assert cache.get("a", token=0) == [(1,)]
+        assert cache.stats().evictions == 1
+
+    def test_byte_budget(self):
+        rows = [("x" * 100,)] * 10
+        cache = QueryCache(max_bytes=3000)
+        cache.put("a", rows, token=0)
+        cache.put("b", rows, token=0)
+        stats = cache.stats()
+        assert stats.bytes <= 3000
+        assert stats.evictions >= 1
+        # A result bigger than the whole budget isn't cached at all.
+        cache.put("huge", [("x" * 5000,)], token=0)
+        assert cache.get("huge", token=0) is None
+
+    def test_token_change_invalidates(self):
+        cache = QueryCache()
+        cache.put("k", [(1,)], token=1)
+        assert cache.get("k", token=2) is None
+        assert cache.stats().invalidations == 1
+        # A result stored under an old token is never served under a new one.
+        cache.put("k", [(1,)], token=1)
+        assert cache.get("k", token=2) is None
+
+    def test_returned_rows_are_a_copy(self):
+        cache = QueryCache()
+        cache.put("k", [(1,)], token=0)
+        cache.get("k", token=0).append((2,))
+        assert cache.get("k", token=0) == [(1,)]
+
+    def test_invalid_limits(self):
+        with pytest.raises(ValueError):
+            QueryCache(max_entries=0)
+
+
+class TestCompilerCache:
+    SQL = "SELECT COUNT(*) FROM anno_db.ZAEANNOTATION"
+
+    def test_disabled_by_default(self, library):
+        compiler = QueryCompiler()
+        assert compiler.cache_stats() is None
+        assert compiler.execute(self.SQL) == library.execute(self.SQL)
+
+    def test_repeated_queries_hit(self, library):
+        compiler = QueryCompiler()
+        compiler.enable_cache()
+        first = compiler.execute(self.SQL)
+        assert compiler.execute(self.SQL) == first
+        stats = compiler.cache_stats()
+        assert (stats.hits, stats.misses) == (1, 1)
+
+    def test_parameters_are_part_of_the_key(self, library):
+        compiler = QueryCompiler()
+        compiler.enable_cache()
+        sql = "SELECT Z_PK FROM ZBKLIBRARYASSET WHERE Z_PK = ?"
+        assert compiler.execute(sql, (1,)) == [(1,)]
+        assert compiler.execute(sql, (2,)) == [(2,)]
+
+    def test_database_change_invalidates(self, library):
+        compiler = QueryCompiler()
+        compiler.enable_cache()
+        before = compiler.execute(self.SQL)[0][0]
+        path = next(library.anno_db[1].glob("*.sqlite"))
+        with closing(sqlite3.connect(path)) as writer, writer:
+            writer.execute("DELETE FROM ZAEANNOTATION WHERE Z_PK = 1")
+        assert compiler.execute(self.SQL)[0][0] == before - 1
+        assert compiler.cache_stats().invalidations == 1
+
+    def test_snapshot_refresh_invalidates(self, library):
+        with library.snapshot() as snap:
+            compiler = QueryCompiler(snap)
+            compiler.enable_cache()
+            compiler.execute(self.SQL)
+            compiler.execute(self.SQL)
+            snap.refresh()
+            compiler.execute(self.SQL)
+            stats = compiler.cache_stats()
+            assert (stats.hits, stats.misses, stats.invalidations) == (1, 2, 1)
+
+    def test_explicit_invalidate(self, library):
+        compiler = QueryCompiler()
+        compiler.enable_cache()
+        compiler.execute(self.SQL)
+        compiler.invalidate()
+        compiler.execute(self.SQL)
+        assert compiler.cache_stats().misses == 2
@@ -0,0 +1,88 @@
+"""Tests for py_apple_books.changes.
+
+Changes are made to the miniature library's files through a separate
+committed connection, the way Apple Books would write them.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+from contextlib import closing
+from datetime import datetime
+
+import pytest
+
+from py_apple_books.changes import DELETED, INSERTED, UPDATED, changes_since
+from py_apple_books.models import Annotation, Book
+from py_apple_books.utils import APPLE_EPOCH_OFFSET
+from tests.conftest import LIBRARY_ANNOTATIONS_PER_BOOK, LIBRARY_BOOK_COUNT
+
+ANNOTATION_COUNT = LIBRARY_ANNOTATIONS_PER_BOOK * LIBRARY_BOOK_COUNT
+
+
+def _write(directory, sql, params=()):
+    path = next(directory.glob("*.sqlite"))
+    with closing(sqlite3.connect(path)) as conn, conn:
+        conn.execute(sql, params)
+
+
+class TestChangesSince:
+    def test_full_sync_returns_everything_in_time_order(self, library):
+        changes = changes_since()
+        assert len(changes) == ANNOTATION_COUNT + LIBRARY_BOOK_COUNT
+        assert {c.kind for c in changes} == {INSERTED}
+        times = [c.modified for c in changes]
+        assert times == sorted(times)
+
+    def test_nothing_changed(self, library):
+        assert len(changes_since(changes_since().watermark)) == 0
+
+    def test_update_insert_and_soft_delete(self, library):
+        watermark = changes_since().watermark
+        anno_dir = library.anno_db[1]
+        _write(anno_dir, "UPDATE ZAEANNOTATION SET ZANNOTATIONMODIFICATIONDATE = 670000001, "
+                         "ZANNOTATIONNOTE = 'edited' WHERE Z_PK = 2")
+        _write(anno_dir, "UPDATE ZAEANNOTATION SET ZANNOTATIONMODIFICATIONDATE = 670000002, "
+                         "ZANNOTATIONDELETED = 1 WHERE Z_PK = 3")
+        _write(anno_dir, "INSERT INTO ZAEANNOTATION (Z_PK, ZANNOTATIONASSETID, ZANNOTATIONDELETED, "
+                         "ZANNOTATIONTYPE, ZANNOTATIONCREATIONDATE, ZANNOTATIONMODIFICATIONDATE) "
+                         "VALUES (999, 'ASSET1', 0, 1, 670000003, 670000003)")
+        _write(library.book_lib_db[1], "UPDATE ZBKLIBRARYASSET SET ZLASTOPENDATE = 710000004 WHERE Z_PK = 4")
+
+        changes = changes_since(watermark)
+        summary = [(type(c.object).__name__, c.object.id, c.kind) for c in changes]
+        assert summary == [
+            ("Annotation", 2, UPDATED),
+            ("Annotation", 3, DELETED),
+            ("Annotation", 999, INSERTED),
+            ("Book", 4, UPDATED),
+        ]
+        assert changes.changes[0].object.note == "edited"
+        assert len(changes_since(changes.watermark)) == 0
+
+    def test_limit_drains_in_batches(self, library):
+        seen, watermark = [], None
+        while True:
+            batch = changes_since(watermark, limit=7)
+            if not batch.changes:
+                break
+            assert len(batch) <= 7
+            seen.extend((type(c.object), c.object.id) for c in batch)
+            watermark = batch.watermark
+        assert len(seen) == len(set(seen)) == ANNOTATION_COUNT + LIBRARY_BOOK_COUNT
+
+    def test_datetime_watermark(self, library):
+        # Annotation modification dates are 660000000 + pk.
+        since = datetime.fromtimestamp(660000000 + ANNOTATION_COUNT - 1 + APPLE_EPOCH_OFFSET)
+        annotations = [c for c in changes_since(since) if isinstance(c.object, Annotation)]
+        assert [c.object.id for c in annotations] == [ANNOTATION_COUNT - 1, ANNOTATION_COUNT]
+
+    def test_books_use_latest_activity(self, library):
+        books = [c for c in changes_since() if isinstance(c.object, Book)]
+        # ZLASTOPENDATE (700000000 + i) is the latest date of each book.
+        assert [c.object.id for c in books] == list(range(1, LIBRARY_BOOK_COUNT + 1))
+        assert books[0].modified == datetime.fromtimestamp(700000001 + APPLE_EPOCH_OFFSET)
+
+    def test_invalid_watermark(self, library):
+        with pytest.raises(ValueError):
+            changes_since("garbage")
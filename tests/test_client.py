@@ -0,0 +1,109 @@
+"""Tests for py_apple_books.db.client connection modes.
+
+Each test builds its own :class:`AppleBooksDBClient` against the
+miniature library from ``conftest.py`` so connection options can be
+varied independently of the default client.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+from contextlib import closing
+
+import pytest
+
+from py_apple_books.db import AppleBooksDBClient
+from py_apple_books.db.exceptions import DBQueryError
+
+
+def _client_for(library, **options) -> AppleBooksDBClient:
+    client = AppleBooksDBClient(**options)
+    client.book_lib_db = library.book_lib_db
+    client.anno_db = library.anno_db
+    return client
+
+
+class TestReadOnlyMode:
+    def test_reads_work(self, library):
+        with _client_for(library, read_only=True) as client:
+            assert client.execute("SELECT COUNT(*) FROM anno_db.ZAEANNOTATION")[0][0] > 0
+
+    def test_writes_are_rejected(self, library):
+        with _client_for(library, read_only=True) as client:
+            with pytest.raises(DBQueryError):
+                client.execute("DELETE FROM anno_db.ZAEANNOTATION")
+        # Nothing was deleted through the read-write default client either.
+        assert library.execute("SELECT COUNT(*) FROM anno_db.ZAEANNOTATION")[0][0] > 0
+
+    def test_immutable_implies_read_only(self, library):
+        client = _client_for(library, immutable=True)
+        assert client.read_only
+        with client:
+            assert client.execute("PRAGMA query_only")[0][0] == 1
+            assert client.execute("SELECT COUNT(*) FROM ZBKLIBRARYASSET")[0][0] > 0
+
+    def test_pragmas_apply_to_both_databases(self, library):
+        with _client_for(library, cache_size=-4096, temp_store="memory") as client:
+            assert client.execute("PRAGMA main.cache_size")[0][0] == -4096
+            assert client.execute("PRAGMA anno_db.cache_size")[0][0] == -4096
+            assert client.execute("PRAGMA temp_store")[0][0] == 2
+
+    def test_mmap_size_is_passed_through(self, library):
+        with _client_for(library, mmap_size=1 << 20) as client:
+            # SQLite may clamp to its compile-time maximum (0 when mmap
+            # is disabled); it must never exceed what was asked for.
+            assert client.execute("PRAGMA anno_db.mmap_size")[0][0] in (0, 1 << 20)
+
+    def test_invalid_temp_store(self):
+        with pytest.raises(ValueError):
+            AppleBooksDBClient(temp_store="disk")
+
+
+class TestSnapshot:
+    def test_serves_both_databases_from_memory(self, library):
+        with library.snapshot() as snap:
+            assert snap.execute("SELECT COUNT(*) FROM ZBKLIBRARYASSET") == \
+                library.execute("SELECT COUNT(*) FROM ZBKLIBRARYASSET")
+            assert snap.execute("SELECT COUNT(*) FROM anno_db.ZAEANNOTATION") == \
+                library.execute("SELECT COUNT(*) FROM anno_db.ZAEANNOTATION")
+            files = [row[2] for row in snap.execute("PRAGMA database_list")]
+            assert files == ["", ""]
+
+    def test_isolated_from_writes_until_refresh(self, library):
+        count = "SELECT COUNT(*) FROM anno_db.ZAEANNOTATION"
+        with library.snapshot() as snap:
+            before = snap.execute(count)[0][0]
+            path = next(library.anno_db[1].glob("*.sqlite"))
+            with closing(sqlite3.connect(path)) as writer, writer:
+                writer.execute("DELETE FROM ZAEANNOTATION WHERE Z_PK = 1")
+            assert snap.execute(count)[0][0] == before
+            generation = snap.generation
+            snap.refresh()
+            assert snap.generation == generation + 1
+            assert snap.execute(count)[0][0] == before - 1
+
+    def test_is_read_only(self, library):
+        with library.snapshot() as snap:
+            with pytest.raises(DBQueryError):
+                snap.execute("DELETE FROM ZBKLIBRARYASSET")
+
+    def test_close_drops_the_copy(self, library):
+        snap = library.snapshot()
+        snap.execute("SELECT 1")
+        snap.close()
+        assert not snap.is_open
+        # The next query takes a fresh copy.
+        assert snap.execute("SELECT COUNT(*) FROM ZBKLIBRARYASSET")[0][0] > 0
+        snap.close()
+
+    def test_facade_snapshot_mode(self, library):
+        from py_apple_books import PyAppleBooks
+        from py_apple_books.db import SnapshotDBClient, get_default_client
+
+        api = PyAppleBooks(snapshot=True)
+        try:
+            assert isinstance(get_default_client(), SnapshotDBClient)
+            assert len(api.list_books()) == len(library.execute("SELECT Z_PK FROM ZBKLIBRARYASSET"))
+            api.refresh()
+        finally:
+            api.close()
@@ -15,6 +15,8 @@ from __future__ import annotations
 
 import os
 import pathlib
+import xml.etree.ElementTree as ET
+from html.parser import HTMLParser
 from unittest.mock import patch
 
 import pytest
@@ -22,11 +24,19 @@ import pytest
 from py_apple_books.content import (
     BookContent,
     Chapter,
+    ChapterIndex,
+    ChapterTextCache,
+    _Package,
     _parse_ncx_bytes,
     is_downloaded,
 )
 from py_apple_books.exceptions import AppleBooksError
-from py_apple_books.utils import extract_chapter_text, normalize_whitespace
+from py_apple_books.utils import (
+    _WhitespaceNormalizer,
+    extract_chapter_text,
+    extract_sections_text,
+    normalize_whitespace,
+)
 
 
 # ---------------------------------------------------------------------------
@@ -58,6 +68,15 @@ class TestNormalizeWhitespace:
     def test_strips_leading_and_trailing(self):
         assert normalize_whitespace("\n\n  hello world  \n\n") == "hello world"
 
+    def test_incremental_writes_match_whole_text(self):
+        text = "a\r\n\r\nb \t c\x0b\x0cd\u2028e\r\rf  \n"
+        expected = normalize_whitespace(text)
+        for size in (1, 2, 3, 7):
+            normalizer = _WhitespaceNormalizer()
+            for i in range(0, len(text), size):
+                normalizer.write(text[i:i + size])
+            assert normalizer.getvalue() == expected
+
 
 # ---------------------------------------------------------------------------
 # _parse_ncx_bytes
@@ -284,6 +303,65 @@ class TestExtractChapterText:
         )
         assert extract_chapter_text(html, None, set()) == ""
 
+    def test_whitespace_only_runs_collapse_outside_pre(self):
+        html = (
+            b"<body><span>a</span>\n \n<span>b</span>"
+            b"<pre><span>c</span>\n \n<span>d</span></pre></body>"
+        )
+        assert extract_chapter_text(html, None, set()) == "a\nb\nc\n\nd"
+
+    def test_end_tag_closes_most_recent_open_element(self):
+        # </div> closes the unclosed <p> with it; a stray </p> does nothing.
+        html = b"<body><div><p>one</div></p>two<br></br>three</body>"
+        assert extract_chapter_text(html, None, set()) == "one\n\ntwo\n\nthree"
+
+    def test_text_outside_body_is_ignored(self):
+        html = b"<html>before<body><p>inside</p></body>after</html>"
+        assert extract_chapter_text(html, None, set()) == "inside"
+
+    def test_character_references(self):
+        html = b"<p>caf&eacute; &amp; &#8220;q&#x201d; &#150; &nbsp;x &bogus;</p>"
+        assert extract_chapter_text(html, None, set()) == "caf\u00e9 & \u201cq\u201d \u2013 \u00a0x &bogus"
+
+    def test_ruby_annotations_and_comments_excluded(self):
+        html = "<body><ruby>\u6f22<rt>kan</rt></ruby><!-- note --><p>x</p></body>".encode()
+        assert extract_chapter_text(html, None, set()) == "\u6f22\nx"
+
+    def test_declared_encoding_is_honoured(self):
+        html = '<?xml version="1.0" encoding="iso-8859-1"?><p>caf\u00e9</p>'.encode("latin-1")
+        assert extract_chapter_text(html, None, set()) == "caf\u00e9"
+
+    def test_stops_parsing_at_stop_anchor(self):
+        # Everything past the stop anchor is never parsed.
+        html = b'<body><a id="A"/><p>section A</p><a id="B"/><p>B' + b"<p>x</p>" * 1000
+        with patch("py_apple_books.utils._ChapterTextParser.handle_data", autospec=True,
+                   side_effect=lambda self, data: self.data.append(data)) as handle_data:
+            assert extract_chapter_text(html, "A", {"B"}) == "section A"
+        assert handle_data.call_count < 5
+
+
+class TestExtractSectionsText:
+    HTML = (
+        b'<body><p>Intro</p><h2 id="A">One</h2><p>a</p>'
+        b'<h2 id="B">Two</h2><p>b</p><h2 id="C">Three</h2><p>c</p></body>'
+    )
+
+    def test_each_section_matches_single_extraction(self):
+        fragments = {"", "A", "B", "C", "missing"}
+        sections = extract_sections_text(self.HTML, fragments)
+        anchors = fragments - {""}
+        assert sections == {
+            f: extract_chapter_text(self.HTML, f or None, anchors - {f}) for f in fragments
+        }
+        assert sections["B"] == "Two\n\nb"
+        assert sections["missing"] == sections[""]
+
+    def test_single_parse(self):
+        with patch("py_apple_books.utils._ChapterTextParser.feed", autospec=True,
+                   side_effect=HTMLParser.feed) as feed:
+            extract_sections_text(self.HTML, {"A", "B", "C"})
+        assert feed.call_count == 1
+
 
 # ---------------------------------------------------------------------------
 # is_downloaded
@@ -486,6 +564,380 @@ class TestGetChapter:
             assert isinstance(text, str)
 
 
+class TestChapterIndex:
+    @staticmethod
+    def _index() -> ChapterIndex:
+        chapters = [
+            Chapter(id="2", title="Intro", href="a.xhtml", fragment="", order=1, depth=0),
+            Chapter(id="sec-a", title="A", href="b.xhtml", fragment="A", order=2, depth=0),
+            Chapter(id="sec-b", title="B", href="b.xhtml", fragment="B", order=3, depth=0),
+            Chapter(id="sec-c", title="C", href="b.xhtml", fragment="C", order=4, depth=0),
+        ]
+        return ChapterIndex.build(
+            chapters,
+            spine=["item-a", "item-b"],
+            manifest={"item-a": "a.xhtml", "item-b": "b.xhtml", "css": "style.css"},
+        )
+
+    def test_find_by_id_and_order(self):
+        index = self._index()
+        assert index.find("sec-b").title == "B"
+        assert index.find("4").title == "C"
+        assert index.find("nope") is None
+
+    def test_find_only_matches_canonical_order(self):
+        index = self._index()
+        assert index.find("04") is None
+        assert index.find(" 4") is None
+        assert index.find("\u00b2") is None
+
+    def test_find_prefers_earlier_chapter_on_id_order_clash(self):
+        # "2" is chapter 1's id and chapter 2's order, as with a linear
+        # scan checking both.
+        assert self._index().find("2").title == "Intro"
+
+    def test_file_groups_and_stop_anchors(self):
+        index = self._index()
+        assert [ch.id for ch in index.by_href["b.xhtml"]] == ["sec-a", "sec-b", "sec-c"]
+        assert index.stop_anchors(index.by_id["sec-b"]) == {"A", "C"}
+        assert index.stop_anchors(index.by_id["2"]) == frozenset()
+
+    def test_spine_and_manifest_maps(self):
+        index = self._index()
+        assert index.spine_position("item-b") == 1
+        assert index.spine_position("css") is None
+        assert index.href_to_item_id["b.xhtml"] == "item-b"
+
+    def test_maps_are_read_only(self):
+        with pytest.raises(TypeError):
+            self._index().by_id["x"] = None  # type: ignore[index]
+
+    def test_built_once_per_instance(self, simple_epub):
+        content = BookContent(simple_epub.path)
+        with patch.object(
+            BookContent, "_build_index", autospec=True, side_effect=BookContent._build_index
+        ) as build:
+            for ch in content.list_chapters():
+                content.get_chapter(ch.id)
+            assert content.chapter_index() is content.chapter_index()
+        assert build.call_count == 1
+
+
+_CONTAINER = (
+    '<?xml version="1.0"?>'
+    '<container version="1.0" xmlns="urn:oasis:names:tc:opendocument:xmlns:container">'
+    '<rootfiles><rootfile full-path="OEBPS/content.opf" '
+    'media-type="application/oebps-package+xml"/></rootfiles></container>'
+)
+
+
+def _xhtml(body: str) -> str:
+    return f'<html xmlns="http://www.w3.org/1999/xhtml"><body>{body}</body></html>'
+
+
+def _write_bundle(root: pathlib.Path, manifest: str, spine: str, files: dict) -> pathlib.Path:
+    """Write an unzipped EPUB with its OPF at ``OEBPS/content.opf``."""
+    (root / "META-INF").mkdir(parents=True)
+    (root / "META-INF" / "container.xml").write_text(_CONTAINER)
+    (root / "OEBPS").mkdir()
+    (root / "OEBPS" / "content.opf").write_text(
+        '<?xml version="1.0"?>'
+        '<package xmlns="http://www.idpf.org/2007/opf" version="3.0" unique-identifier="id">'
+        '<metadata xmlns:dc="http://purl.org/dc/elements/1.1/">'
+        '<dc:identifier id="id">x</dc:identifier><dc:title>T</dc:title>'
+        '<dc:language>en</dc:language></metadata>'
+        f"<manifest>{manifest}</manifest>{spine}</package>"
+    )
+    for name, text in files.items():
+        path = root / "OEBPS" / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text)
+    return root
+
+
+@pytest.fixture
+def nav_only_epub(tmp_path):
+    """EPUB3 bundle with a nested nav document and no NCX."""
+    nav = (
+        '<html xmlns="http://www.w3.org/1999/xhtml" xmlns:epub="http://www.idpf.org/2007/ops">'
+        '<body><nav epub:type="toc"><ol>'
+        '<li><a href="text/part1.xhtml">Part <em>One</em></a><ol>'
+        '<li><a href="text/part1.xhtml#s1">Section 1</a></li>'
+        '<li><a href="text/part1.xhtml#s2">Section 2</a></li>'
+        "</ol></li>"
+        '<li><a href="text/part%202.xhtml">Part Two</a></li>'
+        "</ol></nav></body></html>"
+    )
+    return _write_bundle(
+        tmp_path / "nav.epub",
+        manifest=(
+            '<item id="nav" href="nav.xhtml" media-type="application/xhtml+xml" properties="nav"/>'
+            '<item id="p1" href="text/part1.xhtml" media-type="application/xhtml+xml"/>'
+            '<item id="p2" href="text/part%202.xhtml" media-type="application/xhtml+xml"/>'
+        ),
+        spine='<spine><itemref idref="p1"/><itemref idref="p2"/></spine>',
+        files={
+            "nav.xhtml": nav,
+            "text/part1.xhtml": _xhtml(
+                '<h1>Part One</h1><a id="s1"/><p>First section.</p>'
+                '<a id="s2"/><p>Second section.</p>'
+            ),
+            "text/part 2.xhtml": _xhtml("<p>Part two text.</p>"),
+        },
+    )
+
+
+def _via_ebooklib(path: pathlib.Path) -> BookContent:
+    """BookContent forced onto the ebooklib fallback."""
+    content = BookContent(path)
+    with patch.object(_Package, "read", side_effect=ValueError):
+        content.chapter_index()
+    return content
+
+
+class TestNativePackageReader:
+    def test_does_not_load_book_through_ebooklib(self, simple_epub):
+        content = BookContent(simple_epub.path)
+        with patch("py_apple_books.content.epub.read_epub", side_effect=AssertionError):
+            chapters = content.list_chapters()
+            assert "Chapter 2" in content.get_chapter(chapters[1].id)
+        assert content._book is None
+
+    def test_ncx_book_matches_ebooklib(self, simple_epub):
+        assert (
+            BookContent(simple_epub.path).list_chapters()
+            == _via_ebooklib(simple_epub.path).list_chapters()
+        )
+
+    def test_nav_book_matches_ebooklib(self, nav_only_epub):
+        chapters = BookContent(nav_only_epub).list_chapters()
+        assert [(c.title, c.href, c.fragment, c.depth) for c in chapters] == [
+            ("Part One", "OEBPS/text/part1.xhtml", "", 0),
+            ("Section 1", "OEBPS/text/part1.xhtml", "s1", 1),
+            ("Section 2", "OEBPS/text/part1.xhtml", "s2", 1),
+            ("Part Two", "OEBPS/text/part 2.xhtml", "", 0),
+        ]
+        assert chapters == _via_ebooklib(nav_only_epub).list_chapters()
+
+    def test_nav_preferred_over_ncx_like_ebooklib(self, tmp_path):
+        ncx = (
+            '<ncx xmlns="http://www.daisy.org/z3986/2005/ncx/" version="2005-1"><navMap>'
+            '<navPoint id="np1"><navLabel><text>From NCX</text></navLabel>'
+            '<content src="a.xhtml"/></navPoint></navMap></ncx>'
+        )
+        nav = (
+            '<html xmlns="http://www.w3.org/1999/xhtml" xmlns:epub="http://www.idpf.org/2007/ops">'
+            '<body><nav epub:type="toc"><ol>'
+            '<li><a href="a.xhtml">From Nav</a><ol>'
+            '<li><a href="a.xhtml#sub">Nav Sub</a></li></ol></li>'
+            "</ol></nav></body></html>"
+        )
+        root = _write_bundle(
+            tmp_path / "both.epub",
+            manifest=(
+                '<item id="ncx" href="toc.ncx" media-type="application/x-dtbncx+xml"/>'
+                '<item id="nav" href="nav.xhtml" media-type="application/xhtml+xml" properties="nav"/>'
+                '<item id="a" href="a.xhtml" media-type="application/xhtml+xml"/>'
+            ),
+            spine='<spine toc="ncx"><itemref idref="a"/></spine>',
+            files={
+                "toc.ncx": ncx,
+                "nav.xhtml": nav,
+                "a.xhtml": _xhtml('<p>Top</p><p id="sub">Sub</p>'),
+            },
+        )
+        chapters = BookContent(root).list_chapters()
+        assert [c.title for c in chapters] == ["From Nav", "Nav Sub"]
+        assert chapters == _via_ebooklib(root).list_chapters()
+
+    def test_nav_toc_chosen_by_epub_type(self, tmp_path):
+        nav = (
+            '<html xmlns="http://www.w3.org/1999/xhtml" xmlns:epub="http://www.idpf.org/2007/ops">'
+            '<body><nav id="toc" epub:type="landmarks"><ol>'
+            '<li><a href="a.xhtml">Landmark</a></li></ol></nav>'
+            '<nav epub:type="toc directory"><ol>'
+            '<li><a href="a.xhtml">Real Chapter</a></li></ol></nav></body></html>'
+        )
+        root = _write_bundle(
+            tmp_path / "landmarks.epub",
+            manifest=(
+                '<item id="nav" href="nav.xhtml" media-type="application/xhtml+xml" properties="nav"/>'
+                '<item id="a" href="a.xhtml" media-type="application/xhtml+xml"/>'
+            ),
+            spine='<spine><itemref idref="a"/></spine>',
+            files={"nav.xhtml": nav, "a.xhtml": _xhtml("<p>A</p>")},
+        )
+        assert [c.title for c in BookContent(root).list_chapters()] == ["Real Chapter"]
+
+    def test_ncx_in_subdirectory_resolves_parent_hrefs(self, tmp_path):
+        ncx = (
+            '<ncx xmlns="http://www.daisy.org/z3986/2005/ncx/" version="2005-1"><navMap>'
+            '<navPoint id="np1"><navLabel><text>A</text></navLabel>'
+            '<content src="../text/a.xhtml"/></navPoint></navMap></ncx>'
+        )
+        root = _write_bundle(
+            tmp_path / "sub.epub",
+            manifest=(
+                '<item id="ncx" href="toc/toc.ncx" media-type="application/x-dtbncx+xml"/>'
+                '<item id="a" href="text/a.xhtml" media-type="application/xhtml+xml"/>'
+            ),
+            spine='<spine toc="ncx"><itemref idref="a"/></spine>',
+            files={"toc/toc.ncx": ncx, "text/a.xhtml": _xhtml("<p>A</p>")},
+        )
+        chapters = BookContent(root).list_chapters()
+        assert [(c.id, c.href) for c in chapters] == [("a", "OEBPS/text/a.xhtml")]
+
+    def test_chapter_text_read_from_disk(self, nav_only_epub):
+        content = BookContent(nav_only_epub)
+        assert content.get_chapter("p2") == "Part two text."
+        section = content.list_chapters()[2]
+        assert content.get_chapter(section.id) == "Second section."
+
+    def test_spine_and_manifest(self, nav_only_epub):
+        index = BookContent(nav_only_epub).chapter_index()
+        assert index.spine == ("p1", "p2")
+        assert index.manifest["nav"] == "OEBPS/nav.xhtml"
+
+    def test_media_type_ncx_fallback(self, tmp_path):
+        ncx = (
+            '<ncx xmlns="http://www.daisy.org/z3986/2005/ncx/" version="2005-1"><navMap>'
+            '<navPoint id="bm1"><navLabel><text>Only</text></navLabel>'
+            '<content src="a.xhtml"/></navPoint></navMap></ncx>'
+        )
+        root = _write_bundle(
+            tmp_path / "ncx.epub",
+            manifest=(
+                '<item id="toc" href="toc.ncx" media-type="application/x-dtbncx+xml"/>'
+                '<item id="a" href="a.xhtml" media-type="application/xhtml+xml"/>'
+            ),
+            spine='<spine><itemref idref="a"/></spine>',
+            files={"toc.ncx": ncx, "a.xhtml": _xhtml("<p>A</p>")},
+        )
+        chapters = BookContent(root).list_chapters()
+        assert [(c.id, c.title, c.href) for c in chapters] == [("bm1", "Only", "OEBPS/a.xhtml")]
+
+    def test_falls_back_to_ebooklib_for_unreadable_package(self, simple_epub):
+        content = BookContent(simple_epub.path)
+        with patch.object(_Package, "read", side_effect=ET.ParseError("bad")):
+            assert [c.title for c in content.list_chapters()] == [
+                "Chapter 1", "Chapter 2", "Chapter 3"
+            ]
+        assert content._book is not None
+
+
+class TestSections:
+    PART1 = "OEBPS/text/part1.xhtml"
+
+    def test_get_sections_splits_file(self, nav_only_epub):
+        assert BookContent(nav_only_epub).get_sections(self.PART1 + "#s1") == {
+            "": "Part One\n\nFirst section.\n\nSecond section.",
+            "s1": "First section.",
+            "s2": "Second section.",
+        }
+
+    def test_get_sections_unknown_href_raises(self, nav_only_epub):
+        with pytest.raises(AppleBooksError, match="No file"):
+            BookContent(nav_only_epub).get_sections("OEBPS/nope.xhtml")
+
+    def test_sibling_sections_come_from_one_read(self, nav_only_epub):
+        content = BookContent(nav_only_epub)
+        chapters = content.list_chapters()
+        with patch.object(BookContent, "_read_chapter_bytes", autospec=True,
+                          side_effect=BookContent._read_chapter_bytes) as read:
+            texts = [content.get_chapter(ch.id) for ch in chapters[:3]]
+            assert texts[1:] == ["First section.", "Second section."]
+            assert content.get_chapter("p1") == texts[0]
+        assert read.call_count == 1
+
+    def test_iter_chapters(self, nav_only_epub):
+        content = BookContent(nav_only_epub)
+        pairs = list(content.iter_chapters())
+        assert [ch for ch, _ in pairs] == content.list_chapters()
+        assert [text for _, text in pairs] == [
+            BookContent(nav_only_epub).get_chapter(ch.id) for ch, _ in pairs
+        ]
+
+
+class TestChapterTextCache:
+    def test_lru_eviction_by_characters(self):
+        cache = ChapterTextCache(max_size=10)
+        cache.put(("b", "x", 1), {"": "aaaa"})
+        cache.put(("b", "y", 1), {"": "bbbb"})
+        assert cache.get(("b", "x", 1)) == {"": "aaaa"}
+        cache.put(("b", "z", 1), {"": "cccc"})
+        assert cache.get(("b", "y", 1)) is None
+        stats = cache.stats()
+        assert (stats.hits, stats.misses, stats.evictions) == (1, 1, 1)
+        assert (stats.entries, stats.size) == (2, 8)
+
+    def test_oversized_entry_not_cached(self):
+        cache = ChapterTextCache(max_size=3)
+        cache.put(("b", "x", 1), {"": "long text"})
+        assert cache.stats().entries == 0
+
+    def test_cold_entries_compressed(self):
+        cache = ChapterTextCache(compress=True, hot_entries=1)
+        text = "the same sentence again. " * 200
+        cache.put(("b", "x", 1), {"": text, "s1": "x"})
+        cache.put(("b", "y", 1), {"": "short"})
+        stats = cache.stats()
+        assert stats.compressed_entries == 1
+        assert stats.size < len(text)
+        assert cache.get(("b", "x", 1)) == {"": text, "s1": "x"}
+        assert cache.stats().compressed_entries == 1  # "y" went cold
+
+    def test_shared_across_instances(self, nav_only_epub):
+        BookContent(nav_only_epub).get_chapter("p2")
+        with patch.object(BookContent, "_read_chapter_bytes", side_effect=AssertionError):
+            assert BookContent(nav_only_epub).get_chapter("p2") == "Part two text."
+
+    def test_toc_change_splits_again(self, nav_only_epub):
+        cache = ChapterTextCache()
+        BookContent(nav_only_epub, text_cache=cache).get_chapter("p2")
+        nav = nav_only_epub / "OEBPS" / "nav.xhtml"
+        nav.write_text(nav.read_text().replace(
+            "</ol></nav>", '<li><a href="text/part%202.xhtml#x">X</a></li></ol></nav>'
+        ))
+        content = BookContent(nav_only_epub, text_cache=cache)
+        assert [content.get_chapter(ch.id) for ch in content.list_chapters()[-2:]] == [
+            "Part two text.", "Part two text."
+        ]
+
+    def test_whole_file_lookup_is_a_miss(self, tmp_path):
+        nav = (
+            '<html xmlns="http://www.w3.org/1999/xhtml" xmlns:epub="http://www.idpf.org/2007/ops">'
+            '<body><nav epub:type="toc"><ol>'
+            '<li><a href="a.xhtml#s1">One</a></li><li><a href="a.xhtml#s2">Two</a></li>'
+            "</ol></nav></body></html>"
+        )
+        root = _write_bundle(
+            tmp_path / "frag.epub",
+            manifest=(
+                '<item id="nav" href="nav.xhtml" media-type="application/xhtml+xml" properties="nav"/>'
+                '<item id="a" href="a.xhtml" media-type="application/xhtml+xml"/>'
+            ),
+            spine='<spine><itemref idref="a"/></spine>',
+            files={"nav.xhtml": nav,
+                   "a.xhtml": _xhtml('<p id="s1">One</p><p id="s2">Two</p>')},
+        )
+        cache = ChapterTextCache()
+        content = BookContent(root, text_cache=cache)
+        assert content.get_chapter(content.list_chapters()[0].id) == "One"
+        assert content.get_chapter("a") == "One\n\nTwo"
+        stats = cache.stats()
+        assert (stats.hits, stats.misses) == (0, 2)
+
+    def test_file_change_is_picked_up(self, nav_only_epub):
+        cache = ChapterTextCache()
+        content = BookContent(nav_only_epub, text_cache=cache)
+        assert content.get_chapter("p2") == "Part two text."
+        path = nav_only_epub / "OEBPS" / "text" / "part 2.xhtml"
+        path.write_text(_xhtml("<p>Revised.</p>"))
+        os.utime(path, ns=(path.stat().st_atime_ns, path.stat().st_mtime_ns + 10**9))
+        assert content.get_chapter("p2") == "Revised."
+        assert cache.stats().misses == 2
+
+
 # ---------------------------------------------------------------------------
 # Chapter dataclass sanity
 # ---------------------------------------------------------------------------
@@ -0,0 +1,62 @@
+"""Tests for py_apple_books.db.functions and the lookups built on them."""
+
+from __future__ import annotations
+
+import sqlite3
+from contextlib import closing
+
+import pytest
+
+from py_apple_books.db.functions import compile_pattern, fold, regexp, register_functions
+from py_apple_books.models import Annotation
+
+
+class TestFunctions:
+    def test_fold(self):
+        assert fold("Straße") == "strasse"
+        assert fold("CAFÉ Ünïcödé") == "cafe unicode"
+        assert fold(None) is None
+
+    def test_regexp(self):
+        assert regexp(r"^h\w+", "highlight") == 1
+        assert regexp(r"^x", "highlight") == 0
+        assert regexp(r"x", None) is None
+
+    def test_patterns_are_cached(self):
+        compile_pattern.cache_clear()
+        regexp("a+", "aaa")
+        regexp("a+", "baa")
+        assert compile_pattern.cache_info().hits == 1
+
+    def test_registered_on_connection(self):
+        conn = sqlite3.connect(":memory:")
+        register_functions(conn)
+        assert conn.execute("SELECT 'Éclair' REGEXP '^É', FOLD('Éclair')").fetchone() == (1, "eclair")
+
+
+@pytest.fixture
+def unicode_notes(library):
+    path = next(library.anno_db[1].glob("*.sqlite"))
+    with closing(sqlite3.connect(path)) as conn, conn:
+        conn.execute("UPDATE ZAEANNOTATION SET ZANNOTATIONNOTE = 'Über die STRASSE' WHERE Z_PK = 5")
+        conn.execute("UPDATE ZAEANNOTATION SET ZANNOTATIONNOTE = 'le café_noir' WHERE Z_PK = 10")
+    return library
+
+
+class TestLookups:
+    def test_icontains_folds_case_and_accents(self, unicode_notes):
+        assert [a.id for a in Annotation.manager.filter(note__icontains="über die straße")] == [5]
+        assert [a.id for a in Annotation.manager.filter(note__icontains="CAFE")] == [10]
+
+    def test_icontains_escapes_wildcards(self, unicode_notes):
+        assert [a.id for a in Annotation.manager.filter(note__icontains="é_n")] == [10]
+        assert list(Annotation.manager.filter(note__icontains="%")) == []
+
+    def test_regex(self, unicode_notes):
+        assert [a.id for a in Annotation.manager.filter(note__regex=r"^note 1\d$")] == [15]
+        assert list(Annotation.manager.filter(note__regex=r"^über")) == []
+        assert [a.id for a in Annotation.manager.filter(note__iregex=r"^über")] == [5]
+
+    def test_invalid_regex(self, library):
+        with pytest.raises(ValueError):
+            Annotation.manager.filter(note__regex="(")
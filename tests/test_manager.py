@@ -0,0 +1,416 @@
+"""Tests for py_apple_books.models.manager against a real SQLite file.
+
+Uses the miniature library from ``conftest.py``: six books, five
+annotations per book (one reading-position bookmark, three highlights,
+one note) and three collections. Query counts are asserted through a
+small recorder wrapped around the client, since avoiding round-trips
+is the point of most of this layer.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from py_apple_books.models import Annotation, Book, Collection, Count, Max, Min, Q, Sum
+from tests.conftest import LIBRARY_ANNOTATIONS_PER_BOOK, LIBRARY_BOOK_COUNT
+
+
+@pytest.fixture
+def queries(library, monkeypatch):
+    """List that records every ``(sql, params)`` the client executes."""
+    log = []
+    execute = library.execute
+    iterate = library.iterate
+
+    def recording_execute(query, params=(), row_factory=None):
+        log.append((query, params))
+        return execute(query, params, row_factory=row_factory)
+
+    def recording_iterate(query, params=(), chunk_size=2000, row_factory=None):
+        log.append((query, params))
+        return iterate(query, params, chunk_size=chunk_size, row_factory=row_factory)
+
+    monkeypatch.setattr(library, "execute", recording_execute)
+    monkeypatch.setattr(library, "iterate", recording_iterate)
+    return log
+
+
+class TestConnectionLifecycle:
+    def test_nothing_opens_until_first_query(self, library):
+        assert not library.is_open
+        Book.manager.filter(title__contains="Book")
+        assert not library.is_open
+        list(Book.manager.all())
+        assert library.is_open
+
+    def test_close_then_reopen_on_next_query(self, library):
+        assert len(list(Book.manager.all())) == LIBRARY_BOOK_COUNT
+        library.close()
+        assert not library.is_open
+        assert len(list(Book.manager.all())) == LIBRARY_BOOK_COUNT
+
+    def test_context_manager_closes(self, library):
+        with library:
+            list(Book.manager.all())
+            assert library.is_open
+        assert not library.is_open
+
+
+class TestEvaluation:
+    def test_results_are_cached_after_first_evaluation(self, queries):
+        books = Book.manager.all()
+        first = list(books)
+        second = list(books)
+        assert len(books) == LIBRARY_BOOK_COUNT
+        assert first == second
+        assert len(queries) == 1
+
+    def test_len_before_evaluation_counts_in_sql(self, queries):
+        assert len(Book.manager.all()) == LIBRARY_BOOK_COUNT
+        assert queries[0][0].startswith("SELECT COUNT(*) FROM")
+
+    def test_index_reads_a_single_row(self, queries):
+        book = Book.manager.filter(id=3)[0]
+        assert book.title == "Book 3"
+        assert queries[0][0].endswith("LIMIT ?")
+        assert queries[0][1] == (3, 1)
+
+    def test_index_out_of_range(self, library):
+        with pytest.raises(IndexError):
+            Book.manager.filter(id=999)[0]
+
+    def test_slices_compose_limit_and_offset(self, library):
+        window = Book.manager.all(order_by="id")[1:5][1:3]
+        assert [b.id for b in window] == [3, 4]
+        assert len(Book.manager.all(limit=4)[2:10]) == 2
+
+    def test_negative_index_still_supported(self, library):
+        assert Book.manager.all(order_by="id")[-1].id == LIBRARY_BOOK_COUNT
+
+    def test_only_projection_labels_fields_correctly(self, library):
+        book = Book.manager.all(only=["ZTITLE"], order_by="id")[0]
+        assert book.title == "Book 1"
+        assert book.id is None
+
+
+class TestStreaming:
+    def test_iterator_yields_every_row(self, library):
+        streamed = [a.id for a in Annotation.manager.all().iterator(chunk_size=4)]
+        assert len(streamed) == LIBRARY_BOOK_COUNT * LIBRARY_ANNOTATIONS_PER_BOOK
+
+    def test_iterator_does_not_populate_cache(self, queries):
+        annotations = Annotation.manager.all()
+        list(annotations.iterator(chunk_size=3))
+        list(annotations.iterator(chunk_size=3))
+        assert len(queries) == 2
+
+    def test_iterator_rejects_non_positive_chunk_size(self, library):
+        with pytest.raises(ValueError):
+            list(Book.manager.all().iterator(chunk_size=0))
+
+
+class TestRelations:
+    def test_building_models_runs_no_relation_queries(self, queries):
+        annotations = list(Annotation.manager.all())
+        assert len(queries) == 1
+        assert annotations[0].book.asset_id == annotations[0].asset_id
+        assert len(queries) == 2
+
+    def test_relation_is_memoized(self, queries):
+        annotation = Annotation.manager.filter(id=2)[0]
+        assert annotation.book is annotation.book
+        assert len(queries) == 2
+
+    def test_one_to_many_applies_extra_filters(self, library):
+        book = Book.manager.filter(id=1)[0]
+        # Reading-position bookmark (type 3) is excluded.
+        assert len(book.annotations) == LIBRARY_ANNOTATIONS_PER_BOOK - 1
+
+    def test_many_to_many_both_directions(self, library):
+        collection = Collection.manager.filter(id=1)[0]
+        assert sorted(b.asset_id for b in collection.books) == ["ASSET1", "ASSET2"]
+        book = Book.manager.filter(id=3)[0]
+        assert [c.title for c in book.collections] == ["Later"]
+
+
+class TestPrefetch:
+    def test_many_to_one_in_one_query(self, queries):
+        annotations = list(Annotation.manager.all().prefetch("book"))
+        assert len(queries) == 2
+        assert all(a.book.asset_id == a.asset_id for a in annotations)
+        assert len(queries) == 2
+
+    def test_one_to_many_sets_reverse_side(self, queries):
+        books = list(Book.manager.all().prefetch("annotations"))
+        assert len(queries) == 2
+        for book in books:
+            assert len(book.annotations) == LIBRARY_ANNOTATIONS_PER_BOOK - 1
+            assert all(a.book is book for a in book.annotations)
+        assert len(queries) == 2
+
+    def test_many_to_many(self, queries):
+        collections = list(Collection.manager.all(order_by="id").prefetch("books"))
+        # collections, join table, books
+        assert len(queries) == 3
+        assert [sorted(b.id for b in c.books) for c in collections] == [[1, 2], [3], []]
+        assert len(queries) == 3
+
+    def test_prefetch_with_streaming(self, queries):
+        annotations = list(Annotation.manager.all().prefetch("book").iterator(chunk_size=10))
+        assert all(a.book is not None for a in annotations)
+        # one annotation query plus one book query per chunk
+        assert len(queries) == 1 + 3
+
+    def test_unknown_relation(self, library):
+        with pytest.raises(ValueError):
+            Book.manager.all().prefetch("nope")
+
+
+class TestPredicates:
+    def test_or_group_combines_with_keyword_filters(self, library):
+        highlights = Annotation.manager.filter(Q(style=1) | Q(style=2), type=1)
+        assert len(highlights) == 2 * LIBRARY_BOOK_COUNT
+        assert {a.style for a in highlights} == {1, 2}
+
+    def test_negation(self, library):
+        assert len(Annotation.manager.filter(~Q(type=3))) == \
+            (LIBRARY_ANNOTATIONS_PER_BOOK - 1) * LIBRARY_BOOK_COUNT
+
+    def test_nested_groups(self, library):
+        matches = Annotation.manager.filter((Q(type=2) | Q(style=1)) & ~Q(asset_id="ASSET1"))
+        assert len(matches) == 2 * (LIBRARY_BOOK_COUNT - 1)
+
+    def test_combining_with_non_q_is_an_error(self):
+        with pytest.raises(TypeError):
+            Q(style=1) | {"style": 2}
+
+    def test_search_by_text_limit_is_exact(self, library, queries):
+        from py_apple_books import PyAppleBooks
+
+        results = list(PyAppleBooks().search_annotation_by_text("note", limit=2))
+        assert len(results) == 2
+        assert all(a.type == 2 for a in results)
+        assert len(queries) == 1
+
+
+class TestAggregation:
+    def test_count_and_exists_on_manager(self, library, queries):
+        assert Book.manager.count() == LIBRARY_BOOK_COUNT
+        assert Book.manager.exists()
+        assert not Book.manager.filter(title="missing").exists()
+        assert all("COUNT(*)" in sql or "SELECT 1 " in sql for sql, _ in queries)
+
+    def test_exists_respects_window(self, library):
+        assert not Book.manager.all()[LIBRARY_BOOK_COUNT:].exists()
+        assert Book.manager.all()[LIBRARY_BOOK_COUNT - 1:].exists()
+
+    def test_aggregate(self, library):
+        result = Annotation.manager.filter(type=1).aggregate(
+            Count("*"), Min("style"), Max("style"), total=Sum("style"), books=Count("asset_id", distinct=True),
+        )
+        assert result == {
+            "count": 3 * LIBRARY_BOOK_COUNT,
+            "style__min": 1,
+            "style__max": 3,
+            "total": 6 * LIBRARY_BOOK_COUNT,
+            "books": LIBRARY_BOOK_COUNT,
+        }
+
+    def test_aggregate_over_window(self, library):
+        assert Book.manager.all(order_by="id")[:2].aggregate(Max("id")) == {"id__max": 2}
+
+    def test_aggregate_over_ordered_window(self, library):
+        newest = Book.manager.all(order_by="-id")[:2]
+        assert newest.aggregate(Min("id")) == {"id__min": LIBRARY_BOOK_COUNT - 1}
+
+    def test_aggregate_requires_aggregates(self, library):
+        with pytest.raises(TypeError):
+            Book.manager.aggregate(total="id")
+
+    def test_values_annotate_groups(self, library, queries):
+        per_book = Annotation.manager.filter(type=1, order_by="asset_id").values("asset_id").annotate(Count("*"))
+        rows = list(per_book)
+        assert rows == [{"asset_id": f"ASSET{i}", "count": 3} for i in range(1, LIBRARY_BOOK_COUNT + 1)]
+        assert len(queries) == 1 and "GROUP BY ZANNOTATIONASSETID" in queries[0][0]
+        assert per_book.count() == LIBRARY_BOOK_COUNT
+
+    def test_per_genre_counts(self, library):
+        counts = {row["genre"]: row["books"] for row in Book.manager.values("genre").annotate(books=Count())}
+        assert counts == {"Fiction": 2, "History": 2, "Science": 2}
+
+    def test_values_without_annotate(self, library):
+        row = Book.manager.filter(id=1).values("id", "title")[0]
+        assert row == {"id": 1, "title": "Book 1"}
+
+    def test_annotation_name_clash(self, library):
+        with pytest.raises(ValueError):
+            Book.manager.values("genre").annotate(genre=Count())
+
+
+class TestProjections:
+    def test_values_selects_only_requested_columns(self, library, queries):
+        rows = list(Annotation.manager.filter(type=2, order_by="id").values("asset_id", "note"))
+        assert rows[0] == {"asset_id": "ASSET1", "note": "note 5"}
+        assert queries[0][0].startswith("SELECT ZANNOTATIONASSETID, ZANNOTATIONNOTE FROM")
+
+    def test_values_list_tuples(self, library):
+        pairs = Annotation.manager.filter(type=2, order_by="id").values_list("asset_id", "selected_text")
+        assert list(pairs)[:2] == [("ASSET1", "highlight 5"), ("ASSET2", "highlight 10")]
+
+    def test_values_list_flat(self, library):
+        titles = Book.manager.filter(order_by="id").values_list("title", flat=True)
+        assert list(titles) == [f"Book {i}" for i in range(1, LIBRARY_BOOK_COUNT + 1)]
+        assert titles[1] == "Book 2"
+
+    def test_flat_requires_one_field(self, library):
+        with pytest.raises(TypeError):
+            Book.manager.values_list("id", "title", flat=True)
+
+    def test_values_list_streams(self, library):
+        ids = Book.manager.values_list("id", flat=True).iterator(chunk_size=2)
+        assert sorted(ids) == list(range(1, LIBRARY_BOOK_COUNT + 1))
+
+    def test_values_list_annotate(self, library):
+        rows = Book.manager.filter(order_by="genre").values_list("genre").annotate(Count())
+        assert list(rows) == [("Fiction", 2), ("History", 2), ("Science", 2)]
+
+    def test_row_factory_applies_on_cache_hits(self, library):
+        from py_apple_books.models.manager import ModelManager
+
+        ModelManager.compiler.enable_cache()
+        try:
+            first = list(Book.manager.filter(id=1).values("title"))
+            second = list(Book.manager.filter(id=1).values("title"))
+            assert first == second == [{"title": "Book 1"}]
+            assert ModelManager.compiler.cache_stats().hits == 1
+        finally:
+            ModelManager.compiler.disable_cache()
+
+
+class TestPagination:
+    def _walk(self, iterable, **options):
+        pages, after = [], None
+        while True:
+            page = iterable.paginate(after=after, **options)
+            pages.append(page)
+            if not page.has_next:
+                return pages
+            after = page.next_token
+
+    def test_walks_every_row_once(self, library):
+        pages = self._walk(Annotation.manager.filter(type__ne=3), page_size=7)
+        ids = [a.id for page in pages for a in page]
+        assert ids == sorted(ids)
+        assert len(ids) == (LIBRARY_ANNOTATIONS_PER_BOOK - 1) * LIBRARY_BOOK_COUNT
+        assert [len(page) for page in pages] == [7, 7, 7, 3]
+
+    def test_descending_with_ties_and_nulls(self, library):
+        # Every book repeats the same styles, so the pk tiebreaker does
+        # real work.
+        pages = self._walk(Annotation.manager.all(), order_by="-style", page_size=4)
+        rows = [(a.style, a.id) for page in pages for a in page]
+        assert rows == sorted(rows, reverse=True)
+        assert len(rows) == LIBRARY_ANNOTATIONS_PER_BOOK * LIBRARY_BOOK_COUNT
+
+    def test_nullable_key(self, library):
+        # Only the notes have a ``note``; every other row sorts as NULL.
+        pages = self._walk(Annotation.manager.all(), order_by="note", page_size=5)
+        ids = [a.id for page in pages for a in page]
+        assert sorted(ids) == list(range(1, LIBRARY_ANNOTATIONS_PER_BOOK * LIBRARY_BOOK_COUNT + 1))
+
+    def test_pages_seek_instead_of_offset(self, library, queries):
+        first = Book.manager.paginate(page_size=2)
+        Book.manager.paginate(page_size=2, after=first.next_token)
+        sql, params = queries[-1]
+        assert "OFFSET" not in sql and "Z_PK > ?" in sql
+        assert params == (first.items[-1].id, 3)
+
+    def test_token_is_bound_to_ordering(self, library):
+        page = Annotation.manager.paginate(page_size=2)
+        with pytest.raises(ValueError):
+            Annotation.manager.paginate(order_by="-style", after=page.next_token)
+        with pytest.raises(ValueError):
+            Annotation.manager.paginate(after="not a token")
+
+    def test_values_list_pages(self, library):
+        page = Book.manager.values_list("title", flat=True).paginate(order_by="title", page_size=4)
+        assert page.items == [f"Book {i}" for i in range(1, 5)]
+
+    def test_uses_iterable_ordering(self, library):
+        page = Book.manager.all(order_by="-id").paginate(page_size=2)
+        assert [b.id for b in page] == [LIBRARY_BOOK_COUNT, LIBRARY_BOOK_COUNT - 1]
+        assert Book.manager.all(order_by="-id").paginate(order_by="-id", page_size=2).items == page.items
+        with pytest.raises(ValueError):
+            Book.manager.all(order_by="-id").paginate(order_by="title")
+
+    def test_rejects_windowed_querysets(self, library):
+        with pytest.raises(ValueError):
+            Book.manager.all()[:3].paginate()
+
+    def test_facade_pages(self, library):
+        from py_apple_books import PyAppleBooks
+
+        api = PyAppleBooks()
+        page = api.list_annotations(page_size=10)
+        assert len(page) == 10 and page.has_next
+        rest = api.list_annotations(page_size=100, after=page.next_token)
+        assert not rest.has_next
+        assert len(page) + len(rest) == (LIBRARY_ANNOTATIONS_PER_BOOK - 1) * LIBRARY_BOOK_COUNT
+        ordered = api.list_annotations(order_by="-style", page_size=100)
+        assert {a.id for a in ordered} == {a.id for a in api.list_annotations(order_by="-style")}
+        assert [a.style for a in ordered] == sorted((a.style for a in ordered), reverse=True)
+        dated = api.get_annotations_by_date_range(page_size=3)
+        assert [a.creation_date for a in dated] == sorted(a.creation_date for a in dated)
+
+
+class TestWithResults:
+    def test_serves_given_results_without_querying(self, library, queries):
+        books = Book.manager.in_bulk([2, 1])
+        ranked = Book.manager.filter(id__in=[2, 1]).with_results([books[2], books[1]])
+        assert [b.id for b in ranked] == [2, 1]
+        assert len(ranked) == 2 and ranked[0].id == 2
+        assert len(queries) == 1
+
+
+class TestInBulk:
+    def test_returns_dict_keyed_by_id(self, library, queries):
+        books = Book.manager.in_bulk([3, 1, 99, 3])
+        assert sorted(books) == [1, 3]
+        assert books[3].title == "Book 3"
+        assert len(queries) == 1
+
+    def test_values_rows(self, library):
+        rows = Book.manager.values("id", "title").in_bulk([2, 4])
+        assert rows == {2: {"id": 2, "title": "Book 2"}, 4: {"id": 4, "title": "Book 4"}}
+        tuples = Book.manager.values_list("title", "id").in_bulk([2])
+        assert tuples == {2: ("Book 2", 2)}
+        assert Book.manager.values_list("id", flat=True).in_bulk([3, 99]) == {3: 3}
+        with pytest.raises(TypeError):
+            Book.manager.values("title").in_bulk([2])
+
+    def test_other_unique_field(self, library):
+        books = Book.manager.in_bulk(["ASSET2", "ASSET5"], field="asset_id")
+        assert {key: book.id for key, book in books.items()} == {"ASSET2": 2, "ASSET5": 5}
+
+    def test_chunks_large_id_lists(self, library, queries, monkeypatch):
+        monkeypatch.setattr("py_apple_books.models.manager.MAX_IN_PARAMS", 3)
+        annotations = Annotation.manager.filter(type=1).in_bulk(range(1, 31))
+        assert len(annotations) == 3 * LIBRARY_BOOK_COUNT
+        # One filter parameter leaves room for two ids per query.
+        assert len(queries) == 15
+        assert all(len(params) <= 3 for _, params in queries)
+
+    def test_respects_use_or_filters(self, library):
+        matches = Annotation.manager.filter(type=2, style=1, use_or=True).in_bulk([1, 2, 5])
+        assert sorted(matches) == [2, 5]
+
+    def test_empty(self, library, queries):
+        assert Book.manager.in_bulk([]) == {}
+        assert queries == []
+
+    def test_facade(self, library):
+        from py_apple_books import PyAppleBooks
+
+        api = PyAppleBooks()
+        assert sorted(api.get_books_by_ids([1, 2])) == [1, 2]
+        assert api.get_annotations_by_ids([1])[1].type == 3
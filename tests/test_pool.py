@@ -0,0 +1,98 @@
+"""Tests for py_apple_books.db.pool.
+
+The pool is exercised with throwaway in-memory connections for its
+bookkeeping, and against the miniature library for the real use case:
+several threads reading through one :class:`AppleBooksDBClient`.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from py_apple_books.db.exceptions import DBConnectionError
+from py_apple_books.db.pool import ConnectionPool
+from py_apple_books.models import Annotation, Book
+from tests.conftest import LIBRARY_BOOK_COUNT
+
+
+def _memory_connect():
+    return sqlite3.connect(":memory:", check_same_thread=False)
+
+
+class TestConnectionPool:
+    def test_opens_lazily_and_reuses(self):
+        pool = ConnectionPool(_memory_connect, size=2)
+        assert pool.stats().open == 0
+        with pool.connection() as first:
+            pass
+        with pool.connection() as second:
+            pass
+        assert first is second
+        stats = pool.stats()
+        assert (stats.open, stats.idle, stats.created, stats.checkouts) == (1, 1, 1, 2)
+
+    def test_checkout_is_reentrant_per_thread(self):
+        pool = ConnectionPool(_memory_connect, size=1, timeout=0.1)
+        with pool.connection() as outer:
+            with pool.connection() as inner:
+                assert inner is outer
+        assert pool.stats().in_use == 0
+
+    def test_times_out_when_exhausted(self):
+        pool = ConnectionPool(_memory_connect, size=1, timeout=0.05)
+        held = threading.Event()
+        done = threading.Event()
+
+        def hold():
+            with pool.connection():
+                held.set()
+                done.wait(1)
+
+        worker = threading.Thread(target=hold)
+        worker.start()
+        held.wait(1)
+        try:
+            with pytest.raises(DBConnectionError):
+                pool.acquire()
+        finally:
+            done.set()
+            worker.join()
+        stats = pool.stats()
+        assert stats.timeouts == 1
+        assert stats.waits == 1
+
+    def test_close_discards_connections_returned_later(self):
+        pool = ConnectionPool(_memory_connect, size=2)
+        conn = pool.acquire()
+        pool.close()
+        pool.release(conn)
+        assert pool.stats().open == 0
+        with pytest.raises(sqlite3.ProgrammingError):
+            conn.execute("SELECT 1")
+
+    def test_rejects_empty_pool(self):
+        with pytest.raises(ValueError):
+            ConnectionPool(_memory_connect, size=0)
+
+
+class TestClientConcurrency:
+    def test_parallel_reads_across_threads(self, library):
+        def read(_):
+            return len(list(Book.manager.all()))
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(read, range(32)))
+        assert results == [LIBRARY_BOOK_COUNT] * 32
+        stats = library.stats()
+        assert stats.open <= stats.size
+        assert stats.in_use == 0
+
+    def test_streaming_with_nested_queries_on_single_connection(self, library):
+        library.pool.size = 1
+        books = [a.book.id for a in Annotation.manager.all().iterator(chunk_size=2)]
+        assert len(books) > 0
+        assert library.stats().open == 1
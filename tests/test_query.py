@@ -7,69 +7,189 @@ every ``Annotation.manager.filter(...)`` call, so a bug here cascades
 through the whole API.
 """
 
-from py_apple_books.db.clause import Where
+from py_apple_books.db.clause import And, Not, Or, Seek, Where
 from py_apple_books.db.query import Query
 
 
 class TestWhere:
     def test_equality_default_operator(self):
-        assert str(Where("field", 5)) == "field = 5"
+        w = Where("field", 5)
+        assert str(w) == "field = ?"
+        assert w.params == (5,)
 
-    def test_string_value_is_quoted(self):
-        assert str(Where("name", "foo")) == "name = 'foo'"
+    def test_string_value_is_bound_not_inlined(self):
+        w = Where("name", "it's")
+        assert str(w) == "name = ?"
+        assert w.params == ("it's",)
 
     def test_not_equal_operator(self):
         """Regression: ``__ne`` is the key mechanism used to exclude
         Apple Books' auto-tracked reading-bookmark annotations from
         user-facing queries."""
-        assert str(Where("type", 3, operator="!=")) == "type != 3"
+        w = Where("type", 3, operator="!=")
+        assert str(w) == "type != ?"
+        assert w.params == (3,)
 
     def test_greater_than(self):
-        assert str(Where("progress", 0, operator=">")) == "progress > 0"
+        assert str(Where("progress", 0, operator=">")) == "progress > ?"
 
     def test_in_with_list(self):
-        assert str(Where("id", [1, 2, 3], operator="IN")) == "id IN (1, 2, 3)"
+        w = Where("id", [1, 2, 3], operator="IN")
+        assert str(w) == "id IN (?, ?, ?)"
+        assert w.params == (1, 2, 3)
 
     def test_is_null(self):
         """Regression for pre-v1.7.1: ``IS NULL`` must emit the SQL
-        keyword, not a quoted string literal."""
+        keyword, not a quoted string literal or a bound parameter."""
         assert str(Where("col", "NULL", operator="IS")) == "col IS NULL"
         assert str(Where("col", None, operator="IS")) == "col IS NULL"
         assert str(Where("col", "NULL", operator="IS NOT")) == "col IS NOT NULL"
+        assert Where("col", "NULL", operator="IS").params == ()
+
+    def test_same_shape_renders_same_sql(self):
+        """Filters differing only by value must share a statement string
+        so sqlite3's statement cache can reuse the prepared statement."""
+        assert str(Where("asset_id", "A")) == str(Where("asset_id", "B"))
+
+    def test_like_with_escape(self):
+        clause = Where("FOLD(a)", "%x\\_y%", operator="LIKE", escape="\\")
+        assert str(clause) == "FOLD(a) LIKE ? ESCAPE '\\'"
+        assert clause.params == ("%x\\_y%",)
+
+
+class TestCompositeClauses:
+    def test_or_inside_and(self):
+        clause = And([Or([Where("a", 1), Where("b", 2)]), Where("c", 3, operator="!=")])
+        assert str(clause) == "((a = ? OR b = ?) AND c != ?)"
+        assert clause.params == (1, 2, 3)
+
+    def test_not(self):
+        clause = Not(Or([Where("a", [1, 2], operator="IN"), Where("b", None, operator="IS")]))
+        assert str(clause) == "NOT (a IN (?, ?) OR b IS NULL)"
+        assert clause.params == (1, 2)
+
+    def test_single_child_is_unwrapped(self):
+        assert str(Or([Where("a", 1)])) == "a = ?"
+
+    def test_empty_groups(self):
+        assert str(And([])) == "1"
+        assert str(Or([])) == "0"
+
+    def test_select_binds_params_in_order(self):
+        q, params = Query.select(
+            "t",
+            where=[Or([Where("a", "%x%", operator="LIKE"), Where("b", "%x%", operator="LIKE")]),
+                   Where("c", 3, operator="!=")],
+            limit=5,
+        )
+        assert q == "SELECT * FROM t WHERE (a LIKE ? OR b LIKE ?) AND c != ? LIMIT ?"
+        assert params == ("%x%", "%x%", 3, 5)
 
 
 class TestSelect:
     def test_plain_select(self):
-        q = Query.select("t")
+        q, params = Query.select("t")
         assert q == "SELECT * FROM t"
+        assert params == ()
 
     def test_fields_as_list(self):
-        q = Query.select("t", fields=["a", "b"])
+        q, _ = Query.select("t", fields=["a", "b"])
         assert q == "SELECT a, b FROM t"
 
     def test_where_and_by_default(self):
-        q = Query.select("t", where=[Where("a", 1), Where("b", 2)])
-        assert q == "SELECT * FROM t WHERE a = 1 AND b = 2"
+        q, params = Query.select("t", where=[Where("a", 1), Where("b", 2)])
+        assert q == "SELECT * FROM t WHERE a = ? AND b = ?"
+        assert params == (1, 2)
 
     def test_where_or_when_requested(self):
-        q = Query.select("t", where=[Where("a", 1), Where("b", 2)], use_or=True)
-        assert q == "SELECT * FROM t WHERE a = 1 OR b = 2"
+        q, _ = Query.select("t", where=[Where("a", 1), Where("b", 2)], use_or=True)
+        assert q == "SELECT * FROM t WHERE a = ? OR b = ?"
 
     def test_limit_and_order_by(self):
-        q = Query.select("t", order_by="col DESC", limit=10)
-        assert q == "SELECT * FROM t ORDER BY col DESC LIMIT 10"
+        q, params = Query.select("t", order_by="col DESC", limit=10)
+        assert q == "SELECT * FROM t ORDER BY col DESC LIMIT ?"
+        assert params == (10,)
 
     def test_bookmark_exclusion_renders_correctly(self):
         """The exact shape of the WHERE clause produced for a
         user-annotation facade call like
         ``Annotation.manager.filter(type__ne=3, limit=10)``."""
-        q = Query.select(
+        q, params = Query.select(
             "anno_db.ZAEANNOTATION",
             where=[Where("ZANNOTATIONTYPE", 3, operator="!=")],
             limit=10,
         )
         assert q == (
             "SELECT * FROM anno_db.ZAEANNOTATION "
-            "WHERE ZANNOTATIONTYPE != 3 "
-            "LIMIT 10"
+            "WHERE ZANNOTATIONTYPE != ? "
+            "LIMIT ?"
         )
+        assert params == (3, 10)
+
+    def test_offset_without_limit_uses_unbounded_limit(self):
+        """SQLite rejects a bare OFFSET; slicing ``[n:]`` must still compile."""
+        q, params = Query.select("t", offset=5)
+        assert q == "SELECT * FROM t LIMIT -1 OFFSET ?"
+        assert params == (5,)
+
+    def test_limit_and_offset(self):
+        q, params = Query.select("t", where=[Where("a", 1)], limit=3, offset=2)
+        assert q == "SELECT * FROM t WHERE a = ? LIMIT ? OFFSET ?"
+        assert params == (1, 3, 2)
+
+
+class TestCount:
+    def test_plain_count(self):
+        q, params = Query.count("t", where=[Where("a", 1)])
+        assert q == "SELECT COUNT(*) FROM t WHERE a = ?"
+        assert params == (1,)
+
+    def test_windowed_count_wraps_subquery(self):
+        """A LIMIT/OFFSET window must be applied before counting."""
+        q, params = Query.count("t", limit=10, offset=4)
+        assert q == "SELECT COUNT(*) FROM (SELECT 1 FROM t LIMIT ? OFFSET ?)"
+        assert params == (10, 4)
+
+    def test_grouped_count_counts_groups(self):
+        q, params = Query.count("t", where=[Where("a", 1)], group_by=["b"])
+        assert q == "SELECT COUNT(*) FROM (SELECT 1 FROM t WHERE a = ? GROUP BY b)"
+        assert params == (1,)
+
+
+class TestAggregate:
+    def test_group_by_precedes_order_by(self):
+        q, _ = Query.select("t", fields=["b", "COUNT(*)"], group_by=["b"], order_by="b", limit=2)
+        assert q == "SELECT b, COUNT(*) FROM t GROUP BY b ORDER BY b LIMIT ?"
+
+    def test_plain_aggregate(self):
+        q, params = Query.aggregate("t", ["SUM(a)", "MAX(b)"], where=[Where("c", 1)])
+        assert q == "SELECT SUM(a), MAX(b) FROM t WHERE c = ?"
+        assert params == (1,)
+
+    def test_windowed_aggregate_wraps_subquery(self):
+        q, params = Query.aggregate("t", ["SUM(a)"], limit=3)
+        assert q == "SELECT SUM(a) FROM (SELECT * FROM t LIMIT ?)"
+        assert params == (3,)
+
+    def test_windowed_aggregate_keeps_order(self):
+        q, _ = Query.aggregate("t", ["MAX(a)"], limit=2, order_by="a DESC")
+        assert q == "SELECT MAX(a) FROM (SELECT * FROM t ORDER BY a DESC LIMIT ?)"
+
+
+class TestSeek:
+    def test_ascending(self):
+        clause = Seek("k", "pk", 5.0, 7)
+        assert str(clause) == "(k, pk) > (?, ?)"
+        assert clause.params == (5.0, 7)
+
+    def test_descending_includes_trailing_nulls(self):
+        clause = Seek("k", "pk", 5.0, 7, descending=True)
+        assert str(clause) == "((k, pk) < (?, ?) OR k IS NULL)"
+
+    def test_null_position(self):
+        assert str(Seek("k", "pk", None, 7)) == "((k IS NULL AND pk > ?) OR k IS NOT NULL)"
+        assert str(Seek("k", "pk", None, 7, descending=True)) == "(k IS NULL AND pk < ?)"
+        assert Seek("k", "pk", None, 7).params == (7,)
+
+    def test_ordering_by_pk(self):
+        assert str(Seek("pk", "pk", 7, 7)) == "pk > ?"
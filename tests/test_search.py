@@ -0,0 +1,100 @@
+"""Tests for py_apple_books.search, the sidecar FTS5 annotation index."""
+
+from __future__ import annotations
+
+import sqlite3
+from contextlib import closing
+
+import pytest
+
+from py_apple_books.search import PHRASE, PREFIX, RAW, AnnotationSearchIndex, build_match
+from tests.conftest import LIBRARY_ANNOTATIONS_PER_BOOK, LIBRARY_BOOK_COUNT
+
+# Bookmarks (one per book) have no text and are never indexed.
+INDEXABLE = (LIBRARY_ANNOTATIONS_PER_BOOK - 1) * LIBRARY_BOOK_COUNT
+
+
+def _write(library, sql, params=()):
+    path = next(library.anno_db[1].glob("*.sqlite"))
+    with closing(sqlite3.connect(path)) as conn, conn:
+        conn.execute(sql, params)
+
+
+@pytest.fixture
+def index(library, tmp_path):
+    with AnnotationSearchIndex(tmp_path / "index.sqlite") as index:
+        yield index
+
+
+class TestBuildMatch:
+    def test_words_are_quoted(self):
+        assert build_match('say "hi" now') == '"say" """hi""" "now"'
+
+    def test_modes(self):
+        assert build_match("foo ba", mode=PREFIX) == '"foo" "ba"*'
+        assert build_match("foo  bar", mode=PHRASE) == '"foo bar"'
+        assert build_match("foo OR bar", mode=RAW) == "foo OR bar"
+
+    def test_field_filter(self):
+        assert build_match("x", fields=["note"]) == '{note} : ("x")'
+        with pytest.raises(ValueError):
+            build_match("x", fields=["title"])
+
+    def test_empty(self):
+        with pytest.raises(ValueError):
+            build_match("   ")
+
+
+class TestAnnotationSearchIndex:
+    def test_initial_sync_indexes_text_annotations(self, index):
+        assert index.sync() == LIBRARY_ANNOTATIONS_PER_BOOK * LIBRARY_BOOK_COUNT
+        assert len(index.search_ids("highlight")) == INDEXABLE
+        assert index.sync() == 0
+
+    def test_ranked_search_returns_annotations(self, library, index):
+        _write(library, "UPDATE ZAEANNOTATION SET ZANNOTATIONNOTE = 'zebra zebra zebra', "
+                        "ZANNOTATIONMODIFICATIONDATE = 680000000 WHERE Z_PK = 7")
+        _write(library, "UPDATE ZAEANNOTATION SET ZANNOTATIONSELECTEDTEXT = 'a zebra', "
+                        "ZANNOTATIONMODIFICATIONDATE = 680000001 WHERE Z_PK = 8")
+        results = list(index.search("Zebra"))
+        assert [a.id for a in results] == [7, 8]
+
+    def test_incremental_sync_handles_edits_and_soft_deletes(self, library, index):
+        index.sync()
+        _write(library, "UPDATE ZAEANNOTATION SET ZANNOTATIONSELECTEDTEXT = 'Café society', "
+                        "ZANNOTATIONMODIFICATIONDATE = 680000000 WHERE Z_PK = 2")
+        _write(library, "UPDATE ZAEANNOTATION SET ZANNOTATIONDELETED = 1, "
+                        "ZANNOTATIONMODIFICATIONDATE = 680000001 WHERE Z_PK = 3")
+        # Accent- and case-insensitive, and the search syncs by itself.
+        assert [a.id for a in index.search("cafe")] == [2]
+        assert 3 not in [rowid for rowid, _ in index.search_ids("highlight")]
+
+    def test_hard_deletes_are_dropped(self, library, index):
+        index.sync()
+        _write(library, "DELETE FROM ZAEANNOTATION WHERE Z_PK = 2")
+        assert index.sync() == 1
+        assert 2 not in [rowid for rowid, _ in index.search_ids("highlight")]
+
+    def test_prefix_phrase_and_fields(self, index):
+        assert len(index.search_ids("highl", mode=PREFIX)) == INDEXABLE
+        assert [i for i, _ in index.search_ids("note 5", mode=PHRASE)] == [5]
+        assert index.search_ids("context", fields=["note"]) == []
+
+    def test_limit_and_order_by(self, index):
+        assert len(index.search("highlight", limit=3)) == 3
+        ordered = index.search("highlight", order_by="-id")
+        assert [a.id for a in ordered] == sorted((a.id for a in ordered), reverse=True)
+
+    def test_invalid_raw_query(self, index):
+        with pytest.raises(ValueError):
+            index.search_ids('"unbalanced', mode=RAW)
+
+    def test_facade_uses_index(self, library, tmp_path):
+        from py_apple_books import PyAppleBooks
+
+        api = PyAppleBooks(search_index=tmp_path / "facade.sqlite")
+        try:
+            assert [a.id for a in api.search_annotation_by_note("NOTE 10")] == [10]
+            assert len(api.search_annotation_by_text("context", limit=4)) == 4
+        finally:
+            api.close()
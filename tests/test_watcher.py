@@ -0,0 +1,105 @@
+"""Tests for py_apple_books.watcher.
+
+Writes go to the miniature library's files through a separate
+connection; both the inotify backend (where the platform has it) and
+the polling fallback are exercised.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import sqlite3
+import sys
+import threading
+from contextlib import closing
+
+import pytest
+
+from py_apple_books.watcher import ANNOTATIONS_CHANGED, LIBRARY_CHANGED, LibraryWatcher
+
+BACKENDS = [pytest.param(True, id="inotify", marks=pytest.mark.skipif(
+    not sys.platform.startswith("linux"), reason="inotify is Linux-only")),
+    pytest.param(False, id="poll")]
+
+
+def _touch_annotations(library):
+    path = next(library.anno_db[1].glob("*.sqlite"))
+    with closing(sqlite3.connect(path)) as conn, conn:
+        conn.execute("UPDATE ZAEANNOTATION SET ZANNOTATIONNOTE = 'x' WHERE Z_PK = 1")
+
+
+def _collect(watcher, **options):
+    events, arrived = [], threading.Event()
+
+    def callback(event):
+        events.append(event)
+        arrived.set()
+
+    watcher.subscribe(callback, **options)
+    return events, arrived
+
+
+@pytest.mark.parametrize("use_inotify", BACKENDS)
+class TestLibraryWatcher:
+    def test_write_emits_one_debounced_event(self, library, use_inotify):
+        watcher = LibraryWatcher(library, debounce=0.1, poll_interval=0.05, use_inotify=use_inotify)
+        events, arrived = _collect(watcher)
+        with watcher:
+            assert watcher.backend == ("inotify" if use_inotify else "poll")
+            for _ in range(3):
+                _touch_annotations(library)
+            assert arrived.wait(5)
+            # Let any straggling notifications settle.
+            threading.Event().wait(0.3)
+        assert [event.kind for event in events] == [ANNOTATIONS_CHANGED]
+        assert events[0].directory == library.anno_db[1]
+
+    def test_kind_filter(self, library, use_inotify):
+        watcher = LibraryWatcher(library, debounce=0.05, poll_interval=0.05, use_inotify=use_inotify)
+        events, _ = _collect(watcher, kinds=[LIBRARY_CHANGED])
+        with watcher:
+            _touch_annotations(library)
+            threading.Event().wait(0.4)
+        assert events == []
+
+
+class TestWatcherApi:
+    def test_unsubscribe(self, library):
+        watcher = LibraryWatcher(library, debounce=0.05, poll_interval=0.05, use_inotify=False)
+        events, _ = _collect(watcher)
+        unsubscribe = watcher.subscribe(events.append)
+        unsubscribe()
+        watcher._dispatch({LIBRARY_CHANGED})
+        assert len(events) == 1
+
+    def test_callback_errors_do_not_stop_dispatch(self, library):
+        watcher = LibraryWatcher(library)
+        seen = []
+        watcher.subscribe(lambda event: 1 / 0)
+        watcher.subscribe(seen.append)
+        watcher._dispatch({ANNOTATIONS_CHANGED})
+        assert len(seen) == 1
+
+    def test_async_iteration(self, library):
+        watcher = LibraryWatcher(library, debounce=0.05, poll_interval=0.05)
+
+        async def first_event():
+            events = watcher.events()
+            waiting = asyncio.ensure_future(events.__anext__())
+            await asyncio.sleep(0.1)
+            _touch_annotations(library)
+            try:
+                return await asyncio.wait_for(waiting, 5)
+            finally:
+                await events.aclose()
+
+        with watcher:
+            event = asyncio.run(first_event())
+        assert event.kind == ANNOTATIONS_CHANGED
+
+    def test_stop_is_idempotent(self, library):
+        watcher = LibraryWatcher(library).start()
+        assert watcher.is_running
+        watcher.stop()
+        watcher.stop()
+        assert not watcher.is_running